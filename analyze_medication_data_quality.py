@@ -4,9 +4,64 @@ MEDLESS v1 - Medication Data Quality Analysis
 Analyzes all 343 medications for missing/invalid data in critical fields
 """
 
+import argparse
+import hashlib
 import json
+import os
+import re
 import sys
+import time
 from collections import defaultdict
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # only needed for the columnar engine
+    np = None
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(SCRIPT_DIR, 'scripts'))
+
+from binary_catalog import DEFAULT_OUTPUT_PATH as DEFAULT_CATALOG_PATH, BinaryCatalog
+from local_replica import build_local_replica, replay_files
+import profiling
+
+DEFAULT_EXPORT_PATH = '/home/user/webapp/medications_export.json'
+DEFAULT_CACHE_PATH = os.path.join(SCRIPT_DIR, '.audit_cache.json')
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Determine critical fields per category
+CRITICAL_CATEGORIES = {
+    # Psychopharmaka
+    2: {'name': 'Antidepressiva (trizyklisch)', 'critical': ['withdrawal', 'cyp', 'half_life']},
+    3: {'name': 'Antikonvulsiva', 'critical': ['withdrawal', 'half_life']},
+    5: {'name': 'Antipsychotika', 'critical': ['withdrawal', 'cyp', 'half_life']},
+    15: {'name': 'ADHS-Medikamente', 'critical': ['withdrawal']},
+    16: {'name': 'Hypnotika (Schlafmittel)', 'critical': ['withdrawal', 'half_life']},
+    17: {'name': 'Anxiolytika (Benzodiazepine)', 'critical': ['withdrawal', 'half_life']},
+    18: {'name': 'Opioide', 'critical': ['withdrawal', 'cyp', 'half_life']},
+    25: {'name': 'Antidepressiva (SSRI/SNRI)', 'critical': ['withdrawal', 'cyp', 'half_life']},
+
+    # Cardiovascular
+    6: {'name': 'Statine', 'critical': ['cyp']},
+    19: {'name': 'Antihypertensiva', 'critical': ['half_life']},
+    24: {'name': 'Antikoagulantien', 'critical': ['cyp', 'half_life']},
+
+    # Immunsuppressiva
+    8: {'name': 'Immunsuppressiva', 'critical': ['cyp', 'half_life', 'withdrawal']},
+
+    # Sonstige
+    21: {'name': 'Corticosteroide', 'critical': ['withdrawal', 'half_life']},
+    26: {'name': 'Hormonpräparate', 'critical': ['cyp', 'half_life']}
+}
+
+HIGH_DEPENDENCY_KEYWORDS = ['benzo', 'opioid', 'opiate', 'zepam', 'odon', 'morphin', 'fentanyl']
+
+AUDIT_COLUMNS = [
+    'id', 'name', 'generic_name', 'category_id', 'half_life_hours', 'cyp450_enzyme',
+    'withdrawal_risk_score', 'cbd_interaction_strength',
+    'therapeutic_min_ng_ml', 'therapeutic_max_ng_ml'
+]
 
 def load_medications(filepath):
     """Load medications from wrangler JSON export"""
@@ -14,181 +69,572 @@ def load_medications(filepath):
         data = json.load(f)
     return data[0]['results']
 
+class _JsonStreamReader:
+    """Incremental JSON tokenizer over a text file with a bounded buffer"""
+    
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+    
+    def _fill(self):
+        """Drop consumed input and append the next chunk; False at end of file"""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+    
+    def peek(self):
+        """Return the next non-whitespace character without consuming it"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON export")
+    
+    def expect(self, char):
+        """Consume the next non-whitespace character, which must be char"""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Malformed JSON export: expected '{char}', found '{found}'")
+        self.pos += 1
+        return found
+    
+    def next_char(self):
+        """Consume and return the next non-whitespace character"""
+        found = self.peek()
+        self.pos += 1
+        return found
+    
+    def decode_value(self):
+        """Decode one complete JSON value, reading more input as needed"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number or literal ending exactly at the buffer edge may be truncated
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+def iter_medications(filepath, chunk_size=STREAM_CHUNK_SIZE):
+    """Yield medications one at a time from the first result set of a wrangler JSON export"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        reader = _JsonStreamReader(f, chunk_size)
+        reader.expect('[')
+        reader.expect('{')
+        while True:
+            key = reader.decode_value()
+            reader.expect(':')
+            if key == 'results':
+                break
+            reader.decode_value()
+            if reader.next_char() != ',':
+                raise ValueError("Malformed JSON export: no 'results' array in first result set")
+        
+        reader.expect('[')
+        if reader.peek() == ']':
+            return
+        while True:
+            yield reader.decode_value()
+            separator = reader.next_char()
+            if separator == ']':
+                return
+            if separator != ',':
+                raise ValueError(f"Malformed JSON export: expected ',' or ']', found '{separator}'")
+
+def load_medications_sqlite(conn):
+    """Load medications from a local SQLite replica in export row format"""
+    cursor = conn.execute(f"SELECT {', '.join(AUDIT_COLUMNS)} FROM medications ORDER BY id")
+    return [dict(zip(AUDIT_COLUMNS, row)) for row in cursor]
+
+# Single-pass CYP tokenizer: enzymes (with slash shorthand such as CYP2C8/9),
+# transporters, substrate/inhibitor/inducer roles, non-CYP markers and the
+# segment separators that scope roles to the enzymes they describe.
+CYP_TOKEN_PATTERN = re.compile(r"""
+    (?<![a-z0-9])cyp[\s-]?(?P<enzyme>\d{1,2}[a-z]{1,2}\d{1,3}
+        (?:/(?:cyp)?\d{1,2}(?:[a-z]{1,2}\d{1,3})?)*)(?![a-z0-9])
+  | (?<![a-z0-9])(?P<transporter>p-?gp|p-glycoprotein|bcrp)(?![a-z0-9])
+  | (?<![a-z])(?P<substrate>substrat)
+  | (?<![a-z])(?P<inhibitor>inhibit|hemm)
+  | (?<![a-z])(?P<inducer>induc|indukt|induz)
+  | (?P<non_cyp>(?:kein\ |no\ |minimal\ |non-)(?=cyp)|renal|glukuronidierung|glucuronidation)
+  | (?P<separator>[,;])
+""", re.VERBOSE)
+
+CYP_ROLES = ('substrate', 'inhibitor', 'inducer')
+TRANSPORTER_NAMES = {'pgp': 'P-gp', 'p-gp': 'P-gp', 'p-glycoprotein': 'P-gp', 'bcrp': 'BCRP'}
+
+def _expand_enzyme_token(token):
+    """Expand 'cyp2c8/9' style shorthand into full enzyme names"""
+    enzymes = []
+    for part in token.split('/'):
+        part = part.replace('cyp', '')
+        if part.isdigit() and enzymes:
+            # Shorthand keeps family and subfamily of the previous enzyme
+            prefix = re.match(r'\d{1,2}[a-z]{1,2}', enzymes[-1][3:]).group(0)
+            part = prefix + part
+        enzymes.append('cyp' + part)
+    return enzymes
+
+@lru_cache(maxsize=4096)
+def _tokenize_cyp_text(normalized_text):
+    """Tokenize normalized CYP text once per distinct string"""
+    enzymes = []
+    transporters = []
+    roles = []
+    is_non_cyp = False
+    
+    segment_names = []
+    segment_roles = []
+    
+    def close_segment():
+        for name in segment_names:
+            for role in segment_roles or ['substrate']:
+                if (name, role) not in roles:
+                    roles.append((name, role))
+        segment_names.clear()
+        segment_roles.clear()
+    
+    for match in CYP_TOKEN_PATTERN.finditer(normalized_text):
+        kind = match.lastgroup
+        if kind == 'enzyme':
+            for enzyme in _expand_enzyme_token(match.group('enzyme')):
+                if enzyme not in enzymes:
+                    enzymes.append(enzyme)
+                segment_names.append(enzyme.upper())
+        elif kind == 'transporter':
+            transporter = TRANSPORTER_NAMES[match.group('transporter')]
+            if transporter not in transporters:
+                transporters.append(transporter)
+            segment_names.append(transporter)
+        elif kind in CYP_ROLES:
+            if kind not in segment_roles:
+                segment_roles.append(kind)
+        elif kind == 'non_cyp':
+            is_non_cyp = True
+        else:
+            close_segment()
+    close_segment()
+    
+    return tuple(enzymes), tuple(transporters), tuple(roles), is_non_cyp
+
 def analyze_cyp_enzyme_field(cyp_text):
-    """Parse CYP enzyme text field to detect specific enzymes"""
+    """Parse CYP enzyme text field to detect enzymes, transporters and roles"""
     if not cyp_text:
         return {
             'has_cyp': False,
-            'cypenzymes': [],
+            'cyp_enzymes': [],
+            'transporters': [],
+            'cyp_roles': [],
             'is_non_cyp': False
         }
     
-    cyp_lower = cyp_text.lower()
-    
-    # Check for explicit non-CYP markers
-    non_cyp_markers = ['kein cyp', 'no cyp', 'minimal cyp', 'non-cyp', 'renal', 'glukuronidierung', 'glucuronidation']
-    is_non_cyp = any(marker in cyp_lower for marker in non_cyp_markers)
-    
-    # Extract specific CYP enzymes
-    cyp_types = ['cyp3a4', 'cyp2d6', 'cyp2c9', 'cyp2c19', 'cyp1a2', 'cyp2c8', 'cyp2b6', 'cyp2e1', 'cyp2j2']
-    found_enzymes = [cyp for cyp in cyp_types if cyp in cyp_lower]
+    enzymes, transporters, roles, is_non_cyp = _tokenize_cyp_text(' '.join(cyp_text.lower().split()))
     
+    # cyp_roles uses medication_cyp_profile naming: ('CYP3A4', 'substrate')
     return {
-        'has_cyp': len(found_enzymes) > 0,
-        'cyp_enzymes': found_enzymes,
+        'has_cyp': len(enzymes) > 0,
+        'cyp_enzymes': list(enzymes),
+        'transporters': list(transporters),
+        'cyp_roles': list(roles),
         'is_non_cyp': is_non_cyp
     }
 
+ISSUE_KEYS = [
+    'missing_half_life',
+    'invalid_half_life',  # 0 or >1000h
+    'missing_cyp',
+    'missing_withdrawal',
+    'missing_category',
+    'null_therapeutic_range',
+    'zero_withdrawal_high_dependency'  # Opioids/Benzos with score 0
+]
+
+STAT_KEYS = ['total', 'has_half_life', 'has_cyp_data', 'has_withdrawal_score', 'has_category',
+             'has_therapeutic_range']
+
+def check_medication(med):
+    """Run every check on one medication: {'issues': {key: entry}, 'stats': {key: 0/1}, 'category': id}"""
+    med_id = med['id']
+    name = med['name']
+    generic = med['generic_name']
+    category_id = med['category_id']
+    half_life = med['half_life_hours']
+    cyp_text = med['cyp450_enzyme']
+    withdrawal = med['withdrawal_risk_score']
+    ther_min = med['therapeutic_min_ng_ml']
+    ther_max = med['therapeutic_max_ng_ml']
+    
+    issues = {}
+    stats = dict.fromkeys(STAT_KEYS, 0)
+    stats['total'] = 1
+    
+    # Analyze half_life_hours
+    if half_life is None:
+        issues['missing_half_life'] = {
+            'id': med_id,
+            'name': name,
+            'generic': generic,
+            'category': category_id
+        }
+    elif half_life == 0 or half_life > 1000:
+        issues['invalid_half_life'] = {
+            'id': med_id,
+            'name': name,
+            'generic': generic,
+            'half_life': half_life,
+            'category': category_id
+        }
+    else:
+        stats['has_half_life'] = 1
+    
+    # Analyze CYP data
+    cyp_analysis = analyze_cyp_enzyme_field(cyp_text)
+    if not cyp_analysis['has_cyp'] and not cyp_analysis['is_non_cyp']:
+        issues['missing_cyp'] = {
+            'id': med_id,
+            'name': name,
+            'generic': generic,
+            'cyp_text': cyp_text,
+            'category': category_id
+        }
+    else:
+        stats['has_cyp_data'] = 1
+    
+    # Analyze withdrawal_risk_score
+    if withdrawal is None:
+        issues['missing_withdrawal'] = {
+            'id': med_id,
+            'name': name,
+            'generic': generic,
+            'category': category_id
+        }
+    else:
+        stats['has_withdrawal_score'] = 1
+        
+        # Check for high-dependency meds with zero score (likely error)
+        if withdrawal == 0 and generic:
+            if any(keyword in generic.lower() for keyword in HIGH_DEPENDENCY_KEYWORDS):
+                issues['zero_withdrawal_high_dependency'] = {
+                    'id': med_id,
+                    'name': name,
+                    'generic': generic,
+                    'category': category_id,
+                    'withdrawal_score': withdrawal
+                }
+    
+    # Analyze category_id
+    if category_id is None or category_id == 0:
+        issues['missing_category'] = {
+            'id': med_id,
+            'name': name,
+            'generic': generic
+        }
+    else:
+        stats['has_category'] = 1
+    
+    # Analyze therapeutic range (NULL for all currently)
+    if ther_min is not None or ther_max is not None:
+        stats['has_therapeutic_range'] = 1
+    
+    return {'issues': issues, 'stats': stats, 'category': category_id}
+
+def merge_results(results):
+    """Aggregate per-medication check results into (issues, stats, category_analysis, critical)"""
+    issues = {key: [] for key in ISSUE_KEYS}
+    stats = dict.fromkeys(STAT_KEYS, 0)
+    category_analysis = defaultdict(lambda: {
+        'count': 0,
+        'cyp_critical': False,
+        'withdrawal_critical': False,
+        'half_life_critical': False
+    })
+    
+    for result in results:
+        for key, entry in result['issues'].items():
+            issues[key].append(entry)
+        for key, value in result['stats'].items():
+            stats[key] += value
+        # Category-specific analysis
+        if result['category'] is not None:
+            category_analysis[result['category']]['count'] += 1
+    
+    return issues, stats, category_analysis, CRITICAL_CATEGORIES
+
 def analyze_data_quality(medications):
-    """Analyze data quality for all medications"""
+    """Analyze data quality for all medications (any iterable, consumed once)"""
+    return merge_results(check_medication(med) for med in medications)
+
+@lru_cache(maxsize=None)
+def _checks_version():
+    """Hash of this script: any change to the checks invalidates the row cache"""
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def _row_hash(med):
+    return hashlib.blake2b(repr([med[c] for c in AUDIT_COLUMNS]).encode('utf-8'), digest_size=16).hexdigest()
+
+def analyze_data_quality_incremental(medications, cache_path=DEFAULT_CACHE_PATH):
+    """Like analyze_data_quality, re-checking only rows whose content hash changed
+
+    Returns the analysis tuple and {'cached', 'evaluated', 'removed'} counts.
+    """
+    cached_rows = {}
+    if os.path.exists(cache_path):
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') == _checks_version():
+            cached_rows = cache['rows']
+    
+    rows, results = {}, []
+    counts = {'cached': 0, 'evaluated': 0, 'removed': 0}
+    for med in medications:
+        key = str(med['id'])
+        row_hash = _row_hash(med)
+        cached = cached_rows.get(key)
+        if cached is not None and cached['hash'] == row_hash:
+            result = cached['result']
+            counts['cached'] += 1
+        else:
+            result = check_medication(med)
+            counts['evaluated'] += 1
+        rows[key] = {'hash': row_hash, 'result': result}
+        results.append(result)
+    counts['removed'] = len(cached_rows.keys() - rows.keys())
+    
+    if counts['evaluated'] or counts['removed']:
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': _checks_version(), 'rows': rows}, f)
+        os.replace(tmp_path, cache_path)
+    return merge_results(results), counts
+
+def _file_signature(paths):
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append((path, None, None))
+    return signature
+
+def watch(paths, run, interval=1.0):
+    """Run once, then again whenever one of paths changes (Ctrl+C to stop)"""
+    signature = _file_signature(paths)
+    run()
+    print(f"👀 Watching {len(paths)} file(s) - Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(interval)
+            current = _file_signature(paths)
+            if current != signature:
+                signature = current
+                print()
+                print(f"🔄 Change detected at {time.strftime('%H:%M:%S')}")
+                try:
+                    run()
+                except (ValueError, RuntimeError, OSError) as e:
+                    print(f"❌ Audit failed: {e}")
+    except KeyboardInterrupt:
+        print()
+
+def _cyp_documented(cyp_text):
+    """SQLite function: 1 if the CYP text names an enzyme or a non-CYP pathway"""
+    cyp_analysis = analyze_cyp_enzyme_field(cyp_text)
+    return int(cyp_analysis['has_cyp'] or cyp_analysis['is_non_cyp'])
+
+def _query_issues(conn, fields, where):
+    """Select issue rows as dicts, keyed like the Python analysis output"""
+    sql = f"SELECT {', '.join(fields.values())} FROM medications WHERE {where} ORDER BY id"
+    return [dict(zip(fields.keys(), row)) for row in conn.execute(sql)]
+
+def analyze_data_quality_sql(conn):
+    """Analyze data quality with indexed SQL aggregates on a SQLite replica"""
+    conn.create_function('cyp_documented', 1, _cyp_documented, deterministic=True)
+    
+    base_fields = {'id': 'id', 'name': 'name', 'generic': 'generic_name'}
+    high_dep_filter = ' OR '.join(
+        f"lower(generic_name) LIKE '%{keyword}%'" for keyword in HIGH_DEPENDENCY_KEYWORDS
+    )
     
     issues = {
-        'missing_half_life': [],
-        'invalid_half_life': [],  # 0 or >1000h
-        'missing_cyp': [],
-        'missing_withdrawal': [],
-        'missing_category': [],
+        'missing_half_life': _query_issues(
+            conn, {**base_fields, 'category': 'category_id'},
+            "half_life_hours IS NULL"),
+        'invalid_half_life': _query_issues(
+            conn, {**base_fields, 'half_life': 'half_life_hours', 'category': 'category_id'},
+            "half_life_hours = 0 OR half_life_hours > 1000"),
+        'missing_cyp': _query_issues(
+            conn, {**base_fields, 'cyp_text': 'cyp450_enzyme', 'category': 'category_id'},
+            "NOT cyp_documented(cyp450_enzyme)"),
+        'missing_withdrawal': _query_issues(
+            conn, {**base_fields, 'category': 'category_id'},
+            "withdrawal_risk_score IS NULL"),
+        'missing_category': _query_issues(
+            conn, base_fields,
+            "category_id IS NULL OR category_id = 0"),
         'null_therapeutic_range': [],
-        'zero_withdrawal_high_dependency': []  # Opioids/Benzos with score 0
+        'zero_withdrawal_high_dependency': _query_issues(
+            conn, {**base_fields, 'category': 'category_id', 'withdrawal_score': 'withdrawal_risk_score'},
+            f"withdrawal_risk_score = 0 AND generic_name != '' AND ({high_dep_filter})"),
     }
     
-    stats = {
-        'total': len(medications),
-        'has_half_life': 0,
-        'has_cyp_data': 0,
-        'has_withdrawal_score': 0,
-        'has_category': 0,
-        'has_therapeutic_range': 0
-    }
+    row = conn.execute("""
+        SELECT COUNT(*),
+               TOTAL(half_life_hours IS NOT NULL AND half_life_hours != 0 AND half_life_hours <= 1000),
+               TOTAL(cyp_documented(cyp450_enzyme)),
+               TOTAL(withdrawal_risk_score IS NOT NULL),
+               TOTAL(category_id IS NOT NULL AND category_id != 0),
+               TOTAL(therapeutic_min_ng_ml IS NOT NULL OR therapeutic_max_ng_ml IS NOT NULL)
+        FROM medications
+    """).fetchone()
+    stats = dict(zip(
+        ['total', 'has_half_life', 'has_cyp_data', 'has_withdrawal_score', 'has_category', 'has_therapeutic_range'],
+        (int(value) for value in row)
+    ))
     
     category_analysis = defaultdict(lambda: {
-        'meds': [],
+        'count': 0,
         'cyp_critical': False,
         'withdrawal_critical': False,
         'half_life_critical': False
     })
+    for category_id, count in conn.execute(
+        "SELECT category_id, COUNT(*) FROM medications WHERE category_id IS NOT NULL GROUP BY category_id"
+    ):
+        category_analysis[category_id]['count'] = count
     
+    return issues, stats, category_analysis, CRITICAL_CATEGORIES
+
+def _factorize(values):
+    """Map values to (uniques, codes) so per-value work runs once per distinct value"""
+    index = {}
+    codes = np.fromiter((index.setdefault(value, len(index)) for value in values),
+                        dtype=np.int64, count=len(values))
+    return list(index), codes
+
+def _float_column(values):
+    """Numeric column with NaN for NULL"""
+    return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+
+def analyze_data_quality_columnar(medications):
+    """Analyze data quality with NumPy column masks and a category group-by"""
+    if np is None:
+        raise RuntimeError("The columnar engine requires numpy (pip install numpy)")
+    
+    columns = {column: [] for column in AUDIT_COLUMNS}
     for med in medications:
-        med_id = med['id']
-        name = med['name']
-        generic = med['generic_name']
-        category_id = med['category_id']
-        half_life = med['half_life_hours']
-        cyp_text = med['cyp450_enzyme']
-        withdrawal = med['withdrawal_risk_score']
-        cbd_interaction = med['cbd_interaction_strength']
-        ther_min = med['therapeutic_min_ng_ml']
-        ther_max = med['therapeutic_max_ng_ml']
-        
-        # Analyze half_life_hours
-        if half_life is None:
-            issues['missing_half_life'].append({
-                'id': med_id,
-                'name': name,
-                'generic': generic,
-                'category': category_id
-            })
-        elif half_life == 0 or half_life > 1000:
-            issues['invalid_half_life'].append({
-                'id': med_id,
-                'name': name,
-                'generic': generic,
-                'half_life': half_life,
-                'category': category_id
-            })
-        else:
-            stats['has_half_life'] += 1
-        
-        # Analyze CYP data
-        cyp_analysis = analyze_cyp_enzyme_field(cyp_text)
-        if not cyp_analysis['has_cyp'] and not cyp_analysis['is_non_cyp']:
-            issues['missing_cyp'].append({
-                'id': med_id,
-                'name': name,
-                'generic': generic,
-                'cyp_text': cyp_text,
-                'category': category_id
-            })
-        else:
-            stats['has_cyp_data'] += 1
-        
-        # Analyze withdrawal_risk_score
-        if withdrawal is None:
-            issues['missing_withdrawal'].append({
-                'id': med_id,
-                'name': name,
-                'generic': generic,
-                'category': category_id
-            })
-        else:
-            stats['has_withdrawal_score'] += 1
-            
-            # Check for high-dependency meds with zero score (likely error)
-            if withdrawal == 0 and generic:
-                high_dep_keywords = ['benzo', 'opioid', 'opiate', 'zepam', 'odon', 'morphin', 'fentanyl']
-                if any(keyword in generic.lower() for keyword in high_dep_keywords):
-                    issues['zero_withdrawal_high_dependency'].append({
-                        'id': med_id,
-                        'name': name,
-                        'generic': generic,
-                        'category': category_id,
-                        'withdrawal_score': withdrawal
-                    })
-        
-        # Analyze category_id
-        if category_id is None or category_id == 0:
-            issues['missing_category'].append({
-                'id': med_id,
-                'name': name,
-                'generic': generic
-            })
-        else:
-            stats['has_category'] += 1
-        
-        # Analyze therapeutic range
-        if ther_min is None and ther_max is None:
-            stats['has_therapeutic_range'] += 0  # NULL for all currently
-        else:
-            stats['has_therapeutic_range'] += 1
-        
-        # Category-specific analysis
-        if category_id is not None:
-            category_analysis[category_id]['meds'].append({
-                'id': med_id,
-                'name': name,
-                'generic': generic
-            })
-    
-    # Determine critical fields per category
-    critical_categories = {
-        # Psychopharmaka
-        2: {'name': 'Antidepressiva (trizyklisch)', 'critical': ['withdrawal', 'cyp', 'half_life']},
-        3: {'name': 'Antikonvulsiva', 'critical': ['withdrawal', 'half_life']},
-        5: {'name': 'Antipsychotika', 'critical': ['withdrawal', 'cyp', 'half_life']},
-        15: {'name': 'ADHS-Medikamente', 'critical': ['withdrawal']},
-        16: {'name': 'Hypnotika (Schlafmittel)', 'critical': ['withdrawal', 'half_life']},
-        17: {'name': 'Anxiolytika (Benzodiazepine)', 'critical': ['withdrawal', 'half_life']},
-        18: {'name': 'Opioide', 'critical': ['withdrawal', 'cyp', 'half_life']},
-        25: {'name': 'Antidepressiva (SSRI/SNRI)', 'critical': ['withdrawal', 'cyp', 'half_life']},
-        
-        # Cardiovascular
-        6: {'name': 'Statine', 'critical': ['cyp']},
-        19: {'name': 'Antihypertensiva', 'critical': ['half_life']},
-        24: {'name': 'Antikoagulantien', 'critical': ['cyp', 'half_life']},
-        
-        # Immunsuppressiva
-        8: {'name': 'Immunsuppressiva', 'critical': ['cyp', 'half_life', 'withdrawal']},
-        
-        # Sonstige
-        21: {'name': 'Corticosteroide', 'critical': ['withdrawal', 'half_life']},
-        26: {'name': 'Hormonpräparate', 'critical': ['cyp', 'half_life']}
+        for column, values in columns.items():
+            values.append(med[column])
+    
+    ids = columns['id']
+    names = columns['name']
+    generics = columns['generic_name']
+    categories = columns['category_id']
+    half_lives = columns['half_life_hours']
+    cyp_texts = columns['cyp450_enzyme']
+    withdrawals = columns['withdrawal_risk_score']
+    
+    half_life = _float_column(half_lives)
+    withdrawal = _float_column(withdrawals)
+    category = _float_column(categories)
+    ther_min = _float_column(columns['therapeutic_min_ng_ml'])
+    ther_max = _float_column(columns['therapeutic_max_ng_ml'])
+    
+    # Text checks run once per distinct string, then broadcast by code
+    cyp_uniques, cyp_codes = _factorize(cyp_texts)
+    cyp_documented = np.array([_cyp_documented(text) for text in cyp_uniques], dtype=bool)[cyp_codes]
+    generic_uniques, generic_codes = _factorize(generics)
+    high_dependency = np.array([
+        bool(generic) and any(keyword in generic.lower() for keyword in HIGH_DEPENDENCY_KEYWORDS)
+        for generic in generic_uniques
+    ], dtype=bool)[generic_codes]
+    
+    missing_half_life = np.isnan(half_life)
+    invalid_half_life = (half_life == 0) | (half_life > 1000)
+    missing_withdrawal = np.isnan(withdrawal)
+    zero_withdrawal_high_dependency = (withdrawal == 0) & high_dependency
+    has_category = ~np.isnan(category)
+    missing_category = ~has_category | (category == 0)
+    has_therapeutic_range = ~(np.isnan(ther_min) & np.isnan(ther_max))
+    
+    def rows(mask, **fields):
+        return [
+            {'id': ids[i], 'name': names[i], 'generic': generics[i],
+             **{key: values[i] for key, values in fields.items()}}
+            for i in np.flatnonzero(mask).tolist()
+        ]
+    
+    issues = {
+        'missing_half_life': rows(missing_half_life, category=categories),
+        'invalid_half_life': rows(invalid_half_life, half_life=half_lives, category=categories),
+        'missing_cyp': rows(~cyp_documented, cyp_text=cyp_texts, category=categories),
+        'missing_withdrawal': rows(missing_withdrawal, category=categories),
+        'missing_category': rows(missing_category),
+        'null_therapeutic_range': [],
+        'zero_withdrawal_high_dependency': rows(
+            zero_withdrawal_high_dependency, category=categories, withdrawal_score=withdrawals),
     }
     
-    return issues, stats, category_analysis, critical_categories
+    stats = {
+        'total': len(ids),
+        'has_half_life': int(np.count_nonzero(~missing_half_life & ~invalid_half_life)),
+        'has_cyp_data': int(np.count_nonzero(cyp_documented)),
+        'has_withdrawal_score': int(np.count_nonzero(~missing_withdrawal)),
+        'has_category': int(np.count_nonzero(~missing_category)),
+        'has_therapeutic_range': int(np.count_nonzero(has_therapeutic_range))
+    }
+    
+    category_analysis = defaultdict(lambda: {
+        'count': 0,
+        'cyp_critical': False,
+        'withdrawal_critical': False,
+        'half_life_critical': False
+    })
+    category_ids, counts = np.unique(category[has_category].astype(np.int64), return_counts=True)
+    for category_id, count in zip(category_ids.tolist(), counts.tolist()):
+        category_analysis[category_id]['count'] = count
+    
+    return issues, stats, category_analysis, CRITICAL_CATEGORIES
 
-def generate_report(medications):
+def generate_report(medications, columnar=False):
     """Generate comprehensive data quality report"""
-    issues, stats, category_analysis, critical_categories = analyze_data_quality(medications)
+    with profiling.phase('analyze'):
+        if columnar:
+            analysis = analyze_data_quality_columnar(medications)
+        else:
+            analysis = analyze_data_quality(medications)
+    profiling.count('medications', analysis[1]['total'])
+    with profiling.phase('render'):
+        print_report(*analysis)
+
+def generate_report_sqlite(conn):
+    """Generate the data quality report from a local SQLite replica"""
+    with profiling.phase('analyze'):
+        analysis = analyze_data_quality_sql(conn)
+    profiling.count('medications', analysis[1]['total'])
+    with profiling.phase('render'):
+        print_report(*analysis)
+
+def print_report(issues, stats, category_analysis, critical_categories):
+    """Print the data quality report for precomputed analysis results"""
     
     print("=" * 80)
     print("MEDLESS V1 - MEDICATION DATA QUALITY AUDIT")
@@ -266,9 +712,9 @@ def generate_report(medications):
     print()
     
     for cat_id, cat_info in critical_categories.items():
-        if cat_id in category_analysis and category_analysis[cat_id]['meds']:
+        if cat_id in category_analysis and category_analysis[cat_id]['count']:
             print(f"Category {cat_id}: {cat_info['name']}")
-            print(f"  Total medications: {len(category_analysis[cat_id]['meds'])}")
+            print(f"  Total medications: {category_analysis[cat_id]['count']}")
             print(f"  Critical fields: {', '.join(cat_info['critical'])}")
             print()
     
@@ -307,6 +753,74 @@ def generate_report(medications):
     print(",".join(str(med['id']) for med in issues['missing_cyp']))
     print()
 
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='MEDLESS medication data quality audit')
+    parser.add_argument('export', nargs='?', default=DEFAULT_EXPORT_PATH,
+                        help='wrangler JSON export of the medications table')
+    parser.add_argument('--stream', action='store_true',
+                        help='parse the export incrementally in bounded memory')
+    parser.add_argument('--columnar', action='store_true',
+                        help='run the checks as NumPy column masks (requires numpy)')
+    parser.add_argument('--sqlite', nargs='?', const=':memory:', metavar='DB',
+                        help='audit a local SQLite replica built from migrations/ and the master seed '
+                             '(optionally written to DB)')
+    parser.add_argument('--catalog', nargs='?', const=DEFAULT_CATALOG_PATH, metavar='BIN',
+                        help='audit the memory-mapped catalog compiled by scripts/binary_catalog.py')
+    parser.add_argument('--incremental', nargs='?', const=DEFAULT_CACHE_PATH, metavar='CACHE',
+                        help='cache per-medication results and re-check only changed rows')
+    parser.add_argument('--watch', action='store_true',
+                        help='re-run whenever the export, catalog or seed/migrations change')
+    parser.add_argument('--interval', type=float, default=1.0, help='--watch polling interval in seconds')
+    profiling.add_profile_arguments(parser)
+    args = parser.parse_args()
+    if args.incremental and args.columnar:
+        parser.error('--incremental runs the row checks; drop --columnar')
+    profiling.start('analyze_medication_data_quality', args)
+    
+    def report(medications):
+        if args.incremental:
+            with profiling.phase('analyze'):
+                analysis, counts = analyze_data_quality_incremental(medications, args.incremental)
+            profiling.count('medications', analysis[1]['total'])
+            with profiling.phase('render'):
+                print_report(*analysis)
+            print(f"♻️  Incremental audit: {counts['evaluated']} re-checked, {counts['cached']} cached, "
+                  f"{counts['removed']} removed ({args.incremental})")
+        else:
+            generate_report(medications, columnar=args.columnar)
+    
+    def run():
+        if args.catalog:
+            with BinaryCatalog(args.catalog) as catalog:
+                report(catalog.medications)
+        elif args.sqlite:
+            with profiling.phase('load'):
+                conn = build_local_replica(args.sqlite)
+            if args.incremental:
+                with profiling.phase('load'):
+                    medications = load_medications_sqlite(conn)
+                report(medications)
+            else:
+                generate_report_sqlite(conn)
+            conn.close()
+        elif args.stream:
+            report(iter_medications(args.export))
+        else:
+            with profiling.phase('load'):
+                medications = load_medications(args.export)
+            report(medications)
+    
+    if not args.watch:
+        run()
+        return
+    if args.catalog:
+        watched = [args.catalog]
+    elif args.sqlite:
+        watched = [path for path in replay_files() if path != args.sqlite]
+    else:
+        watched = [args.export]
+    watch(watched, run, args.interval)
+
 if __name__ == '__main__':
-    medications = load_medications('/home/user/webapp/medications_export.json')
-    generate_report(medications)
+    main()
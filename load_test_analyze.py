@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+MEDLESS /api/analyze Load Test
+Replays a weighted mix of analyze payloads at a target concurrency or request
+rate over pooled connections and reports latency percentiles per scenario
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import sys
+import time
+from collections import defaultdict
+
+import aiohttp
+
+BASE = "http://localhost:3000"
+
+def _payload(medications, duration_weeks=12):
+    """Analyze request body in the format used by the scenario scripts"""
+    return {
+        "medications": medications,
+        "reductionGoal": 50, "durationWeeks": duration_weeks,
+        "age": 50, "weight": 75, "gender": "m"
+    }
+
+SCENARIOS = {
+    "marcumar": _payload([{"name": "Marcumar", "mgPerDay": 5}]),
+    "prozac": _payload([{"name": "Prozac", "mgPerDay": 20}]),
+    "lorazepam": _payload([{"name": "Lorazepam", "mgPerDay": 2}]),
+    "marcumar_prozac": _payload([
+        {"name": "Marcumar", "mgPerDay": 5},
+        {"name": "Prozac", "mgPerDay": 20}
+    ]),
+    "polypharmacy": _payload([
+        {"name": "Marcumar", "mgPerDay": 5},
+        {"name": "Prozac", "mgPerDay": 20},
+        {"name": "Lorazepam", "mgPerDay": 2},
+        {"name": "Ibuprofen", "mgPerDay": 400}
+    ]),
+}
+
+DEFAULT_MIX = "marcumar=3,prozac=2,lorazepam=2,marcumar_prozac=2,polypharmacy=1"
+
+def parse_mix(mix):
+    """Parse 'name=weight,...' into (names, weights)"""
+    names, weights = [], []
+    for entry in mix.split(','):
+        name, _, weight = entry.strip().partition('=')
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario '{name}' (available: {', '.join(SCENARIOS)})")
+        names.append(name)
+        weights.append(float(weight or 1))
+    return names, weights
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+class LoadTest:
+    """Weighted scenario replay against /api/analyze with per-scenario metrics"""
+
+    def __init__(self, base, names, weights, timeout, seed):
+        self.url = f"{base}/api/analyze"
+        self.names = names
+        self.weights = weights
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.random = random.Random(seed)
+        self.results = defaultdict(lambda: {'latencies': [], 'errors': 0, 'bytes': 0, 'statuses': defaultdict(int)})
+
+    def pick(self):
+        return self.random.choices(self.names, self.weights)[0]
+
+    async def request(self, session, name, scheduled=None):
+        """Send one request; latency counts from `scheduled` (open loop) or from now"""
+        result = self.results[name]
+        start = time.perf_counter() if scheduled is None else scheduled
+        try:
+            async with session.post(self.url, json=SCENARIOS[name], timeout=self.timeout) as resp:
+                body = await resp.read()
+                result['statuses'][resp.status] += 1
+                result['bytes'] += len(body)
+                if resp.status >= 400:
+                    result['errors'] += 1
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            result['statuses'][type(e).__name__] += 1
+            result['errors'] += 1
+        result['latencies'].append(time.perf_counter() - start)
+
+    async def run_closed_loop(self, session, concurrency, deadline, budget):
+        """Keep `concurrency` requests in flight until deadline or budget"""
+        remaining = [budget]
+
+        async def worker():
+            while time.perf_counter() < deadline and (budget is None or remaining[0] > 0):
+                if budget is not None:
+                    remaining[0] -= 1
+                await self.request(session, self.pick())
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    async def run_open_loop(self, session, rate, concurrency, deadline, budget):
+        """Start requests at a fixed rate, capped at `concurrency` in flight
+
+        Latency is measured from each request's scheduled start, so time spent
+        waiting for a free slot while the server falls behind is included
+        (no coordinated omission).
+        """
+        slots = asyncio.Semaphore(concurrency)
+        tasks = []
+        interval = 1.0 / rate
+        next_start = time.perf_counter()
+
+        async def fire(name, scheduled):
+            async with slots:
+                await self.request(session, name, scheduled)
+
+        while next_start < deadline and (budget is None or len(tasks) < budget):
+            delay = next_start - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.ensure_future(fire(self.pick(), next_start)))
+            next_start += interval
+        await asyncio.gather(*tasks)
+
+    async def run(self, concurrency, rate, duration, budget):
+        connector = aiohttp.TCPConnector(limit=concurrency)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            start = time.perf_counter()
+            deadline = start + duration if duration else float('inf')
+            if rate:
+                await self.run_open_loop(session, rate, concurrency, deadline, budget)
+            else:
+                await self.run_closed_loop(session, concurrency, deadline, budget)
+            return time.perf_counter() - start
+
+def print_report(test, elapsed):
+    """Print per-scenario and total latency, throughput and error rate"""
+    header = f"{'scenario':18s} {'reqs':>6s} {'err%':>6s} {'req/s':>8s} {'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s} {'avg KB':>8s}"
+    print(header)
+    print("-" * len(header))
+
+    total = {'latencies': [], 'errors': 0, 'bytes': 0}
+    rows = [(name, test.results[name]) for name in test.names if name in test.results]
+    for name, result in rows:
+        for key in total:
+            total[key] += result[key]
+    rows.append(('TOTAL', total))
+
+    for name, result in rows:
+        latencies = sorted(result['latencies'])
+        count = len(latencies)
+        if not count:
+            continue
+        print(f"{name:18s} {count:6d} {result['errors'] / count * 100:6.1f} {count / elapsed:8.1f} "
+              f"{percentile(latencies, 50) * 1000:8.1f} {percentile(latencies, 95) * 1000:8.1f} "
+              f"{percentile(latencies, 99) * 1000:8.1f} {result['bytes'] / count / 1024:8.1f}")
+
+    failures = {name: dict(result['statuses']) for name, result in test.results.items() if result['errors']}
+    if failures:
+        print()
+        print("Status breakdown for scenarios with errors:")
+        for name, statuses in failures.items():
+            print(f"  {name}: {statuses}")
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Load test /api/analyze with a weighted scenario mix')
+    parser.add_argument('--base', default=BASE, help=f'server base URL (default: {BASE})')
+    parser.add_argument('--mix', default=DEFAULT_MIX,
+                        help=f'scenario weights, e.g. "{DEFAULT_MIX}" (scenarios: {", ".join(SCENARIOS)})')
+    parser.add_argument('--concurrency', type=int, default=10, help='max requests in flight / pooled connections')
+    parser.add_argument('--rate', type=float, help='target requests per second (open loop); default: closed loop')
+    parser.add_argument('--duration', type=float, default=30, help='test duration in seconds (0: until --requests)')
+    parser.add_argument('--requests', type=int, help='stop after this many requests')
+    parser.add_argument('--timeout', type=float, default=15, help='per-request timeout in seconds')
+    parser.add_argument('--seed', type=int, default=1, help='random seed for the scenario sequence')
+    args = parser.parse_args()
+
+    if not args.duration and not args.requests:
+        parser.error('--duration 0 requires --requests')
+    try:
+        names, weights = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    mode = f"{args.rate:g} req/s (max {args.concurrency} in flight)" if args.rate else f"{args.concurrency} concurrent"
+    limit = ' / '.join(filter(None, [f"{args.duration:g}s" if args.duration else None,
+                                     f"{args.requests} requests" if args.requests else None]))
+    print("=" * 70)
+    print("MEDLESS /api/analyze LOAD TEST")
+    print("=" * 70)
+    print(f"Target: {args.base}  Mode: {mode}  Limit: {limit}")
+    if args.rate:
+        print("Latency: from scheduled start (includes waiting for a free slot)")
+    print()
+
+    test = LoadTest(args.base, names, weights, args.timeout, args.seed)
+    elapsed = asyncio.run(test.run(args.concurrency, args.rate, args.duration, args.requests))
+    print_report(test, elapsed)
+
+    total_errors = sum(result['errors'] for result in test.results.values())
+    sys.exit(1 if total_errors else 0)
+
+if __name__ == '__main__':
+    main()
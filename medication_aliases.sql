@@ -0,0 +1,419 @@
+-- ========================================================
+-- MEDLESS MEDICATION ALIASES (GENERATED)
+-- ========================================================
+-- Generated by scripts/build_medication_aliases.py from the
+-- catalog replica and the medication rows of all seed files
+-- Requires migration 020_create_medication_aliases.sql
+-- Catalog hash: b70adf8c125d7a7ab3ef0c7d79d562ae8cde69f35afea0aec9219cc5e1729567
+-- ========================================================
+
+DELETE FROM medication_aliases;
+
+INSERT INTO medication_aliases (alias, medication_id, source)
+VALUES
+  ('abilify', 29, 'name'),
+  ('acetylsalicylsaeure', 19, 'generic_name'),
+  ('acetylsalicylsaure', 19, 'generic_name'),
+  ('aciclovir', 215, 'name'),
+  ('acitretin', 322, 'name'),
+  ('adalimumab', 295, 'name'),
+  ('agomelatin', 169, 'name'),
+  ('agopton', 40, 'name'),
+  ('alendronat', 269, 'name'),
+  ('allopurinol', 224, 'name'),
+  ('alprazolam', 76, 'generic_name'),
+  ('amiodaron', 247, 'name'),
+  ('amitriptylin', 10, 'generic_name'),
+  ('amlodipin', 37, 'generic_name'),
+  ('amlodipin/valsartan', 225, 'name'),
+  ('amoxicillin', 187, 'name'),
+  ('amoxicillin/clavulansaeure', 188, 'name'),
+  ('amoxicillin/clavulansaure', 188, 'name'),
+  ('anakinra', 314, 'name'),
+  ('anastrozol', 257, 'name'),
+  ('antra', 39, 'name'),
+  ('apixaban', 3, 'generic_name'),
+  ('apomorphin', 339, 'name'),
+  ('aponal', 67, 'name_part'),
+  ('apremilast', 313, 'name'),
+  ('aripiprazol', 29, 'generic_name'),
+  ('aspirin', 19, 'name'),
+  ('atomoxetin', 329, 'name'),
+  ('atorvastatin', 30, 'generic_name'),
+  ('azathioprin', 129, 'name'),
+  ('azithromycin', 193, 'name'),
+  ('baclofen', 325, 'name'),
+  ('baldrian hochdosiert', 71, 'name'),
+  ('bicalutamid', 260, 'name'),
+  ('bilastin', 355, 'name'),
+  ('biperiden', 348, 'name'),
+  ('bisacodyl', 212, 'name'),
+  ('bisoprolol', 101, 'name'),
+  ('bisoprolol/amlodipin', 226, 'name'),
+  ('blopress', 36, 'name'),
+  ('bromazepam', 27, 'generic_name'),
+  ('brotizolam', 62, 'generic_name'),
+  ('brotizolam (lendormin)', 62, 'name'),
+  ('budesonid', 139, 'name'),
+  ('budesonid (enteral)', 139, 'seed_generic_name'),
+  ('budesonid + formoterol', 332, 'generic_name'),
+  ('budesonid/formoterol', 332, 'name'),
+  ('budipin', 346, 'name'),
+  ('bumetanid', 282, 'name'),
+  ('buprenorphin', 177, 'name'),
+  ('bupropion', 51, 'generic_name'),
+  ('buspiron', 174, 'name'),
+  ('cabergolin', 149, 'name'),
+  ('calciumcarbonat', 353, 'name'),
+  ('canagliflozin', 230, 'name'),
+  ('candesartan', 36, 'generic_name'),
+  ('carbamazepin', 81, 'generic_name'),
+  ('carvedilol', 220, 'name'),
+  ('ceftriaxon', 190, 'name'),
+  ('cefuroxim', 189, 'name'),
+  ('celecoxib', 183, 'name'),
+  ('cetirizin', 131, 'name'),
+  ('cholecalciferol', 352, 'name'),
+  ('ciclosporin', 32, 'generic_name'),
+  ('cipralex', 7, 'name'),
+  ('cipramil', 72, 'name'),
+  ('ciprofloxacin', 191, 'name'),
+  ('circadin', 70, 'name_part'),
+  ('citalopram', 72, 'generic_name'),
+  ('clarithromycin', 194, 'name'),
+  ('clindamycin', 196, 'name'),
+  ('clobazam', 16, 'generic_name'),
+  ('clomipramin', 172, 'name'),
+  ('clonazepam', 26, 'generic_name'),
+  ('clonidin', 280, 'name'),
+  ('clopidogrel', 4, 'generic_name'),
+  ('clozapin', 97, 'generic_name'),
+  ('codein', 180, 'name'),
+  ('coumadin', 83, 'name'),
+  ('cymbalta', 9, 'name'),
+  ('dabigatran', 86, 'generic_name'),
+  ('dapagliflozin', 119, 'name'),
+  ('daridorexant', 63, 'generic_name'),
+  ('daridorexant (quviviq)', 63, 'name'),
+  ('dayvigo', 64, 'name_part'),
+  ('denosumab', 271, 'name'),
+  ('depakine', 79, 'name'),
+  ('depakote', 14, 'name'),
+  ('desloratadin', 133, 'name'),
+  ('desmopressin', 273, 'name'),
+  ('desogestrel', 337, 'name'),
+  ('dexamethason', 123, 'name'),
+  ('diazepam', 25, 'generic_name'),
+  ('diazepam (valium)', 55, 'name'),
+  ('diclofenac', 20, 'generic_name'),
+  ('digoxin', 205, 'name'),
+  ('dihydrocodein', 181, 'name'),
+  ('diltiazem', 204, 'name'),
+  ('dimenhydrinat', 209, 'name'),
+  ('dimethylfumarat', 267, 'name'),
+  ('dimetinden', 135, 'name'),
+  ('diovan', 38, 'name'),
+  ('diphenhydramin', 68, 'generic_name'),
+  ('diphenhydramin (vivinox)', 68, 'name'),
+  ('donepezil', 292, 'name'),
+  ('doxazosin', 281, 'name'),
+  ('doxepin', 67, 'generic_name'),
+  ('doxepin (aponal)', 67, 'name'),
+  ('doxycyclin', 195, 'name'),
+  ('doxylamin', 69, 'generic_name'),
+  ('doxylamin (hoggar night)', 69, 'name'),
+  ('drospirenon/ethinylestradiol', 153, 'name'),
+  ('dulaglutid', 316, 'name'),
+  ('duloxetin', 9, 'generic_name'),
+  ('edoxaban', 309, 'name'),
+  ('eliquis', 3, 'name'),
+  ('elontril', 51, 'name'),
+  ('empagliflozin', 229, 'name'),
+  ('enalapril', 99, 'name'),
+  ('entacapon', 343, 'name'),
+  ('eplerenone', 201, 'name'),
+  ('eptinezumab', 333, 'name'),
+  ('escitalopram', 7, 'generic_name'),
+  ('eslicarbazepinacetat', 243, 'name'),
+  ('esomeprazol', 109, 'name'),
+  ('estradiol', 142, 'name'),
+  ('estradiol + dydrogesteron', 143, 'name'),
+  ('eszopiclon', 162, 'name'),
+  ('etanercept', 296, 'name'),
+  ('ethinylestradiol + levonorgestrel', 335, 'generic_name'),
+  ('ethinylestradiol/levonorgestrel', 335, 'name'),
+  ('etoricoxib', 184, 'name'),
+  ('exemestan', 152, 'name'),
+  ('ezetimib', 305, 'name'),
+  ('famciclovir', 363, 'name'),
+  ('famotidin', 216, 'name'),
+  ('febuxostat', 304, 'name'),
+  ('femara', 50, 'name'),
+  ('fentanyl', 90, 'generic_name'),
+  ('fentanyl-pflaster', 90, 'name'),
+  ('fexofenadin', 134, 'name'),
+  ('finasterid', 251, 'name'),
+  ('fingolimod', 266, 'name'),
+  ('fluconazol', 214, 'name'),
+  ('flunitrazepam', 59, 'generic_name'),
+  ('flunitrazepam (rohypnol)', 59, 'name'),
+  ('fluoxetin', 5, 'generic_name'),
+  ('fluticason', 46, 'generic_name'),
+  ('flutide', 46, 'name'),
+  ('formoterol', 137, 'name'),
+  ('fosfomycin', 300, 'name'),
+  ('furosemide', 198, 'name'),
+  ('gabapentin', 168, 'name'),
+  ('glibenclamid', 315, 'name'),
+  ('gliclazid', 283, 'name'),
+  ('glimepirid', 116, 'name'),
+  ('glucophage', 42, 'name'),
+  ('halcion', 60, 'name_part'),
+  ('haldol', 96, 'name'),
+  ('haloperidol', 96, 'generic_name'),
+  ('hoggar night', 69, 'name_part'),
+  ('hydrochlorothiazide', 197, 'name'),
+  ('hydrocortison', 124, 'name'),
+  ('hydromorphon', 89, 'name'),
+  ('hydroxychloroquin', 255, 'name'),
+  ('ibandronat', 368, 'name'),
+  ('ibuprofen', 18, 'name'),
+  ('imatinib', 259, 'name'),
+  ('imodium', 49, 'name'),
+  ('indapamide', 202, 'name'),
+  ('infliximab', 298, 'name'),
+  ('insulin aspart', 118, 'name'),
+  ('insulin degludec', 285, 'name'),
+  ('insulin detemir', 284, 'name'),
+  ('insulin glargin', 117, 'name'),
+  ('insulin lispro', 286, 'name'),
+  ('isosorbidmononitrat', 221, 'name'),
+  ('isotretinoin', 321, 'name'),
+  ('ivabradine', 206, 'name'),
+  ('januvia', 43, 'name'),
+  ('keppra', 12, 'name'),
+  ('ketamin', 186, 'name'),
+  ('kineret', 314, 'generic_name'),
+  ('l-thyroxin', 34, 'name'),
+  ('lamictal', 13, 'name'),
+  ('lamotrigin', 13, 'generic_name'),
+  ('lansoprazol', 40, 'generic_name'),
+  ('latanoprost', 323, 'name'),
+  ('leflunomid', 253, 'name'),
+  ('lemborexant', 64, 'generic_name'),
+  ('lemborexant (dayvigo)', 64, 'name'),
+  ('lendormin', 62, 'name_part'),
+  ('leponex', 97, 'name'),
+  ('letrozol', 50, 'generic_name'),
+  ('levetiracetam', 12, 'generic_name'),
+  ('levocetirizin', 345, 'name'),
+  ('levodopa/carbidopa', 261, 'name'),
+  ('levofloxacin', 192, 'name'),
+  ('levonorgestrel', 145, 'name'),
+  ('levothyroxin', 34, 'generic_name'),
+  ('levothyroxin/liothyronin', 106, 'generic_name'),
+  ('lexotanil', 27, 'name'),
+  ('lidocain', 185, 'name'),
+  ('linagliptin', 228, 'name'),
+  ('liothyronin', 105, 'name'),
+  ('liraglutid', 120, 'name'),
+  ('lisinopril', 35, 'generic_name'),
+  ('lithium', 327, 'name'),
+  ('loperamid', 49, 'generic_name'),
+  ('loratadin', 132, 'name'),
+  ('lorazepam', 24, 'generic_name'),
+  ('lorazepam (tavor)', 56, 'name'),
+  ('lormetazepam', 61, 'generic_name'),
+  ('lormetazepam (noctamid)', 61, 'name'),
+  ('losartan', 217, 'name'),
+  ('lyrica', 17, 'name'),
+  ('macrogol', 211, 'name'),
+  ('marcumar', 1, 'name'),
+  ('medikinet', 47, 'name'),
+  ('medroxyprogesteronacetat', 155, 'name'),
+  ('melatonin', 70, 'generic_name'),
+  ('melatonin (circadin)', 70, 'name'),
+  ('memantin', 294, 'name'),
+  ('mesalazin', 297, 'name'),
+  ('metamizol', 23, 'generic_name'),
+  ('metformin', 42, 'generic_name'),
+  ('methotrexat', 252, 'name'),
+  ('methylphenidat', 47, 'generic_name'),
+  ('methylprednisolon', 125, 'name'),
+  ('metoclopramid', 207, 'name'),
+  ('metoprolol', 102, 'name'),
+  ('metronidazol', 301, 'name'),
+  ('mianserin', 173, 'name'),
+  ('mirabegron', 276, 'name'),
+  ('mirtazapin', 65, 'generic_name'),
+  ('mirtazapin (remergil)', 65, 'name'),
+  ('mogadan', 58, 'name_part'),
+  ('montelukast', 45, 'generic_name'),
+  ('morphin', 87, 'name'),
+  ('mycophenolat', 128, 'name'),
+  ('mycophenolat-mofetil', 128, 'seed_name'),
+  ('naloxon', 244, 'name'),
+  ('naltrexon', 245, 'name'),
+  ('naproxen', 157, 'name'),
+  ('natalizumab', 265, 'name'),
+  ('nebivolol', 219, 'name'),
+  ('nitrazepam', 58, 'generic_name'),
+  ('nitrazepam (mogadan)', 58, 'name'),
+  ('nitrofurantoin', 299, 'name'),
+  ('noctamid', 61, 'name_part');
+
+INSERT INTO medication_aliases (alias, medication_id, source)
+VALUES
+  ('norethisteron', 146, 'name'),
+  ('nortriptylin', 171, 'name'),
+  ('norvasc', 37, 'name'),
+  ('novalgin', 23, 'name'),
+  ('novothyral', 106, 'name'),
+  ('olanzapin', 28, 'generic_name'),
+  ('omeprazol', 39, 'generic_name'),
+  ('ondansetron', 208, 'name'),
+  ('onfi', 16, 'name'),
+  ('ophthalmisch', 324, 'name_part'),
+  ('oseltamivir', 330, 'name'),
+  ('otezla', 313, 'generic_name'),
+  ('oxcarbazepin', 15, 'generic_name'),
+  ('oxybutynin', 303, 'name'),
+  ('oxycodon', 22, 'generic_name'),
+  ('oxycontin', 22, 'name'),
+  ('pantoprazol', 41, 'generic_name'),
+  ('pantozol', 41, 'name'),
+  ('paracetamol', 154, 'name'),
+  ('paroxetin', 73, 'generic_name'),
+  ('pethidin', 182, 'name'),
+  ('pioglitazon', 231, 'name'),
+  ('piribedil', 340, 'name'),
+  ('plavix', 4, 'name'),
+  ('posaconazol', 359, 'name'),
+  ('pradaxa', 86, 'name'),
+  ('pramipexol', 262, 'name'),
+  ('prasugrel', 310, 'name'),
+  ('pravastatin', 114, 'name'),
+  ('prednisolon', 121, 'name'),
+  ('prednison', 122, 'name'),
+  ('pregabalin', 17, 'generic_name'),
+  ('progesteron', 144, 'name'),
+  ('prograf', 33, 'name'),
+  ('propafenon', 249, 'name'),
+  ('propranolol', 176, 'name'),
+  ('prozac', 5, 'name'),
+  ('quetiapin', 94, 'generic_name'),
+  ('quviviq', 63, 'name_part'),
+  ('raloxifen', 151, 'name'),
+  ('ramipril', 98, 'name'),
+  ('ranitidin', 48, 'generic_name'),
+  ('ranolazin', 223, 'name'),
+  ('rasagilin', 264, 'name'),
+  ('remergil', 65, 'name_part'),
+  ('remestan', 57, 'name_part'),
+  ('rinvoq', 312, 'generic_name'),
+  ('risedronat', 270, 'name'),
+  ('risperdal', 92, 'name'),
+  ('risperidon', 92, 'generic_name'),
+  ('rivaroxaban', 2, 'generic_name'),
+  ('rivastigmin', 293, 'name'),
+  ('rivotril', 26, 'name'),
+  ('rohypnol', 59, 'name_part'),
+  ('ropinirol', 263, 'name'),
+  ('rosuvastatin', 113, 'name'),
+  ('rotigotin', 338, 'name'),
+  ('rupatadin', 354, 'name'),
+  ('safinamid', 342, 'name'),
+  ('salbutamol', 44, 'generic_name'),
+  ('salmeterol', 138, 'name'),
+  ('sandimmun', 32, 'name'),
+  ('saroten', 10, 'name'),
+  ('semaglutid', 317, 'name'),
+  ('seroquel', 94, 'name'),
+  ('seroxat', 73, 'name'),
+  ('sertralin', 6, 'generic_name'),
+  ('sildenafil', 274, 'name'),
+  ('simvastatin', 31, 'generic_name'),
+  ('singulair', 45, 'name'),
+  ('sirolimus', 130, 'name'),
+  ('sitagliptin', 43, 'generic_name'),
+  ('solifenacin', 302, 'name'),
+  ('sonata', 54, 'name_part'),
+  ('sortis', 30, 'name'),
+  ('sotalol', 248, 'name'),
+  ('spironolactone', 200, 'name'),
+  ('stangyl', 11, 'name'),
+  ('stilnox', 53, 'name_part'),
+  ('sulfasalazin', 254, 'name'),
+  ('sumatriptan', 213, 'name'),
+  ('tacrolimus', 33, 'generic_name'),
+  ('tadalafil', 275, 'name'),
+  ('tamoxifen', 256, 'name'),
+  ('tamsulosin', 250, 'name'),
+  ('tapentadol', 178, 'name'),
+  ('tavor', 24, 'name'),
+  ('tegretol', 81, 'name'),
+  ('temazepam', 57, 'generic_name'),
+  ('temazepam (remestan)', 57, 'name'),
+  ('terbinafin', 358, 'name'),
+  ('teriflunomid', 268, 'name'),
+  ('testosteron', 147, 'name'),
+  ('thiamazol', 272, 'name'),
+  ('tibolon', 150, 'name'),
+  ('ticagrelor', 311, 'name'),
+  ('tilidin/naloxon', 179, 'name'),
+  ('timolol', 324, 'generic_name'),
+  ('timolol (ophthalmisch)', 324, 'name'),
+  ('tiotropium', 141, 'name'),
+  ('tizanidin', 326, 'name'),
+  ('tofacitinib', 320, 'name'),
+  ('tolcapon', 344, 'name'),
+  ('topiramat', 287, 'name'),
+  ('torasemide', 199, 'name'),
+  ('tramadol', 21, 'generic_name'),
+  ('tramal', 21, 'name'),
+  ('trazodon', 66, 'generic_name'),
+  ('trazodon (trittico)', 66, 'name'),
+  ('trevilor', 8, 'name'),
+  ('triazolam', 60, 'generic_name'),
+  ('triazolam (halcion)', 60, 'name'),
+  ('trihexyphenidyl', 347, 'name'),
+  ('trileptal', 15, 'name'),
+  ('trimipramin', 11, 'generic_name'),
+  ('trittico', 66, 'name_part'),
+  ('upadacitinib', 312, 'name'),
+  ('urapidil', 279, 'name'),
+  ('ustekinumab', 318, 'name'),
+  ('valaciclovir', 362, 'name'),
+  ('valeriana officinalis', 71, 'generic_name'),
+  ('valganciclovir', 331, 'name'),
+  ('valium', 25, 'name'),
+  ('valproat', 14, 'generic_name'),
+  ('valproinsaeure', 239, 'name'),
+  ('valproinsaure', 239, 'name'),
+  ('valsartan', 38, 'generic_name'),
+  ('vareniclin', 306, 'name'),
+  ('vedolizumab', 319, 'name'),
+  ('venlafaxin', 8, 'generic_name'),
+  ('ventolin', 44, 'name'),
+  ('verapamil', 203, 'name'),
+  ('vivinox', 68, 'name_part'),
+  ('voltaren', 20, 'name'),
+  ('vortioxetin', 170, 'name'),
+  ('vyepti', 333, 'generic_name'),
+  ('warfarin', 1, 'generic_name'),
+  ('xanax', 76, 'name'),
+  ('xarelto', 2, 'name'),
+  ('yasmin', 153, 'generic_name'),
+  ('zaleplon', 54, 'generic_name'),
+  ('zaleplon (sonata)', 54, 'name'),
+  ('zanamivir', 365, 'name'),
+  ('zantac', 48, 'name'),
+  ('zestril', 35, 'name'),
+  ('zocor', 31, 'name'),
+  ('zolendronat', 369, 'name'),
+  ('zoloft', 6, 'name'),
+  ('zolpidem', 53, 'generic_name'),
+  ('zolpidem (stilnox)', 53, 'name'),
+  ('zopiclon', 52, 'name'),
+  ('zyprexa', 28, 'name');
+
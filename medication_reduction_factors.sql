@@ -0,0 +1,360 @@
+-- ========================================================
+-- MEDLESS REDUCTION FACTORS (GENERATED)
+-- ========================================================
+-- Generated by scripts/build_reduction_factors.py from
+-- 008_master_medless_full_seed_343.sql + migrations/
+-- Requires migration 019_create_medication_reduction_factors.sql
+-- Catalog hash: bdaa7b90463c658948116a7ef373dc1c3773ef44d3c26bc7d028f339f7fe7225
+-- ========================================================
+
+DELETE FROM medication_reduction_factors;
+
+INSERT INTO medication_reduction_factors (medication_id, half_life_factor, cyp_factor, therapeutic_window_factor, withdrawal_factor, catalog_key)
+VALUES
+  (1, 0.5, 0.7, 1.0, 0.75, '40|||10|10'),
+  (2, 1.0, 0.7, 1.0, 0.75, '9|||10|10'),
+  (3, 1.0, 0.7, 1.0, 0.75, '12|||10|10'),
+  (4, 1.0, 0.7, 1.0, 0.775, '8|||9|10'),
+  (5, 0.5, 0.7, 1.0, 0.8, '96|||8|10'),
+  (6, 0.75, 0.7, 1.0, 0.8, '26|||8|10'),
+  (7, 0.75, 0.7, 1.0, 0.8, '30|||8|10'),
+  (8, 1.0, 0.7, 1.0, 0.8, '11|||8|10'),
+  (9, 1.0, 0.7, 1.0, 0.8, '12|||8|10'),
+  (10, 0.75, 0.7, 1.0, 0.8, '20|||8|10'),
+  (11, 0.75, 1.0, 1.0, 0.8, '24|||8|00'),
+  (12, 1.0, 1.0, 1.0, 0.825, '7|||7|00'),
+  (13, 0.75, 1.0, 1.0, 0.8, '29|||8|00'),
+  (14, 0.75, 1.0, 1.0, 0.775, '16|||9|00'),
+  (15, 1.0, 1.0, 1.0, 0.825, '9|||7|00'),
+  (16, 0.5, 1.0, 1.0, 0.775, '36|||9|00'),
+  (17, 1.0, 1.0, 1.0, 0.825, '6|||7|00'),
+  (18, 1.0, 1.0, 1.0, 0.925, '2|||3|00'),
+  (19, 1.0, 1.0, 1.0, 0.875, '0.3|||5|00'),
+  (20, 1.0, 1.0, 1.0, 0.875, '2|||5|00'),
+  (21, 1.0, 1.0, 1.0, 0.8, '6|||8|00'),
+  (22, 1.0, 1.0, 1.0, 0.775, '4|||9|00'),
+  (23, 1.0, 1.0, 1.0, 0.9, '3|||4|00'),
+  (24, 1.0, 1.15, 1.0, 0.775, '12|||9|01'),
+  (25, 0.5, 0.7, 1.0, 0.775, '48|||9|10'),
+  (26, 0.75, 1.0, 1.0, 0.775, '30|||9|00'),
+  (27, 0.75, 1.0, 1.0, 0.775, '20|||9|00'),
+  (28, 0.75, 1.15, 1.0, 0.8, '33|||8|01'),
+  (29, 0.5, 0.7, 1.0, 0.825, '75|||7|10'),
+  (30, 1.0, 1.0, 1.0, 0.875, '14|||5|00'),
+  (31, 1.0, 1.0, 1.0, 0.875, '2|||5|00'),
+  (32, 1.0, 1.0, 1.0, 0.775, '8|||9|00'),
+  (33, 1.0, 1.0, 1.0, 0.775, '12|||9|00'),
+  (34, 0.5, 1.0, 1.0, 0.8, '168|||8|00'),
+  (35, 1.0, 1.0, 1.0, 0.825, '12|||7|00'),
+  (36, 1.0, 1.0, 1.0, 0.825, '9|||7|00'),
+  (37, 0.5, 1.0, 1.0, 0.825, '35|||7|00'),
+  (38, 1.0, 1.0, 1.0, 0.825, '9|||7|00'),
+  (39, 1.0, 1.0, 1.0, 0.85, '1|||6|00'),
+  (40, 1.0, 1.0, 1.0, 0.85, '1.5|||6|00'),
+  (41, 1.0, 1.0, 1.0, 0.85, '1|||6|00'),
+  (42, 1.0, 1.0, 1.0, 0.875, '6|||5|00'),
+  (43, 1.0, 1.0, 1.0, 0.875, '12|||5|00'),
+  (44, 1.0, 1.0, 1.0, 0.9, '5|||4|00'),
+  (45, 1.0, 1.0, 1.0, 0.9, '5|||4|00'),
+  (46, 1.0, 1.0, 1.0, 0.875, '8|||5|00'),
+  (47, 1.0, 1.0, 1.0, 0.875, '3|||5|00'),
+  (48, 1.0, 1.0, 1.0, 0.875, '3|||5|00'),
+  (49, 1.0, 1.0, 1.0, 0.925, '11|||3|00'),
+  (50, 0.5, 1.0, 1.0, 0.85, '48|||6|00'),
+  (51, 0.75, 1.0, 1.0, 0.825, '20|||7|00'),
+  (52, 1.0, 1.0, 1.0, 0.8, '5|||8|00'),
+  (53, 1.0, 1.0, 1.0, 0.8, '2.5|||8|00'),
+  (54, 1.0, 1.0, 1.0, 0.85, '1|||6|00'),
+  (55, 0.5, 1.0, 1.0, 0.775, '48|||9|00'),
+  (56, 1.0, 1.0, 1.0, 0.775, '14|||9|00'),
+  (57, 1.0, 1.0, 1.0, 0.8, '10|||8|00'),
+  (58, 0.75, 1.0, 1.0, 0.775, '28|||9|00'),
+  (59, 0.75, 1.0, 1.0, 0.75, '18|||10|00'),
+  (60, 1.0, 1.0, 1.0, 0.8, '2.5|||8|00'),
+  (61, 1.0, 1.0, 1.0, 0.8, '10|||8|00'),
+  (62, 1.0, 1.0, 1.0, 0.8, '5|||8|00'),
+  (63, 1.0, 1.0, 1.0, 0.9, '8|||4|00'),
+  (64, 0.5, 1.0, 1.0, 0.9, '50|||4|00'),
+  (65, 0.75, 1.0, 1.0, 0.825, '30|||7|00'),
+  (66, 1.0, 1.0, 1.0, 0.825, '7|||7|00'),
+  (67, 0.75, 1.0, 1.0, 0.8, '17|||8|00'),
+  (68, 1.0, 1.0, 1.0, 0.925, '9|||3|00'),
+  (69, 1.0, 1.0, 1.0, 0.925, '10|||3|00'),
+  (70, 1.0, 1.0, 1.0, 0.975, '0.5|||1|00'),
+  (71, 1.0, 1.0, 1.0, 0.975, '1|||1|00'),
+  (72, 0.5, 1.0, 1.0, 0.825, '35|||7|00'),
+  (73, 0.75, 1.0, 1.0, 0.8, '21|||8|00'),
+  (76, 1.0, 1.0, 1.0, 0.775, '11|||9|00'),
+  (79, 1.0, 1.0, 1.0, 0.8, '12|||8|00'),
+  (81, 0.75, 1.0, 1.0, 0.8, '16|||8|00'),
+  (83, 0.5, 1.0, 1.0, 0.775, '40|||9|00'),
+  (86, 1.0, 1.0, 1.0, 0.8, '13|||8|00'),
+  (87, 1.0, 1.0, 1.0, 0.775, '3|||9|00'),
+  (88, 1.0, 1.0, 1.0, 0.775, '4|||9|00'),
+  (89, 1.0, 1.0, 1.0, 0.775, '3|||9|00'),
+  (90, 0.75, 1.0, 1.0, 0.75, '17|||10|00'),
+  (91, 1.0, 1.0, 1.0, 0.825, '6|||7|00'),
+  (92, 0.75, 1.0, 1.0, 0.825, '20|||7|00'),
+  (94, 1.0, 1.0, 1.0, 0.825, '7|||7|00'),
+  (96, 0.75, 1.0, 1.0, 0.8, '24|||8|00'),
+  (97, 1.0, 1.0, 1.0, 0.75, '14|||10|00'),
+  (98, 1.0, 1.0, 1.0, 0.875, '13|||5|00'),
+  (99, 1.0, 1.0, 1.0, 0.825, '11|||7|00'),
+  (100, 0.5, 1.0, 1.0, 0.9, '40|||4|00'),
+  (101, 1.0, 1.0, 1.0, 0.85, '11|||6|00'),
+  (102, 1.0, 1.0, 1.0, 0.825, '4|||7|00'),
+  (103, 1.0, 1.0, 1.0, 0.9, '7|||4|00'),
+  (104, 0.5, 1.0, 1.0, 0.75, '168|||10|00'),
+  (105, 0.75, 1.0, 1.0, 0.8, '24|||8|00'),
+  (106, 0.5, 1.0, 1.0, 0.8, '72|||8|00'),
+  (107, 1.0, 1.0, 1.0, 0.875, '1|||5|00'),
+  (108, 1.0, 1.0, 1.0, 0.875, '1|||5|00'),
+  (109, 1.0, 1.0, 1.0, 0.875, '1.5|||5|00'),
+  (110, 1.0, 1.0, 1.0, 0.875, '1.5|||5|00'),
+  (111, 1.0, 1.0, 1.0, 0.85, '14|||6|00'),
+  (112, 1.0, 1.0, 1.0, 0.85, '3|||6|00'),
+  (113, 0.75, 1.0, 1.0, 0.875, '19|||5|00'),
+  (114, 1.0, 1.0, 1.0, 0.875, '2|||5|00'),
+  (115, 1.0, 1.0, 1.0, 0.925, '6|||3|00'),
+  (116, 1.0, 1.0, 1.0, 0.85, '5|||6|00'),
+  (117, 1.0, 1.0, 1.0, 0.8, '12|||8|00'),
+  (118, 1.0, 1.0, 1.0, 0.825, '1|||7|00'),
+  (119, 1.0, 1.0, 1.0, 0.875, '12|||5|00'),
+  (120, 1.0, 1.0, 1.0, 0.95, '13|||2|00'),
+  (121, 1.0, 1.0, 1.0, 0.775, '3|||9|00'),
+  (122, 1.0, 1.0, 1.0, 0.775, '3|||9|00'),
+  (123, 0.5, 1.0, 1.0, 0.75, '36|||10|00'),
+  (124, 1.0, 1.0, 1.0, 0.75, '1.5|||10|00'),
+  (125, 1.0, 1.0, 1.0, 0.8, '3|||8|00'),
+  (126, 1.0, 1.0, 1.0, 0.75, '8|||10|00'),
+  (127, 1.0, 1.0, 1.0, 0.75, '12|||10|00'),
+  (128, 0.75, 1.0, 1.0, 0.775, '16|||9|00'),
+  (129, 1.0, 1.0, 1.0, 0.8, '5|||8|00'),
+  (130, 0.5, 1.0, 1.0, 0.75, '60|||10|00'),
+  (131, 1.0, 1.0, 1.0, 0.9, '8|||4|00'),
+  (132, 1.0, 1.0, 1.0, 0.9, '8|||4|00'),
+  (133, 0.75, 1.0, 1.0, 0.9, '27|||4|00'),
+  (134, 1.0, 1.0, 1.0, 0.925, '14|||3|00'),
+  (135, 1.0, 1.0, 1.0, 0.925, '6|||3|00'),
+  (136, 1.0, 1.0, 1.0, 0.9, '4|||4|00'),
+  (137, 1.0, 1.0, 1.0, 0.825, '10|||7|00'),
+  (138, 1.0, 1.0, 1.0, 0.825, '5.5|||7|00'),
+  (139, 1.0, 1.0, 1.0, 0.825, '3|||7|00'),
+  (140, 1.0, 1.0, 1.0, 0.8, '7|||8|00'),
+  (141, 0.75, 1.0, 1.0, 0.85, '25|||6|00'),
+  (142, 1.0, 1.0, 1.0, 0.875, '14|||5|00'),
+  (143, 0.75, 1.0, 1.0, 0.85, '17|||6|00'),
+  (144, 0.75, 1.0, 1.0, 0.9, '16|||4|00'),
+  (145, 0.75, 1.0, 1.0, 0.9, '24|||4|00'),
+  (146, 1.0, 1.0, 1.0, 0.9, '8|||4|00'),
+  (147, 0.75, 1.0, 1.0, 0.85, '24|||6|00'),
+  (149, 0.5, 1.0, 1.0, 0.875, '65|||5|00'),
+  (150, 0.5, 1.0, 1.0, 0.85, '45|||6|00'),
+  (151, 0.75, 1.0, 1.0, 0.875, '28|||5|00'),
+  (152, 0.75, 1.0, 1.0, 0.9, '24|||4|00'),
+  (153, 0.75, 1.0, 1.0, 0.875, '30|||5|00'),
+  (154, 1.0, 1.0, 1.0, 0.95, '2.5|||2|00'),
+  (155, 0.75, 1.0, 1.0, 0.875, '30|||5|00'),
+  (156, 1.0, 1.0, 1.0, 0.875, '2|||5|00'),
+  (157, 1.0, 1.0, 1.0, 0.875, '12|||5|00'),
+  (158, 1.0, 1.0, 1.0, 0.875, '2|||5|00'),
+  (159, 1.0, 1.0, 1.0, 0.85, '0.25|||6|00'),
+  (160, 1.0, 1.0, 1.0, 0.8, '2.5|||8|00'),
+  (162, 1.0, 1.0, 1.0, 0.8, '6|||8|00'),
+  (163, 1.0, 1.0, 1.0, 0.9, '10|||4|00'),
+  (164, 1.0, 1.0, 1.0, 0.9, '9|||4|00'),
+  (165, 1.0, 1.0, 1.0, 0.85, '6|||6|00'),
+  (166, 1.0, 1.0, 1.0, 0.825, '12|||7|00'),
+  (167, 1.0, 1.0, 1.0, 0.825, '6|||7|00'),
+  (168, 1.0, 1.0, 1.0, 0.825, '6|||7|00'),
+  (169, 1.0, 1.0, 1.0, 0.9, '2|||4|00'),
+  (170, 0.5, 1.0, 1.0, 0.9, '66|||4|00'),
+  (171, 0.5, 1.0, 1.0, 0.8, '36|||8|00'),
+  (172, 0.75, 1.0, 1.0, 0.8, '32|||8|00'),
+  (173, 0.75, 1.0, 1.0, 0.85, '30|||6|00'),
+  (174, 1.0, 1.0, 1.0, 0.9, '3|||4|00'),
+  (175, 1.0, 1.0, 1.0, 0.95, '1|||2|00'),
+  (176, 1.0, 1.0, 1.0, 0.825, '4|||7|00'),
+  (177, 0.5, 1.0, 1.0, 0.775, '37|||9|00'),
+  (178, 1.0, 1.0, 1.0, 0.8, '4|||8|00'),
+  (179, 1.0, 1.0, 1.0, 0.825, '4|||7|00'),
+  (180, 1.0, 1.0, 1.0, 0.825, '3|||7|00'),
+  (181, 1.0, 1.0, 1.0, 0.825, '4|||7|00'),
+  (182, 1.0, 1.0, 1.0, 0.8, '3|||8|00'),
+  (183, 1.0, 1.0, 1.0, 0.9, '11|||4|00'),
+  (184, 0.75, 1.0, 1.0, 0.9, '22|||4|00'),
+  (185, 1.0, 1.0, 1.0, 0.925, '1.5|||3|00'),
+  (186, 1.0, 1.0, 1.0, 0.825, '3|||7|00'),
+  (187, 1.0, 1.0, 1.0, 0.875, '1|||5|00'),
+  (188, 1.0, 1.0, 1.0, 0.85, '1|||6|00'),
+  (189, 1.0, 1.0, 1.0, 0.875, '1.5|||5|00'),
+  (190, 1.0, 1.0, 1.0, 0.85, '8|||6|00'),
+  (191, 1.0, 1.0, 1.0, 0.85, '4|||6|00'),
+  (192, 1.0, 1.0, 1.0, 0.85, '7|||6|00'),
+  (193, 0.5, 1.0, 1.0, 0.825, '68|||7|00'),
+  (194, 1.0, 1.0, 1.0, 0.825, '5|||7|00'),
+  (195, 0.75, 1.0, 1.0, 0.875, '18|||5|00'),
+  (196, 1.0, 1.0, 1.0, 0.825, '2.5|||7|00'),
+  (197, 1.0, 1.0, 1.0, 0.85, '8|||6|00'),
+  (198, 1.0, 1.0, 1.0, 0.8, '1.5|||8|00'),
+  (199, 1.0, 1.0, 1.0, 0.8, '3.5|||8|00'),
+  (200, 1.0, 1.0, 1.0, 0.825, '14|||7|00'),
+  (201, 1.0, 1.0, 1.0, 0.825, '4.5|||7|00'),
+  (202, 0.75, 1.0, 1.0, 0.85, '16|||6|00'),
+  (203, 1.0, 1.0, 1.0, 0.825, '4|||7|00'),
+  (204, 1.0, 1.0, 1.0, 0.825, '4|||7|00'),
+  (205, 0.5, 1.0, 1.0, 0.825, '36|||7|00'),
+  (206, 1.0, 1.0, 1.0, 0.85, '6|||6|00'),
+  (207, 1.0, 1.0, 1.0, 0.85, '5|||6|00'),
+  (208, 1.0, 1.0, 1.0, 0.875, '4|||5|00'),
+  (209, 1.0, 1.0, 1.0, 0.9, '4|||4|00'),
+  (210, 1.0, 1.0, 1.0, 0.85, '11|||6|00'),
+  (211, 1.0, 1.0, 1.0, 0.925, '1|||3|00'),
+  (212, 0.75, 1.0, 1.0, 0.875, '16|||5|00'),
+  (213, 1.0, 1.0, 1.0, 0.85, '2|||6|00'),
+  (214, 0.75, 1.0, 1.0, 0.85, '30|||6|00'),
+  (215, 1.0, 1.0, 1.0, 0.9, '3|||4|00'),
+  (216, 1.0, 1.0, 1.0, 0.9, '3|||4|00'),
+  (217, 1.0, 1.0, 1.0, 0.825, '2|||7|00'),
+  (218, 1.0, 1.0, 1.0, 0.825, '9|||7|00'),
+  (219, 1.0, 1.0, 1.0, 0.825, '10|||7|00'),
+  (220, 1.0, 1.0, 1.0, 0.825, '7|||7|00'),
+  (221, 1.0, 1.0, 1.0, 0.825, '5|||7|00'),
+  (222, 1.0, 1.0, 1.0, 0.8, '8|||8|00'),
+  (223, 1.0, 1.0, 1.0, 0.85, '7|||6|00'),
+  (224, 0.75, 1.0, 1.0, 0.85, '18|||6|00'),
+  (225, 0.5, 1.0, 1.0, 0.825, '36|||7|00'),
+  (226, 0.5, 1.0, 1.0, 0.825, '36|||7|00'),
+  (227, 1.0, 1.0, 1.0, 0.875, '12|||5|00'),
+  (228, 0.5, 1.0, 1.0, 0.875, '100|||5|00'),
+  (229, 1.0, 1.0, 1.0, 0.875, '13|||5|00'),
+  (230, 1.0, 1.0, 1.0, 0.875, '11|||5|00'),
+  (231, 1.0, 1.0, 1.0, 0.85, '7|||6|00'),
+  (232, 0.75, 1.0, 1.0, 0.825, '26|||7|00'),
+  (233, 0.75, 1.0, 1.0, 0.8, '21|||8|00'),
+  (234, 0.5, 1.0, 1.0, 0.875, '96|||5|00'),
+  (235, 1.0, 1.0, 1.0, 0.8, '5|||8|00'),
+  (236, 1.0, 1.0, 1.0, 0.8, '12|||8|00'),
+  (237, 0.75, 1.0, 1.0, 0.825, '25|||7|00'),
+  (238, 0.75, 1.0, 1.0, 0.825, '29|||7|00'),
+  (239, 1.0, 1.0, 1.0, 0.8, '14|||8|00'),
+  (240, 0.75, 1.0, 1.0, 0.8, '16|||8|00'),
+  (243, 1.0, 1.0, 1.0, 0.825, '13|||7|00'),
+  (244, 1.0, 1.0, 1.0, 0.925, '1|||3|00'),
+  (245, 1.0, 1.0, 1.0, 0.9, '10|||4|00'),
+  (246, 1.0, 1.0, 1.0, 0.875, '5|||5|00'),
+  (247, 0.5, 1.0, 1.0, 0.8, '720|||8|00'),
+  (248, 1.0, 1.0, 1.0, 0.825, '12|||7|00'),
+  (249, 1.0, 1.0, 1.0, 0.825, '6|||7|00'),
+  (250, 0.75, 1.0, 1.0, 0.875, '15|||5|00'),
+  (251, 1.0, 1.0, 1.0, 0.875, '6|||5|00'),
+  (252, 1.0, 1.0, 1.0, 0.825, '12|||7|00'),
+  (253, 0.5, 1.0, 1.0, 0.825, '360|||7|00'),
+  (254, 1.0, 1.0, 1.0, 0.85, '7|||6|00'),
+  (255, 0.5, 1.0, 1.0, 0.85, '50|||6|00'),
+  (256, 0.5, 1.0, 1.0, 0.825, '168|||7|00'),
+  (257, 0.5, 1.0, 1.0, 0.85, '50|||6|00'),
+  (258, 0.5, 1.0, 1.0, 0.85, '48|||6|00'),
+  (259, 0.75, 1.0, 1.0, 0.8, '18|||8|00'),
+  (260, 0.5, 1.0, 1.0, 0.825, '168|||7|00'),
+  (261, 1.0, 1.0, 1.0, 0.775, '1.5|||9|00'),
+  (262, 1.0, 1.0, 1.0, 0.8, '8|||8|00'),
+  (263, 1.0, 1.0, 1.0, 0.8, '6|||8|00'),
+  (264, 1.0, 1.0, 1.0, 0.825, '3|||7|00');
+
+INSERT INTO medication_reduction_factors (medication_id, half_life_factor, cyp_factor, therapeutic_window_factor, withdrawal_factor, catalog_key)
+VALUES
+  (265, 0.5, 1.0, 1.0, 0.775, '336|||9|00'),
+  (266, 0.5, 1.0, 1.0, 0.8, '168|||8|00'),
+  (267, 1.0, 1.0, 1.0, 0.85, '1|||6|00'),
+  (268, 0.5, 1.0, 1.0, 0.825, '432|||7|00'),
+  (269, 1.0, 1.0, 1.0, 0.875, '1.5|||5|00'),
+  (270, 1.0, 1.0, 1.0, 0.875, '1.5|||5|00'),
+  (271, 0.5, 1.0, 1.0, 0.8, '672|||8|00'),
+  (272, 1.0, 1.0, 1.0, 0.825, '6|||7|00'),
+  (273, 1.0, 1.0, 1.0, 0.85, '3|||6|00'),
+  (274, 1.0, 1.0, 1.0, 0.925, '4|||3|00'),
+  (275, 0.75, 1.0, 1.0, 0.925, '18|||3|00'),
+  (276, 0.5, 1.0, 1.0, 0.875, '50|||5|00'),
+  (278, 1.0, 1.0, 1.0, 0.825, '12|||7|00'),
+  (279, 1.0, 1.0, 1.0, 0.9, '3|||4|00'),
+  (280, 1.0, 1.0, 1.0, 0.8, '12|||8|00'),
+  (281, 0.75, 1.0, 1.0, 0.85, '22|||6|00'),
+  (282, 1.0, 1.0, 1.0, 0.925, '1.5|||3|00'),
+  (283, 1.0, 1.0, 1.0, 0.85, '12|||6|00'),
+  (284, 1.0, 1.0, 1.0, 0.8, '8|||8|00'),
+  (285, 0.75, 1.0, 1.0, 0.8, '25|||8|00'),
+  (286, 1.0, 1.0, 1.0, 0.825, '1|||7|00'),
+  (287, 0.75, 1.0, 1.0, 0.8, '21|||8|00'),
+  (288, 1.0, 1.0, 1.0, 0.825, '7|||7|00'),
+  (289, 1.0, 1.0, 1.0, 0.8, '9|||8|00'),
+  (290, 1.0, 1.0, 1.0, 0.825, '7|||7|00'),
+  (291, 0.75, 1.0, 1.0, 0.825, '33|||7|00'),
+  (292, 0.5, 1.0, 1.0, 0.85, '70|||6|00'),
+  (293, 1.0, 1.0, 1.0, 0.85, '1.5|||6|00'),
+  (294, 0.5, 1.0, 1.0, 0.85, '70|||6|00'),
+  (295, 0.5, 1.0, 1.0, 0.8, '336|||8|00'),
+  (296, 0.5, 1.0, 1.0, 0.8, '102|||8|00'),
+  (297, 1.0, 1.0, 1.0, 0.85, '1|||6|00'),
+  (298, 0.5, 1.0, 1.0, 0.8, '192|||8|00'),
+  (299, 1.0, 1.0, 1.0, 0.9, '0.5|||4|00'),
+  (300, 1.0, 1.0, 1.0, 0.9, '4|||4|00'),
+  (301, 1.0, 1.0, 1.0, 0.875, '8|||5|00'),
+  (302, 0.5, 1.0, 1.0, 0.875, '50|||5|00'),
+  (303, 1.0, 1.0, 1.0, 0.875, '3|||5|00'),
+  (304, 1.0, 1.0, 1.0, 0.85, '8|||6|00'),
+  (305, 0.75, 1.0, 1.0, 0.9, '22|||4|00'),
+  (306, 0.75, 1.0, 1.0, 0.85, '24|||6|00'),
+  (307, 1.0, 1.0, 1.0, 0.8, '9|||8|00'),
+  (308, 1.0, 1.0, 1.0, 0.8, '12|||8|00'),
+  (309, 1.0, 1.0, 1.0, 0.8, '10|||8|00'),
+  (310, 1.0, 1.0, 1.0, 0.8, '7|||8|00'),
+  (311, 1.0, 1.0, 1.0, 0.8, '8|||8|00'),
+  (312, 1.0, 1.0, 1.0, 0.875, '14|||5|00'),
+  (313, 1.0, 1.0, 1.0, 0.9, '9|||4|00'),
+  (314, 1.0, 1.0, 1.0, 0.9, '6|||4|00'),
+  (315, 1.0, 1.0, 1.0, 0.825, '10|||7|00'),
+  (316, 0.5, 1.0, 1.0, 0.9, '120|||4|00'),
+  (317, 0.5, 1.0, 1.0, 0.875, '168|||5|00'),
+  (318, 0.5, 1.0, 1.0, 0.8, '504|||8|00'),
+  (319, 0.5, 1.0, 1.0, 0.8, '600|||8|00'),
+  (320, 1.0, 1.0, 1.0, 0.8, '3|||8|00'),
+  (321, 0.75, 1.0, 1.0, 0.9, '20|||4|00'),
+  (322, 0.5, 1.0, 1.0, 0.875, '50|||5|00'),
+  (323, 1.0, 1.0, 1.0, 0.85, '0.3|||6|00'),
+  (324, 1.0, 1.0, 1.0, 0.825, '4|||7|00'),
+  (325, 1.0, 1.0, 1.0, 0.825, '4|||7|00'),
+  (326, 1.0, 1.0, 1.0, 0.825, '2.5|||7|00'),
+  (327, 0.75, 1.0, 1.0, 0.8, '24|||8|00'),
+  (328, 1.0, 1.0, 1.0, 0.85, '3|||6|00'),
+  (329, 1.0, 1.0, 1.0, 0.85, '5|||6|00'),
+  (330, 1.0, 1.0, 1.0, 0.925, '8|||3|00'),
+  (331, 1.0, 1.0, 1.0, 0.8, '4|||8|00'),
+  (332, 1.0, 1.0, 1.0, 0.825, '5|||7|00'),
+  (333, 0.5, 1.0, 1.0, 0.925, '660|||3|00'),
+  (335, 0.75, 1.0, 1.0, 0.9, '24|||4|00'),
+  (337, 0.75, 1.0, 1.0, 0.9, '30|||4|00'),
+  (338, 1.0, 1.0, 1.0, 0.825, '5|||7|00'),
+  (339, 1.0, 1.0, 1.0, 0.85, '0.5|||6|00'),
+  (340, 1.0, 1.0, 1.0, 0.85, '7|||6|00'),
+  (342, 0.75, 1.0, 1.0, 0.85, '22|||6|00'),
+  (343, 1.0, 1.0, 1.0, 0.875, '0.8|||5|00'),
+  (344, 1.0, 1.0, 1.0, 0.85, '2|||6|00'),
+  (345, 1.0, 1.0, 1.0, 0.9, '8|||4|00'),
+  (346, 0.5, 1.0, 1.0, 0.825, '36|||7|00'),
+  (347, 1.0, 1.0, 1.0, 0.825, '10|||7|00'),
+  (348, 0.75, 1.0, 1.0, 0.85, '18|||6|00'),
+  (352, 0.5, 1.0, 1.0, 0.925, '400|||3|00'),
+  (353, 1.0, 1.0, 1.0, 0.95, '2|||2|00'),
+  (354, 1.0, 1.0, 1.0, 0.95, '6|||2|00'),
+  (355, 0.75, 1.0, 1.0, 0.95, '14.5|||2|00'),
+  (356, 0.5, 1.0, 1.0, 0.825, '35|||7|00'),
+  (357, 0.75, 1.0, 1.0, 0.825, '27|||7|00'),
+  (358, 0.5, 1.0, 1.0, 0.9, '36|||4|00'),
+  (359, 0.5, 1.0, 1.0, 0.9, '35|700|3500|4|00'),
+  (362, 1.0, 1.0, 1.0, 0.95, '3|||2|00'),
+  (363, 1.0, 1.0, 1.0, 0.95, '2|||2|00'),
+  (365, 1.0, 1.0, 1.0, 0.95, '2.5|||2|00'),
+  (368, 0.5, 1.0, 1.0, 0.925, '150|||3|00'),
+  (369, 0.5, 1.0, 1.0, 0.9, '146|||4|00');
+
@@ -0,0 +1,28 @@
+-- ============================================================================
+-- MEDLESS MIGRATION 019: Precomputed per-medication reduction factors
+-- ============================================================================
+-- Description:  Table of catalog-only reduction factors (phases 3-6 of
+--               applyCategorySafetyRules), joined by /api/analyze
+-- DEPENDS ON:   Migration 0005 (pharma fields), 0008 (medication_cyp_profile)
+-- DATA:         Generated by scripts/build_reduction_factors.py into
+--               medication_reduction_factors.sql; re-run after every seed
+--               or catalog migration. Rows that are missing or whose
+--               catalog_key no longer matches the live medication row fall
+--               back to the runtime calculation in src/index.tsx.
+-- DEPLOY ORDER: 1. apply migrations 019 + 020
+--               2. load medication_reduction_factors.sql + medication_aliases.sql
+--               3. deploy the worker
+--               A worker deployed before step 1 falls back to LIKE lookups
+--               and runtime factors (no errors, just slower).
+-- IDEMPOTENT:   Yes
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS medication_reduction_factors (
+  medication_id INTEGER PRIMARY KEY,
+  half_life_factor REAL NOT NULL,           -- Phase 3: 0.5, 0.75, 1.0
+  cyp_factor REAL NOT NULL,                 -- Phase 4: 0.7, 1.0, 1.15
+  therapeutic_window_factor REAL NOT NULL,  -- Phase 5: 0.8, 1.0
+  withdrawal_factor REAL NOT NULL,          -- Phase 6: 0.75-1.0
+  catalog_key TEXT NOT NULL,                -- inputs: half-life|tr_min|tr_max|withdrawal|slower+faster
+  FOREIGN KEY (medication_id) REFERENCES medications(id)
+);
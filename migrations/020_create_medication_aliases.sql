@@ -0,0 +1,24 @@
+-- ============================================================================
+-- MEDLESS MIGRATION 020: Medication alias resolution table
+-- ============================================================================
+-- Description:  Normalized brand/generic names for indexed name resolution
+--               in /api/analyze (replaces LIKE '%name%' table scans)
+-- DEPENDS ON:   Migration 0001 (medications)
+-- DATA:         Generated by scripts/build_medication_aliases.py into
+--               medication_aliases.sql; re-run after every seed or catalog
+--               migration. Names without an alias fall back to LIKE.
+-- DEPLOY ORDER: See migration 019 (apply 019 + 020, load both artifacts,
+--               then deploy the worker)
+-- IDEMPOTENT:   Yes
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS medication_aliases (
+  alias TEXT NOT NULL,             -- lowercase, umlaut-folded, single-spaced
+  medication_id INTEGER NOT NULL,
+  source TEXT NOT NULL,            -- name, generic_name, name_part, seed_name, seed_generic_name
+  FOREIGN KEY (medication_id) REFERENCES medications(id)
+);
+
+-- One medication per alias: resolution is an indexed equality lookup
+CREATE UNIQUE INDEX IF NOT EXISTS idx_medication_aliases_alias
+  ON medication_aliases(alias);
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+MEDLESS /api/analyze Scenario Runner
+Runs the declarative scenarios in tests/analyze_scenarios/ in parallel over a
+shared session pool and reports every failed expectation
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE = "http://localhost:3000"
+SCENARIO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests', 'analyze_scenarios')
+
+# name | [index] | [key=value]
+PATH_TOKEN_PATTERN = re.compile(r'\.?([^.\[\]]+)|\[(\d+)\]|\[([^=\]]+)=([^\]]*)\]')
+
+MISSING = object()
+
+def load_scenarios(paths):
+    """Load scenarios from JSON files, tagging each with its source file"""
+    scenarios = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            document = json.load(f)
+        for scenario in document['scenarios']:
+            scenario['file'] = os.path.basename(path)
+            scenarios.append(scenario)
+    return scenarios
+
+def resolve_path(data, path):
+    """Resolve 'a.b[0].c[name=X]' against a JSON document, or MISSING"""
+    value = data
+    for key, index, match_key, match_value in PATH_TOKEN_PATTERN.findall(path):
+        if key:
+            if not isinstance(value, dict) or key not in value:
+                return MISSING
+            value = value[key]
+        elif index:
+            if not isinstance(value, list) or int(index) >= len(value):
+                return MISSING
+            value = value[int(index)]
+        else:
+            if not isinstance(value, list):
+                return MISSING
+            value = next((item for item in value
+                          if isinstance(item, dict) and str(item.get(match_key)) == match_value), MISSING)
+            if value is MISSING:
+                return MISSING
+    return value
+
+def _as_list(value):
+    return value if isinstance(value, list) else [value]
+
+def check_expectation(data, expectation):
+    """Return an error message for a failed expectation, or None"""
+    path = expectation['path']
+    value = resolve_path(data, path)
+    if value is MISSING:
+        return None if expectation.get('optional') else f"{path}: missing"
+
+    if 'equals' in expectation and value != expectation['equals']:
+        return f"{path}: expected {expectation['equals']!r}, got {value!r}"
+    if 'len' in expectation and (not hasattr(value, '__len__') or len(value) != expectation['len']):
+        return f"{path}: expected length {expectation['len']}, got {value!r}"
+    if 'contains' in expectation and expectation['contains'] not in value:
+        return f"{path}: expected to contain {expectation['contains']!r}, got {value!r}"
+    if 'any_contains' in expectation:
+        needle = expectation['any_contains']
+        if not any(needle in str(item) for item in _as_list(value)):
+            return f"{path}: no entry contains {needle!r}"
+    if 'none_contains' in expectation:
+        needles = [needle.lower() for needle in _as_list(expectation['none_contains'])]
+        hits = [item for item in _as_list(value) if any(needle in str(item).lower() for needle in needles)]
+        if hits:
+            return f"{path}: unexpected entries {hits!r}"
+    if expectation.get('truthy') and not value:
+        return f"{path}: expected truthy, got {value!r}"
+    if expectation.get('falsy') and value:
+        return f"{path}: expected falsy, got {value!r}"
+    return None
+
+def run_scenario(session, base, scenario, timeout):
+    """POST one scenario and check all of its expectations"""
+    start = time.perf_counter()
+    try:
+        resp = session.post(f"{base}/api/analyze", json=scenario['payload'], timeout=timeout)
+        resp.raise_for_status()
+        data = resp.json()
+    except (requests.RequestException, ValueError) as e:
+        return scenario, [f"request failed: {e}"], time.perf_counter() - start
+
+    failures = [error for error in (check_expectation(data, expectation) for expectation in scenario['expect'])
+                if error]
+    return scenario, failures, time.perf_counter() - start
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Run declarative /api/analyze regression scenarios')
+    parser.add_argument('files', nargs='*', help=f'scenario files (default: {SCENARIO_DIR}/*.json)')
+    parser.add_argument('--base', default=BASE, help=f'server base URL (default: {BASE})')
+    parser.add_argument('--workers', type=int, default=8, help='parallel requests / pooled connections')
+    parser.add_argument('--filter', help='only run scenarios whose name contains this text')
+    parser.add_argument('--timeout', type=float, default=15, help='per-request timeout in seconds')
+    args = parser.parse_args()
+
+    files = args.files or sorted(glob.glob(os.path.join(SCENARIO_DIR, '*.json')))
+    scenarios = [scenario for scenario in load_scenarios(files)
+                 if not args.filter or args.filter in scenario['name']]
+
+    print("=" * 70)
+    print("MEDLESS /api/analyze SCENARIOS")
+    print("=" * 70)
+    print(f"Target: {args.base}  Scenarios: {len(scenarios)} from {len(files)} files  Workers: {args.workers}")
+    print()
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=args.workers)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        results = list(pool.map(lambda scenario: run_scenario(session, args.base, scenario, args.timeout),
+                                scenarios))
+    elapsed = time.perf_counter() - start
+
+    failed = 0
+    for scenario, failures, seconds in results:
+        status = "✓ PASS" if not failures else "✗ FAIL"
+        print(f"{status}  {scenario['name']:35s} {seconds * 1000:7.0f} ms  ({scenario['file']})")
+        for failure in failures:
+            print(f"        - {failure}")
+        failed += bool(failures)
+
+    print()
+    print("=" * 70)
+    print(f"{len(results) - failed}/{len(results)} scenarios passed in {elapsed:.2f}s")
+    print("=" * 70)
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+MEDLESS Catalog Tooling Benchmarks
+Measures throughput and peak memory of the audit and seed emitter hot paths
+at catalog sizes from 343 to 1M rows and compares them with the baseline
+committed in benchmark_baseline.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, NamedTuple
+
+from local_replica import REPO_ROOT, build_local_replica
+
+sys.path.insert(0, REPO_ROOT)
+
+import analyze_medication_data_quality as audit
+from generate_master_seed import (SEED_TABLES, SeedWriter, escape_sql_string, generate_cbd_interactions,
+                                  generate_cyp_profiles, generate_medication_categories, generate_medications)
+from synthetic_catalog import SyntheticCatalog, learn
+
+BASELINE_PATH = os.path.join(REPO_ROOT, 'benchmark_baseline.json')
+DEFAULT_SIZES = [343, 10_000, 100_000, 1_000_000]
+QUICK_SIZES = [343, 10_000]
+MIN_RUN_SECONDS = 0.05
+
+# Distinct synthetic medications behind --fixtures synthetic (cycled like the replica rows)
+SYNTHETIC_FIXTURE_ROWS = 20_000
+
+# Peak memory below this is noise (interpreter caches, small dicts)
+MEMORY_NOISE_BYTES = 256 * 1024
+
+class ScaledRows:
+    """size rows cycling through base without copying (sized, iterable more than once)"""
+
+    def __init__(self, base: List[dict], size: int):
+        self.base = base
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        base, count = self.base, len(self.base)
+        for i in range(self.size):
+            yield base[i % count]
+
+class Case(NamedTuple):
+    table: str
+    run: Callable[[ScaledRows], object]
+    description: str
+
+def _cyp_fields(rows):
+    # Cleared per row: cycled fixtures repeat the same texts, so a per-pass
+    # clear would time the memo instead of the tokenizer from row 344 on
+    clear = audit._tokenize_cyp_text.cache_clear
+    for row in rows:
+        clear()
+        audit.analyze_cyp_enzyme_field(row['cyp450_enzyme'])
+
+def _escape_rows(rows):
+    for row in rows:
+        for value in row.values():
+            escape_sql_string(value)
+
+def _emitter(generate):
+    def run(rows):
+        with open(os.devnull, 'w', encoding='utf-8') as f:
+            generate(SeedWriter(f, multi_row=True), rows)
+    return run
+
+CASES: Dict[str, Case] = {
+    'analyze_cyp_enzyme_field': Case('audit', _cyp_fields, 'cyp450_enzyme parse per row (cold cache)'),
+    'analyze_data_quality': Case('audit', audit.analyze_data_quality, 'row audit engine'),
+    'analyze_data_quality_columnar': Case('audit', audit.analyze_data_quality_columnar, 'NumPy audit engine'),
+    'escape_sql_string': Case('medications', _escape_rows, 'every medications column'),
+    'generate_medication_categories': Case('medication_categories', _emitter(generate_medication_categories),
+                                           'multi-row seed emitter'),
+    'generate_medications': Case('medications', _emitter(generate_medications), 'multi-row seed emitter'),
+    'generate_cbd_interactions': Case('cbd_interactions', _emitter(generate_cbd_interactions),
+                                      'multi-row seed emitter'),
+    'generate_cyp_profiles': Case('medication_cyp_profile', _emitter(generate_cyp_profiles),
+                                  'multi-row seed emitter'),
+}
+
+def load_fixtures(source: str = 'replica') -> Dict[str, List[dict]]:
+    """Replica or synthetic rows per seed table plus the audit columns of medications"""
+    if source == 'synthetic':
+        catalog = SyntheticCatalog(learn(), SYNTHETIC_FIXTURE_ROWS)
+        fixtures = {table: list(catalog.rows(table)) for table in SEED_TABLES}
+        fixtures['audit'] = [{column: med[column] for column in audit.AUDIT_COLUMNS}
+                             for med in fixtures['medications']]
+        return fixtures
+    conn = build_local_replica()
+    fixtures = {}
+    for table in SEED_TABLES:
+        cursor = conn.execute(f"SELECT * FROM {table} ORDER BY id")
+        columns = [d[0] for d in cursor.description]
+        fixtures[table] = [dict(zip(columns, row)) for row in cursor]
+    fixtures['audit'] = audit.load_medications_sqlite(conn)
+    conn.close()
+    return fixtures
+
+def _calibration_workload():
+    row = {'id': 0, 'name': 'Medikament', 'half_life_hours': 12.5, 'cyp450_enzyme': 'CYP3A4 (Substrat)'}
+    parts = []
+    for i in range(20_000):
+        row['id'] = i
+        parts.append(f"({row['id']}, '{row['name'].replace(chr(39), chr(39) * 2)}', {row['half_life_hours']})")
+        row['cyp450_enzyme'].lower().split()
+    return len(','.join(parts))
+
+def calibrate(repeat: int = 5) -> float:
+    """Best-of-repeat seconds of a fixed interpreter workload (dicts, strings, formatting)
+
+    Throughput times this value ("rows per calibration unit") cancels out
+    machine speed and sustained slowdowns of shared hosts; regressions are
+    judged on it.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _calibration_workload()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def measure(case: Case, rows: ScaledRows, repeat: int, memory: bool) -> dict:
+    """Best-of-repeat seconds per pass (small sizes loop for MIN_RUN_SECONDS) and tracemalloc peak
+
+    The garbage collector is off while timing, as in timeit.
+    """
+    gc.collect()
+    gc.disable()
+    try:
+        calibration = calibrate()
+        start = time.perf_counter()
+        case.run(rows)
+        first = time.perf_counter() - start
+        loops = max(1, int(MIN_RUN_SECONDS / max(first, 1e-9)))
+        best = first
+        for _ in range(min(repeat, 2) if first > 1 else repeat):
+            start = time.perf_counter()
+            for _ in range(loops):
+                case.run(rows)
+            best = min(best, (time.perf_counter() - start) / loops)
+        calibration = min(calibration, calibrate())
+    finally:
+        gc.enable()
+    result = {'seconds': round(best, 6), 'rows_per_second': round(len(rows) / best, 1),
+              'rows_per_unit': round(len(rows) / best * calibration, 1)}
+    if memory:
+        tracemalloc.start()
+        case.run(rows)
+        result['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result
+
+def environment() -> dict:
+    """Interpreter and machine the numbers were taken on"""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'system': platform.system(),
+        'numpy': getattr(audit.np, '__version__', None),
+    }
+
+def compare(results: Dict[str, Dict[str, dict]], baseline: dict, threshold: float, memory_threshold: float):
+    """(case, size, message) for every regression past the thresholds"""
+    regressions = []
+    for name, sizes in results.items():
+        for size, result in sizes.items():
+            base = baseline.get('results', {}).get(name, {}).get(size)
+            if not base:
+                continue
+            if result['rows_per_unit'] < base['rows_per_unit'] * (1 - threshold):
+                regressions.append((name, size, f"throughput {result['rows_per_unit']:,.0f} rows/unit < "
+                                                f"{base['rows_per_unit']:,.0f} - {threshold:.0%}"))
+            if 'peak_bytes' in result and 'peak_bytes' in base and \
+                    result['peak_bytes'] > base['peak_bytes'] * (1 + memory_threshold) and \
+                    result['peak_bytes'] - base['peak_bytes'] > MEMORY_NOISE_BYTES:
+                regressions.append((name, size, f"peak {result['peak_bytes']:,} B > "
+                                                f"{base['peak_bytes']:,} B + {memory_threshold:.0%}"))
+    return regressions
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Benchmark the catalog tooling hot paths')
+    parser.add_argument('--sizes', type=lambda s: [int(v) for v in s.split(',')], default=DEFAULT_SIZES,
+                        help='comma-separated row counts (default: 343,10000,100000,1000000)')
+    parser.add_argument('--quick', action='store_true', help=f"only sizes {','.join(map(str, QUICK_SIZES))}")
+    parser.add_argument('--cases', type=lambda s: s.split(','), default=list(CASES),
+                        help='comma-separated benchmarks (default: all)')
+    parser.add_argument('--repeat', type=int, default=9,
+                        help='runs per size, the best is kept (at most 3 for runs over 1s)')
+    parser.add_argument('--no-memory', action='store_true', help='skip the tracemalloc pass')
+    parser.add_argument('--fixtures', choices=['replica', 'synthetic'], default='replica',
+                        help=f'replica rows, or {SYNTHETIC_FIXTURE_ROWS:,} seeded synthetic medications '
+                             '(scripts/synthetic_catalog.py) with their interactions and CYP profiles')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='baseline JSON to compare with')
+    parser.add_argument('--update-baseline', action='store_true', help='write the results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.50,
+                        help='allowed drop of calibrated throughput (fraction; runs on shared hosts vary by ~35%%)')
+    parser.add_argument('--memory-threshold', type=float, default=0.10, help='allowed peak memory growth (fraction)')
+    parser.add_argument('--retries', type=int, default=2, help='re-measure throughput regressions this often')
+    parser.add_argument('--json', help='also write the results to this file')
+    args = parser.parse_args()
+    sizes = QUICK_SIZES if args.quick else args.sizes
+    unknown = [name for name in args.cases if name not in CASES]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)} (choose from {', '.join(CASES)})")
+    cases = [name for name in args.cases if audit.np is not None or not name.endswith('_columnar')]
+
+    print("=" * 70)
+    print("MEDLESS CATALOG TOOLING BENCHMARKS")
+    print("=" * 70)
+    fixtures = load_fixtures(args.fixtures)
+    print(f"Fixtures: {args.fixtures} rows repeated cyclically up to {max(sizes):,} rows "
+          f"({', '.join(f'{len(rows)} {table}' for table, rows in fixtures.items())})")
+    print()
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('environment') != environment():
+            print(f"⚠️  Baseline taken on {baseline.get('environment')}, running on {environment()}")
+            print()
+        if baseline.get('fixtures', 'replica') != args.fixtures:
+            print(f"ℹ️  Baseline measured on {baseline.get('fixtures', 'replica')} fixtures, not compared "
+                  f"(use --baseline for a {args.fixtures} baseline)")
+            print()
+            baseline = {'environment': baseline.get('environment'), 'fixtures': baseline.get('fixtures', 'replica')}
+
+    results: Dict[str, Dict[str, dict]] = {}
+    print(f"{'benchmark':<32}{'rows':>10}{'rows/s':>14}{'peak MB':>10}{'vs. baseline':>14}")
+    for name in cases:
+        case = CASES[name]
+        results[name] = {}
+        for size in sizes:
+            result = measure(case, ScaledRows(fixtures[case.table], size), args.repeat, not args.no_memory)
+            results[name][str(size)] = result
+            base = baseline.get('results', {}).get(name, {}).get(str(size))
+            change = f"{result['rows_per_unit'] / base['rows_per_unit'] - 1:+.0%}" if base else 'new'
+            peak = f"{result['peak_bytes'] / 1e6:.1f}" if 'peak_bytes' in result else '-'
+            print(f"{name:<32}{size:>10,}{result['rows_per_second']:>14,.0f}{peak:>10}{change:>14}", flush=True)
+    print()
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'environment': environment(), 'fixtures': args.fixtures, 'results': results}, f, indent=2)
+    if args.update_baseline:
+        merged = baseline.get('results', {}) if baseline.get('environment') == environment() else {}
+        for name, by_size in results.items():
+            merged.setdefault(name, {}).update(by_size)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({'environment': environment(), 'fixtures': args.fixtures, 'results': merged}, f, indent=2)
+            f.write('\n')
+        print(f"✅ Baseline written: {os.path.relpath(args.baseline, REPO_ROOT)}")
+        return
+
+    regressions = compare(results, baseline, args.threshold, args.memory_threshold)
+    for attempt in range(args.retries):
+        slow = {(name, size) for name, size, message in regressions if message.startswith('throughput')}
+        if not slow:
+            break
+        print(f"Re-measuring {len(slow)} slow results (attempt {attempt + 1}/{args.retries})...")
+        for name, size in sorted(slow):
+            case = CASES[name]
+            retry = measure(case, ScaledRows(fixtures[case.table], int(size)), args.repeat, False)
+            if retry['rows_per_unit'] > results[name][size]['rows_per_unit']:
+                results[name][size].update(retry)
+        regressions = compare(results, baseline, args.threshold, args.memory_threshold)
+    for name, size, message in regressions:
+        print(f"❌ {name} @ {size}: {message}")
+    if not os.path.exists(args.baseline):
+        print(f"ℹ️  No baseline at {args.baseline} - run with --update-baseline")
+    elif baseline.get('results') and not regressions:
+        print("✅ No regressions against the baseline")
+    sys.exit(1 if regressions else 0)
+
+if __name__ == '__main__':
+    main()
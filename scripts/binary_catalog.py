@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+MEDLESS Binary Catalog
+Compiles medications, categories, CYP profiles and interactions into a
+fixed-width, struct-packed file with a string table, and reads it through
+mmap with __slots__ record views (no per-row dicts, nothing copied up front)
+"""
+
+import argparse
+import bisect
+import hashlib
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+import time
+from typing import Dict, List, Optional
+
+from local_replica import MASTER_SEED, REPO_ROOT, build_local_replica, replay_files
+
+DEFAULT_OUTPUT_PATH = os.path.join(REPO_ROOT, 'medless_catalog.bin')
+MAGIC = b'MDLCAT01'
+VERSION = 1
+
+# magic, version, schema offset/size, string table offset/size, sha256 of the rows
+HEADER = struct.Struct('<8sIQQQQ32s')
+STRING_LENGTH = struct.Struct('<I')
+
+# Column codes: q = int64, d = float64, s = uint32 offset into the string table
+NULL_INT = -2 ** 63
+NULL_STRING = 0xFFFFFFFF
+FIELD_FORMATS = {'q': 'q', 'd': 'd', 's': 'I'}
+
+TABLES = ['medication_categories', 'medications', 'medication_cyp_profile', 'cbd_interactions']
+
+def column_type(values) -> str:
+    """q if every non-NULL value is an int, d if numeric, s otherwise"""
+    kinds = {type(v) for v in values if v is not None}
+    if kinds <= {int}:
+        return 'q'
+    if kinds <= {int, float}:
+        return 'd'
+    return 's'
+
+class _StringTable:
+    """Deduplicated length-prefixed UTF-8 strings"""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets: Dict[str, int] = {}
+
+    def add(self, value) -> int:
+        if value is None:
+            return NULL_STRING
+        text = value if isinstance(value, str) else str(value)
+        if text not in self.offsets:
+            encoded = text.encode('utf-8')
+            self.offsets[text] = len(self.data)
+            self.data += STRING_LENGTH.pack(len(encoded)) + encoded
+        return self.offsets[text]
+
+def catalog_rows(conn) -> Dict[str, tuple]:
+    """(columns, rows ordered by id) per catalog table"""
+    tables = {}
+    for table in TABLES:
+        cursor = conn.execute(f"SELECT * FROM {table} ORDER BY id")
+        tables[table] = ([d[0] for d in cursor.description], cursor.fetchall())
+    return tables
+
+def rows_hash(tables) -> str:
+    """sha256 over every compiled row"""
+    return hashlib.sha256(json.dumps(tables, default=str).encode('utf-8')).hexdigest()
+
+def compile_catalog(tables, path: str, source_hash: str) -> Dict[str, int]:
+    """Write the binary catalog, return byte sizes per section"""
+    strings = _StringTable()
+    schema, blobs = [], []
+    offset = HEADER.size
+    for name, (columns, rows) in tables.items():
+        types = ''.join(column_type([row[i] for row in rows]) for i in range(len(columns)))
+        record = struct.Struct('<' + ''.join(FIELD_FORMATS[t] for t in types))
+        blob = bytearray(record.size * len(rows))
+        for index, row in enumerate(rows):
+            values = []
+            for value, kind in zip(row, types):
+                if kind == 's':
+                    values.append(strings.add(value))
+                elif kind == 'd':
+                    values.append(math.nan if value is None else float(value))
+                else:
+                    values.append(NULL_INT if value is None else value)
+            record.pack_into(blob, index * record.size, *values)
+        schema.append({'name': name, 'columns': columns, 'types': types,
+                       'rows': len(rows), 'offset': offset})
+        blobs.append(blob)
+        offset += len(blob)
+
+    schema_bytes = json.dumps({'tables': schema}).encode('utf-8')
+    schema_offset = offset
+    strings_offset = schema_offset + len(schema_bytes)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, schema_offset, len(schema_bytes),
+                            strings_offset, len(strings.data), bytes.fromhex(source_hash)))
+        for blob in blobs:
+            f.write(blob)
+        f.write(schema_bytes)
+        f.write(strings.data)
+    os.replace(tmp_path, path)
+    return {'records': sum(len(b) for b in blobs), 'schema': len(schema_bytes),
+            'strings': len(strings.data), 'total': strings_offset + len(strings.data)}
+
+class Record:
+    """Read-only view of one row; fields are decoded from the mapping on access"""
+
+    __slots__ = ('_table', '_offset')
+
+    def __init__(self, table: 'CatalogTable', offset: int):
+        self._table = table
+        self._offset = offset
+
+    def __getitem__(self, column: str):
+        return self._table.field(self._offset, column)
+
+    def __getattr__(self, column: str):
+        try:
+            return self._table.field(self._offset, column)
+        except KeyError:
+            raise AttributeError(column) from None
+
+    def get(self, column: str, default=None):
+        return self._table.field(self._offset, column) if column in self._table.fields else default
+
+    def keys(self) -> List[str]:
+        return self._table.columns
+
+    def as_dict(self) -> dict:
+        return {column: self[column] for column in self._table.columns}
+
+    def __repr__(self):
+        return f"<{self._table.name} {self.as_dict()}>"
+
+class CatalogTable:
+    """Fixed-width records of one table inside the mapping"""
+
+    def __init__(self, catalog: 'BinaryCatalog', spec: dict):
+        self.catalog = catalog
+        self.name = spec['name']
+        self.columns = spec['columns']
+        self.types = spec['types']
+        self.rows = spec['rows']
+        self.offset = spec['offset']
+        self.record = struct.Struct('<' + ''.join(FIELD_FORMATS[t] for t in self.types))
+        self.fields = {}
+        position = 0
+        for column, kind in zip(self.columns, self.types):
+            field = struct.Struct('<' + FIELD_FORMATS[kind])
+            self.fields[column] = (field, position, kind)
+            position += field.size
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, index: int) -> Record:
+        if index < 0:
+            index += self.rows
+        if not 0 <= index < self.rows:
+            raise IndexError(index)
+        return Record(self, self.offset + index * self.record.size)
+
+    def __iter__(self):
+        size = self.record.size
+        for offset in range(self.offset, self.offset + self.rows * size, size):
+            yield Record(self, offset)
+
+    def _decode(self, value, kind):
+        if kind == 's':
+            return None if value == NULL_STRING else self.catalog.string(value)
+        if kind == 'd':
+            return None if math.isnan(value) else value
+        return None if value == NULL_INT else value
+
+    def field(self, record_offset: int, column: str):
+        """Decode one column of the record at record_offset"""
+        field, position, kind = self.fields[column]
+        return self._decode(field.unpack_from(self.catalog.buffer, record_offset + position)[0], kind)
+
+    def column(self, column: str) -> list:
+        """Whole column, decoded in one pass over the records"""
+        index = self.columns.index(column)
+        kind = self.types[index]
+        view = self.catalog.buffer[self.offset:self.offset + self.rows * self.record.size]
+        try:
+            return [self._decode(values[index], kind) for values in self.record.iter_unpack(view)]
+        finally:
+            view.release()
+
+    def by_id(self, record_id: int) -> Optional[Record]:
+        """Binary search on the id column (records are stored ordered by id)"""
+        index = bisect.bisect_left(range(self.rows), record_id, key=lambda i: self[i]['id'])
+        if index < self.rows and self[index]['id'] == record_id:
+            return self[index]
+        return None
+
+class BinaryCatalog:
+    """Memory-mapped catalog file; pages are shared between processes"""
+
+    def __init__(self, path: str = DEFAULT_OUTPUT_PATH):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buffer = memoryview(self._map)
+        (magic, version, schema_offset, schema_size,
+         self.strings_offset, _, digest) = HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path}: not a MEDLESS catalog (magic {magic!r}, version {version})")
+        self.source_hash = digest.hex()
+        schema = json.loads(bytes(self.buffer[schema_offset:schema_offset + schema_size]))
+        self.tables = {spec['name']: CatalogTable(self, spec) for spec in schema['tables']}
+
+    def __getattr__(self, name: str) -> CatalogTable:
+        tables = self.__dict__.get('tables', {})
+        if name in tables:
+            return tables[name]
+        raise AttributeError(name)
+
+    def string(self, offset: int) -> str:
+        """Decode one string of the string table"""
+        start = self.strings_offset + offset
+        (length,) = STRING_LENGTH.unpack_from(self._map, start)
+        return self._map[start + 4:start + 4 + length].decode('utf-8')
+
+    def close(self):
+        self.tables = {}
+        self.buffer.release()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def read_catalog_hash(path: str) -> Optional[str]:
+    """Source hash recorded in an existing catalog (None if missing or foreign)"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        header = f.read(HEADER.size)
+    if len(header) < HEADER.size:
+        return None
+    magic, version, *_, digest = HEADER.unpack(header)
+    return digest.hex() if magic == MAGIC and version == VERSION else None
+
+def verify(catalog: BinaryCatalog, tables) -> int:
+    """Compare every field of the mapping with the source rows, return mismatches"""
+    mismatches = 0
+    for name, (columns, rows) in tables.items():
+        table = catalog.tables[name]
+        for row, record in zip(rows, table):
+            for column, kind, value in zip(columns, table.types, row):
+                expected = str(value) if kind == 's' and value is not None else value
+                if record[column] != expected:
+                    mismatches += 1
+        mismatches += abs(len(rows) - len(table))
+    return mismatches
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Compile the catalog into a memory-mapped binary file')
+    parser.add_argument('--seed', default=MASTER_SEED, help='master seed to replay (default: repo seed)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH, help='catalog file to write')
+    parser.add_argument('--check', action='store_true',
+                        help='only verify that --output matches the current catalog (exit 1 if stale)')
+    args = parser.parse_args()
+
+    conn = build_local_replica(files=replay_files(seed_path=args.seed))
+    tables = catalog_rows(conn)
+    conn.close()
+    source_hash = rows_hash(tables)
+
+    if args.check:
+        if read_catalog_hash(args.output) != source_hash:
+            print(f"❌ {os.path.relpath(args.output, REPO_ROOT)} is missing or stale - run scripts/binary_catalog.py")
+            sys.exit(1)
+        print(f"✅ {os.path.relpath(args.output, REPO_ROOT)} is up to date ({source_hash[:12]})")
+        return
+
+    sizes = compile_catalog(tables, args.output, source_hash)
+    start = time.perf_counter()
+    catalog = BinaryCatalog(args.output)
+    open_time = time.perf_counter() - start
+
+    print("=" * 60)
+    print("MEDLESS Binary Catalog")
+    print("=" * 60)
+    print(f"Output: {args.output} ({sizes['total']:,} bytes: {sizes['records']:,} records, "
+          f"{sizes['strings']:,} strings, {sizes['schema']:,} schema)")
+    for name, table in catalog.tables.items():
+        print(f"- {name}: {len(table)} rows x {table.record.size} bytes ({table.types})")
+    print(f"Open: {open_time * 1e6:.0f} µs")
+
+    start = time.perf_counter()
+    names = catalog.medications.column('name')
+    print(f"Decode medications.name ({len(names)} values): {(time.perf_counter() - start) * 1e6:.0f} µs")
+    mismatches = verify(catalog, tables)
+    catalog.close()
+    print(f"{'✅' if not mismatches else '❌'} {mismatches} fields differ from the replica")
+    sys.exit(1 if mismatches else 0)
+
+if __name__ == '__main__':
+    main()
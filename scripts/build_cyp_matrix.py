@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+MEDLESS CYP Interaction Matrix Builder
+Compiles medication_cyp_profile into one enzyme x role bitset per medication
+(cyp_interaction_matrix.json) and checks bitset MDI scoring against the
+row-based /api/analyze logic
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from typing import Dict, Iterable, List, Tuple
+
+from local_replica import MASTER_SEED, REPO_ROOT, build_local_replica, replay_files
+from reduction_engine import mdi_factor, mdi_level
+
+DEFAULT_OUTPUT_PATH = os.path.join(REPO_ROOT, 'cyp_interaction_matrix.json')
+
+# Bit layout: enzyme i occupies bits [i * len(SLOTS), (i + 1) * len(SLOTS))
+ROLES = ['substrate', 'inhibitor', 'inducer', 'mixed']
+EFFECTS = ['slower', 'faster', 'neutral']
+SLOTS = ROLES + EFFECTS
+
+PROFILE_QUERY = """
+    SELECT medication_id, cyp_enzyme, role, cbd_effect_on_reduction
+    FROM medication_cyp_profile
+    ORDER BY medication_id, cyp_enzyme, role, cbd_effect_on_reduction
+"""
+
+def profiles_hash(rows) -> str:
+    """sha256 over the profile rows the matrix is compiled from"""
+    return hashlib.sha256(json.dumps(rows, default=str).encode('utf-8')).hexdigest()
+
+def build_matrix(rows) -> Tuple[List[str], Dict[int, int]]:
+    """Enzyme list and medication_id -> bitset (role and effect bits per enzyme)"""
+    enzymes = sorted({enzyme for _, enzyme, _, _ in rows})
+    masks: Dict[int, int] = {}
+    for med_id, enzyme, role, effect in rows:
+        if role not in ROLES or (effect is not None and effect not in EFFECTS):
+            raise ValueError(f"medication {med_id}: unknown role/effect {role!r}/{effect!r} for {enzyme}")
+        base = enzymes.index(enzyme) * len(SLOTS)
+        mask = masks.get(med_id, 0) | (1 << (base + SLOTS.index(role)))
+        if effect is not None:
+            mask |= 1 << (base + SLOTS.index(effect))
+        masks[med_id] = mask
+    return enzymes, masks
+
+def selector(enzymes: List[str], slot: str) -> int:
+    """Bits of one role/effect across every enzyme"""
+    offset = SLOTS.index(slot)
+    return sum(1 << (i * len(SLOTS) + offset) for i in range(len(enzymes)))
+
+class CypMatrix:
+    """Loaded artifact: per-medication bitsets plus slot selectors"""
+
+    def __init__(self, enzymes: List[str], masks: Dict[int, int]):
+        self.enzymes = enzymes
+        self.masks = masks
+        self.slower = selector(enzymes, 'slower')
+        self.faster = selector(enzymes, 'faster')
+        self.inhibitor = selector(enzymes, 'inhibitor')
+
+    @classmethod
+    def load(cls, path: str) -> 'CypMatrix':
+        """Read cyp_interaction_matrix.json"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data['slots'] != SLOTS:
+            raise ValueError(f"{path}: slot layout {data['slots']} != {SLOTS}")
+        return cls(data['enzymes'], {int(k): int(v, 16) for k, v in data['medications'].items()})
+
+    def mdi(self, medication_ids: Iterable[int]) -> Dict[str, object]:
+        """multi_drug_interaction counts, level and factor for a request
+
+        Every requested medication counts once per entry (like analysisResults),
+        so repeated or unknown ids behave as in the API.
+        """
+        inhibitors = inducers = 0
+        combined = 0
+        for med_id in medication_ids:
+            mask = self.masks.get(med_id, 0)
+            inhibitors += bool(mask & self.slower)
+            inducers += bool(mask & self.faster)
+            combined |= mask
+        return {
+            'inhibitors': inhibitors,
+            'inducers': inducers,
+            'level': mdi_level(inhibitors, inducers),
+            'adjustment_factor': mdi_factor(inhibitors, inducers),
+            'inhibited_enzymes': bin(combined & self.inhibitor).count('1'),
+        }
+
+def reference_mdi(profiles: Dict[int, List[tuple]], medication_ids: Iterable[int]) -> Dict[str, object]:
+    """Row-based port of buildAnalyzeResponse (some(p => p.cbd_effect_on_reduction === ...))"""
+    ids = list(medication_ids)
+    inhibitors = sum(any(p[3] == 'slower' for p in profiles.get(i, [])) for i in ids)
+    inducers = sum(any(p[3] == 'faster' for p in profiles.get(i, [])) for i in ids)
+    return {
+        'inhibitors': inhibitors,
+        'inducers': inducers,
+        'level': mdi_level(inhibitors, inducers),
+        'adjustment_factor': mdi_factor(inhibitors, inducers),
+    }
+
+def write_artifact(path: str, enzymes: List[str], masks: Dict[int, int], source_hash: str) -> None:
+    """Write the matrix as JSON (hex strings: bitsets can exceed 53 bits)"""
+    data = {
+        'generated_by': 'scripts/build_cyp_matrix.py',
+        'catalog_hash': source_hash,
+        'enzymes': enzymes,
+        'slots': SLOTS,
+        'selectors': {slot: hex(selector(enzymes, slot)) for slot in SLOTS},
+        'medications': {str(med_id): hex(mask) for med_id, mask in sorted(masks.items())},
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+        f.write('\n')
+
+def read_artifact_hash(path: str):
+    """Catalog hash recorded in an existing artifact (None if missing)"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('catalog_hash')
+
+def combinations(profiled: List[int], catalog_ids: List[int], samples: int, seed: int):
+    """Every subset of the profiled medications plus random requests with repeats"""
+    for size in range(len(profiled) + 1):
+        yield from itertools.combinations(profiled, size)
+    rng = random.Random(seed)
+    pool = profiled + rng.sample(catalog_ids, min(len(catalog_ids), 4 * len(profiled))) + [-1]
+    for _ in range(samples):
+        yield tuple(rng.choice(pool) for _ in range(rng.randint(1, 12)))
+
+def check_reference(matrix: CypMatrix, profiles, combos) -> Tuple[int, int, float, float]:
+    """Compare bitset vs. row-based scoring, return (checked, mismatches, bitset s, reference s)"""
+    combos = list(combos)
+    start = time.perf_counter()
+    fast = [matrix.mdi(combo) for combo in combos]
+    bitset_time = time.perf_counter() - start
+    start = time.perf_counter()
+    slow = [reference_mdi(profiles, combo) for combo in combos]
+    reference_time = time.perf_counter() - start
+    mismatches = 0
+    for combo, a, b in zip(combos, fast, slow):
+        if any(a[key] != b[key] for key in b):
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"  ❌ {combo}: bitset {a} != reference {b}")
+    return len(combos), mismatches, bitset_time, reference_time
+
+def check_api(matrix: CypMatrix, base: str, names: Dict[int, str], combos, timeout: float) -> int:
+    """POST combinations to /api/analyze and compare multi_drug_interaction, return mismatches"""
+    import requests
+
+    mismatches = 0
+    for combo in combos:
+        payload = {
+            'medications': [{'name': names[i], 'mgPerDay': 10} for i in combo],
+            'reductionGoal': 50, 'durationWeeks': 12, 'age': 50, 'weight': 75, 'gender': 'm',
+        }
+        resp = requests.post(f"{base}/api/analyze", json=payload, timeout=timeout)
+        api = resp.json().get('multi_drug_interaction', {})
+        expected = matrix.mdi(combo)
+        if any(api.get(key) != expected[key] for key in ('inhibitors', 'inducers', 'level', 'adjustment_factor')):
+            mismatches += 1
+            print(f"  ❌ {[names[i] for i in combo]}: API {api} != bitset {expected}")
+    return mismatches
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Compile medication_cyp_profile into a bitset matrix')
+    parser.add_argument('--seed', default=MASTER_SEED, help='master seed to replay (default: repo seed)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH, help='JSON artifact to write')
+    parser.add_argument('--check', action='store_true',
+                        help='only verify that --output matches the current profiles (exit 1 if stale)')
+    parser.add_argument('--samples', type=int, default=20000, help='random requests to cross-check')
+    parser.add_argument('--random-seed', type=int, default=42)
+    parser.add_argument('--api', help='base URL of a running server to compare against, e.g. http://localhost:3000')
+    parser.add_argument('--api-samples', type=int, default=25, help='requests to send with --api')
+    args = parser.parse_args()
+
+    conn = build_local_replica(files=replay_files(seed_path=args.seed))
+    rows = [tuple(row) for row in conn.execute(PROFILE_QUERY)]
+    source_hash = profiles_hash(rows)
+
+    if args.check:
+        conn.close()
+        if read_artifact_hash(args.output) != source_hash:
+            print(f"❌ {os.path.relpath(args.output, REPO_ROOT)} is missing or stale - run scripts/build_cyp_matrix.py")
+            sys.exit(1)
+        print(f"✅ {os.path.relpath(args.output, REPO_ROOT)} is up to date ({source_hash[:12]})")
+        return
+
+    names = dict(conn.execute("SELECT id, name FROM medications ORDER BY id").fetchall())
+    conn.close()
+    enzymes, masks = build_matrix(rows)
+    write_artifact(args.output, enzymes, masks, source_hash)
+    matrix = CypMatrix.load(args.output)
+
+    print("=" * 60)
+    print("MEDLESS CYP Interaction Matrix")
+    print("=" * 60)
+    print(f"Output: {args.output} ({os.path.getsize(args.output):,} bytes)")
+    print(f"- {len(rows)} profile rows -> {len(masks)} medication bitsets")
+    print(f"- {len(enzymes)} enzymes x {len(SLOTS)} slots = {len(enzymes) * len(SLOTS)} bits: {', '.join(enzymes)}")
+    print(f"- slower: {sum(bool(m & matrix.slower) for m in masks.values())} medications, "
+          f"faster: {sum(bool(m & matrix.faster) for m in masks.values())} medications")
+    print()
+
+    profiles: Dict[int, List[tuple]] = {}
+    for row in rows:
+        profiles.setdefault(row[0], []).append(row)
+    profiled = sorted(masks)
+    combos = list(combinations(profiled, list(names), args.samples, args.random_seed))
+    checked, mismatches, bitset_time, reference_time = check_reference(matrix, profiles, combos)
+    print(f"{'✅' if not mismatches else '❌'} bitset vs. row-based MDI: {mismatches} mismatches in {checked:,} "
+          f"requests (2^{len(profiled)} profiled subsets + {args.samples:,} random)")
+    print(f"   bitset {bitset_time * 1e6 / checked:.2f} µs/request, "
+          f"row-based {reference_time * 1e6 / checked:.2f} µs/request")
+
+    if args.api:
+        rng = random.Random(args.random_seed)
+        api_combos = [c for c in rng.sample(combos, min(args.api_samples, len(combos))) if c and -1 not in c]
+        api_mismatches = check_api(matrix, args.api.rstrip('/'), names, api_combos, timeout=15)
+        print(f"{'✅' if not api_mismatches else '❌'} bitset vs. {args.api}: "
+              f"{api_mismatches} mismatches in {len(api_combos)} requests")
+        mismatches += api_mismatches
+
+    sys.exit(1 if mismatches else 0)
+
+if __name__ == '__main__':
+    main()
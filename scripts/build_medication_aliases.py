@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+MEDLESS Medication Alias Builder
+Generates medication_aliases from the catalog and historic seed files and
+verifies with EXPLAIN QUERY PLAN that name resolution uses the unique index
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+import unicodedata
+from typing import Dict, List, Optional, Set, Tuple
+
+from build_reduction_factors import HASH_PREFIX, read_artifact_hash
+from generate_master_seed import SEED_TABLES, SeedWriter, escape_sql_string, parse_seed_file
+from local_replica import MASTER_SEED, MIGRATIONS_DIR, REPO_ROOT, build_local_replica, replay_files
+
+DEFAULT_OUTPUT_PATH = os.path.join(REPO_ROOT, 'medication_aliases.sql')
+TABLE = 'medication_aliases'
+ALIAS_INDEX = 'idx_medication_aliases_alias'
+
+# Lower value wins when two medications produce the same alias. Catalog
+# names and generic names share a tier: the catalog holds duplicate rows
+# (e.g. 'Rivaroxaban' next to Xarelto with generic_name 'Rivaroxaban'), and
+# a generic name must not resolve to a duplicate with looser limits
+SOURCE_PRIORITY = {
+    'name': 0,
+    'generic_name': 0,
+    'name_part': 1,
+    'seed_name': 2,
+    'seed_generic_name': 3,
+}
+
+# Columns of a resolved medication that shape the plan; an alias must not
+# change them against the LIKE lookup it replaces
+SAFETY_QUERY = """
+    SELECT m.id, m.category_id, mc.max_weekly_reduction_pct, mc.can_reduce_to_zero,
+           m.max_weekly_reduction_pct, m.can_reduce_to_zero
+    FROM medications m
+    LEFT JOIN medication_categories mc ON m.category_id = mc.id
+"""
+SAFETY_FIELDS = ['category_id', 'category max_weekly_reduction_pct', 'category can_reduce_to_zero',
+                 'max_weekly_reduction_pct', 'can_reduce_to_zero', 'CYP profiles']
+
+# Generated artifacts are outputs of the catalog, not alias sources
+GENERATED_FILES = {'medication_reduction_factors.sql', 'medication_aliases.sql'}
+
+UMLAUT_FOLDS = str.maketrans({'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss'})
+COMBINING_MARKS = re.compile('[\u0300-\u036f]')
+PARENTHESES_PATTERN = re.compile(r'^(.*?)\s*\(([^()]*)\)\s*$')
+
+# Same statements as lookupMedication (alias lookup, then LIKE fallback)
+ALIAS_LOOKUP = """
+    SELECT m.id FROM medication_aliases a
+    JOIN medications m ON m.id = a.medication_id
+    LEFT JOIN medication_categories mc ON m.category_id = mc.id
+    LEFT JOIN medication_reduction_factors rf ON rf.medication_id = m.id
+    WHERE a.alias = ?
+    LIMIT 1
+"""
+LIKE_LOOKUP = """
+    SELECT m.id FROM medications m
+    LEFT JOIN medication_categories mc ON m.category_id = mc.id
+    LEFT JOIN medication_reduction_factors rf ON rf.medication_id = m.id
+    WHERE m.name LIKE ? OR m.generic_name LIKE ?
+    LIMIT 1
+"""
+
+def normalize_alias(name: str, expand_umlauts: bool = True) -> str:
+    """Lowercase, single-space and fold umlauts/diacritics (mirrors normalizeMedicationAlias)"""
+    text = re.sub(r'\s+', ' ', unicodedata.normalize('NFKC', name).lower().strip())
+    if expand_umlauts:
+        text = text.translate(UMLAUT_FOLDS)
+    return COMBINING_MARKS.sub('', unicodedata.normalize('NFKD', text))
+
+def alias_keys(name: Optional[str]) -> List[str]:
+    """Umlaut-expanded (ä -> ae) and umlaut-stripped (ä -> a) keys of a name"""
+    if not name or not name.strip():
+        return []
+    return list(dict.fromkeys([normalize_alias(name), normalize_alias(name, expand_umlauts=False)]))
+
+def name_parts(name: str) -> List[str]:
+    """'Diazepam (Valium)' -> ['Diazepam', 'Valium']"""
+    match = PARENTHESES_PATTERN.match(name or '')
+    return [part for part in match.groups() if part.strip()] if match else []
+
+def _literal(value: str) -> Optional[str]:
+    """SQL literal from parse_seed_file -> Python string"""
+    if value == 'NULL':
+        return None
+    if value.startswith("'"):
+        return value[1:-1].replace("''", "'")
+    return value
+
+def seed_files() -> List[str]:
+    """All SQL files in the repo root and migrations/ except generated artifacts"""
+    paths = sorted(glob.glob(os.path.join(REPO_ROOT, '*.sql'))) + \
+        sorted(glob.glob(os.path.join(MIGRATIONS_DIR, '*.sql')))
+    return [path for path in paths if os.path.basename(path) not in GENERATED_FILES]
+
+def historic_names(paths: List[str], catalog: List[Tuple[int, str, str]]):
+    """Map medication rows of older seed files onto current medication ids
+
+    Rows with an id keep it if the generic name still matches; otherwise the
+    row is matched by name, then by generic name (lowest id wins).
+    """
+    by_id = {med_id: normalize_alias(generic or '') for med_id, _, generic in catalog}
+    by_name: Dict[str, int] = {}
+    by_generic: Dict[str, int] = {}
+    for med_id, name, generic in catalog:
+        by_name.setdefault(normalize_alias(name), med_id)
+        if generic:
+            by_generic.setdefault(normalize_alias(generic), med_id)
+
+    columns = SEED_TABLES['medications'][1]
+    id_index, name_index, generic_index = (columns.index(c) for c in ('id', 'name', 'generic_name'))
+    names, skipped, unmatched = [], [], 0
+    for path in paths:
+        try:
+            rows = parse_seed_file(path)['medications']
+        except ValueError as e:
+            skipped.append((os.path.relpath(path, REPO_ROOT), str(e)))
+            continue
+        for row in rows:
+            name, generic = _literal(row[name_index]), _literal(row[generic_index])
+            if not name:
+                continue
+            row_id = _literal(row[id_index])
+            generic_key = normalize_alias(generic or '')
+            if row_id is not None and by_id.get(int(float(row_id))) == generic_key:
+                med_id = int(float(row_id))
+            else:
+                med_id = by_name.get(normalize_alias(name)) or by_generic.get(generic_key)
+            if med_id is None:
+                unmatched += 1
+                continue
+            names.append((med_id, 'seed_name', name))
+            if generic:
+                names.append((med_id, 'seed_generic_name', generic))
+    return names, skipped, unmatched
+
+def build_aliases(catalog: List[Tuple[int, str, str]], extra_names: List[Tuple[int, str, str]],
+                  profiled: Set[int] = frozenset()):
+    """Resolve every alias key to one medication by (source priority, canonical row)
+
+    Among rows of the same priority the canonical row wins: one with CYP
+    profiles (profiled ids), then the lowest id - the row the LIKE lookup
+    returned before aliases existed.
+    """
+    candidates: Dict[str, set] = {}
+    names = []
+    for med_id, name, generic in catalog:
+        names.append((med_id, 'name', name))
+        names.append((med_id, 'generic_name', generic))
+        names.extend((med_id, 'name_part', part) for part in name_parts(name))
+    names.extend(extra_names)
+
+    for med_id, source, name in names:
+        for key in alias_keys(name):
+            candidates.setdefault(key, set()).add((SOURCE_PRIORITY[source], med_id not in profiled, med_id,
+                                                   list(SOURCE_PRIORITY).index(source), source))
+
+    aliases, ambiguous = {}, []
+    for key, options in sorted(candidates.items()):
+        best = min(options)
+        aliases[key] = (best[2], best[4])
+        tied = {med_id for priority, _, med_id, _, _ in options if priority == best[0]}
+        if len(tied) > 1:
+            ambiguous.append((key, sorted(tied)))
+    return aliases, ambiguous
+
+def write_artifact(path: str, aliases: Dict[str, Tuple[int, str]], source_hash: str) -> None:
+    """Write DELETE + chunked INSERTs for all aliases"""
+    with open(path, 'w', encoding='utf-8') as f:
+        writer = SeedWriter(f, multi_row=True)
+        writer.write(f"""-- ========================================================
+-- MEDLESS MEDICATION ALIASES (GENERATED)
+-- ========================================================
+-- Generated by scripts/build_medication_aliases.py from the
+-- catalog replica and the medication rows of all seed files
+-- Requires migration 020_create_medication_aliases.sql
+{HASH_PREFIX}{source_hash}
+-- ========================================================
+
+DELETE FROM {TABLE};
+
+""")
+        for alias, (med_id, source) in aliases.items():
+            writer.write_insert('INSERT', TABLE, ['alias', 'medication_id', 'source'],
+                                [escape_sql_string(alias), escape_sql_string(med_id), escape_sql_string(source)])
+        writer.flush()
+
+def sources_hash(catalog, paths: List[str]) -> str:
+    """sha256 over the catalog names and all alias source files"""
+    digest = hashlib.sha256(json.dumps(catalog, ensure_ascii=False).encode('utf-8'))
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def explain(conn, query: str, params) -> List[str]:
+    """EXPLAIN QUERY PLAN detail lines"""
+    return [row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params)]
+
+def safety_profiles(conn) -> Dict[int, tuple]:
+    """Category, limits and CYP profile set of every medication (SAFETY_FIELDS order)"""
+    profiles: Dict[int, set] = {}
+    for med_id, enzyme, role, effect in conn.execute(
+            "SELECT medication_id, cyp_enzyme, role, cbd_effect_on_reduction FROM medication_cyp_profile"):
+        profiles.setdefault(med_id, set()).add((enzyme, role, effect))
+    return {row[0]: tuple(row[1:]) + (frozenset(profiles.get(row[0], ())),)
+            for row in conn.execute(SAFETY_QUERY)}
+
+def verify(conn, catalog) -> bool:
+    """Print query plans and compare LIKE vs. alias resolution for every catalog name and generic name
+
+    Returns False if the alias index is unused or if an alias resolves a name
+    to a different row than LIKE did among rows carrying that exact name, with
+    a different category, limits or CYP profile set.
+    """
+    alias_plan = explain(conn, ALIAS_LOOKUP, ('marcumar',))
+    like_plan = explain(conn, LIKE_LOOKUP, ('%Marcumar%', '%Marcumar%'))
+    print("EXPLAIN QUERY PLAN (alias lookup):")
+    for line in alias_plan:
+        print(f"  {line}")
+    print("EXPLAIN QUERY PLAN (LIKE '%name%'):")
+    for line in like_plan:
+        print(f"  {line}")
+    uses_index = any(ALIAS_INDEX in line and 'alias=?' in line for line in alias_plan)
+    print(f"{'✅' if uses_index else '❌'} alias lookup {'uses' if uses_index else 'does NOT use'} {ALIAS_INDEX}")
+
+    print()
+    safety = safety_profiles(conn)
+    exact: Dict[str, set] = {}
+    for med_id, name, generic in catalog:
+        for text in [name, generic] + name_parts(name):
+            for key in alias_keys(text):
+                exact.setdefault(key, set()).add(med_id)
+    inputs = list(dict.fromkeys(text for _, name, generic in catalog for text in (name, generic) if text))
+    resolved, like_differs, regressions = 0, [], []
+    for text in inputs:
+        key = normalize_alias(text)
+        new = conn.execute(ALIAS_LOOKUP, (key,)).fetchone()
+        old = conn.execute(LIKE_LOOKUP, (f"%{text}%", f"%{text}%")).fetchone()
+        resolved += new is not None and new[0] in exact.get(key, ())
+        if old is None or new is None or old[0] == new[0]:
+            continue
+        like_differs.append((text, old[0], new[0]))
+        # LIKE matched a substring of another name (Citalopram -> Escitalopram): the alias fixes that
+        if old[0] not in exact.get(key, ()):
+            continue
+        changed = [field for field, a, b in zip(SAFETY_FIELDS, safety[old[0]], safety[new[0]]) if a != b]
+        if changed:
+            regressions.append((text, old[0], new[0], changed))
+    print(f"Catalog names and generic names resolved to a row of that name by alias: {resolved}/{len(inputs)}")
+    print(f"Names the LIKE lookup resolves to a different medication: {len(like_differs)}")
+    for text, old_id, new_id in like_differs[:10]:
+        print(f"  {text}: LIKE -> id {old_id}, alias -> id {new_id}")
+    if regressions:
+        print(f"❌ {len(regressions)} names resolve to a duplicate row with different safety fields:")
+        for text, old_id, new_id, changed in regressions:
+            print(f"  {text}: id {old_id} -> id {new_id} ({', '.join(changed)})")
+    else:
+        print("✅ No alias changes category, limits or CYP profiles of a duplicate name")
+    return uses_index and not regressions
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Generate medication_aliases and verify indexed lookups')
+    parser.add_argument('--seed', default=MASTER_SEED, help='master seed to replay (default: repo seed)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH, help='SQL artifact to write')
+    parser.add_argument('--check', action='store_true',
+                        help='only verify that --output matches the current sources (exit 1 if stale)')
+    args = parser.parse_args()
+
+    conn = build_local_replica(files=replay_files(seed_path=args.seed))
+    catalog = [tuple(row) for row in conn.execute("SELECT id, name, generic_name FROM medications ORDER BY id")]
+    paths = seed_files()
+    source_hash = sources_hash(catalog, paths)
+
+    if args.check:
+        conn.close()
+        if read_artifact_hash(args.output) != source_hash:
+            print(f"❌ {os.path.relpath(args.output, REPO_ROOT)} is missing or stale - "
+                  f"run scripts/build_medication_aliases.py")
+            sys.exit(1)
+        print(f"✅ {os.path.relpath(args.output, REPO_ROOT)} is up to date ({source_hash[:12]})")
+        return
+
+    print("=" * 60)
+    print("MEDLESS Medication Aliases")
+    print("=" * 60)
+    extra_names, skipped, unmatched = historic_names(paths, catalog)
+    profiled = {row[0] for row in conn.execute("SELECT DISTINCT medication_id FROM medication_cyp_profile")}
+    aliases, ambiguous = build_aliases(catalog, extra_names, profiled)
+    write_artifact(args.output, aliases, source_hash)
+
+    by_source: Dict[str, int] = {}
+    for _, source in aliases.values():
+        by_source[source] = by_source.get(source, 0) + 1
+    print(f"Output: {args.output}")
+    print(f"- {len(aliases)} aliases for {len({m for m, _ in aliases.values()})} medications")
+    for source in SOURCE_PRIORITY:
+        print(f"  {source}: {by_source.get(source, 0)}")
+    print(f"- {len(extra_names)} historic names from {len(paths) - len(skipped)} seed files "
+          f"({unmatched} rows without a current medication)")
+    for path, error in skipped:
+        print(f"  skipped {path}: {error}")
+    if ambiguous:
+        print(f"- {len(ambiguous)} aliases shared by several medications (canonical row wins), e.g.:")
+        for key, ids in ambiguous[:5]:
+            print(f"  '{key}': ids {ids}")
+    print()
+
+    with open(args.output, 'r', encoding='utf-8') as f:
+        conn.executescript(f.read())
+    verified = verify(conn, catalog)
+    conn.close()
+    sys.exit(0 if verified else 1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+MEDLESS Reduction Factor Builder
+Precomputes the catalog-only reduction factors into medication_reduction_factors
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+
+from generate_master_seed import SeedWriter, escape_sql_string
+from local_replica import MASTER_SEED, REPO_ROOT, build_local_replica, replay_files
+from reduction_engine import CATALOG_QUERY, load_catalog, medication_factors
+
+DEFAULT_OUTPUT_PATH = os.path.join(REPO_ROOT, 'medication_reduction_factors.sql')
+TABLE = 'medication_reduction_factors'
+HASH_PREFIX = '-- Catalog hash: '
+
+# Table column -> key of reduction_engine.medication_factors()
+FACTOR_COLUMNS = {
+    'half_life_factor': 'half_life_factor',
+    'cyp_factor': 'cyp_factor',
+    'therapeutic_window_factor': 'therapeutic_factor',
+    'withdrawal_factor': 'withdrawal_factor',
+}
+
+# Catalog inputs of the factors, in catalog_key order
+KEY_COLUMNS = ['half_life_hours', 'therapeutic_min_ng_ml', 'therapeutic_max_ng_ml', 'withdrawal_risk_score']
+
+def _js_string(value: float) -> str:
+    """Number as JavaScript String() prints it, '' for NULL"""
+    if math.isnan(value):
+        return ''
+    return str(int(value)) if value.is_integer() else repr(value)
+
+def catalog_key(catalog, i: int) -> str:
+    """Inputs row i was built from; must match getReductionFactorKey() in src/index.tsx"""
+    fields = [_js_string(float(catalog[column][i])) for column in KEY_COLUMNS]
+    profiles = f"{int(catalog['slower_profiles'][i] > 0)}{int(catalog['faster_profiles'][i] > 0)}"
+    return '|'.join(fields + [profiles])
+
+def catalog_hash(conn) -> str:
+    """sha256 over every catalog input of the factors"""
+    rows = conn.execute(CATALOG_QUERY).fetchall()
+    return hashlib.sha256(json.dumps(rows, default=str).encode('utf-8')).hexdigest()
+
+def read_artifact_hash(path: str):
+    """Catalog hash recorded in an existing artifact (None if missing)"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.startswith(HASH_PREFIX):
+                return line[len(HASH_PREFIX):].strip()
+            if not line.startswith('--'):
+                break
+    return None
+
+def write_artifact(path: str, catalog, factors, source_hash: str, seed_path: str) -> int:
+    """Write DELETE + chunked INSERTs for every medication, return row count"""
+    columns = ['medication_id'] + list(FACTOR_COLUMNS) + ['catalog_key']
+    with open(path, 'w', encoding='utf-8') as f:
+        writer = SeedWriter(f, multi_row=True)
+        writer.write(f"""-- ========================================================
+-- MEDLESS REDUCTION FACTORS (GENERATED)
+-- ========================================================
+-- Generated by scripts/build_reduction_factors.py from
+-- {os.path.relpath(seed_path, REPO_ROOT)} + migrations/
+-- Requires migration 019_create_medication_reduction_factors.sql
+{HASH_PREFIX}{source_hash}
+-- ========================================================
+
+DELETE FROM {TABLE};
+
+""")
+        for i, medication_id in enumerate(catalog['id']):
+            values = [escape_sql_string(int(medication_id))]
+            values += [escape_sql_string(float(factors[key][i])) for key in FACTOR_COLUMNS.values()]
+            values.append(escape_sql_string(catalog_key(catalog, i)))
+            writer.write_insert('INSERT', TABLE, columns, values)
+        writer.flush()
+    return len(catalog['id'])
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Precompute per-medication reduction factors')
+    parser.add_argument('--seed', default=MASTER_SEED, help='master seed to replay (default: repo seed)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH, help='SQL artifact to write')
+    parser.add_argument('--check', action='store_true',
+                        help='only verify that --output matches the current catalog (exit 1 if stale)')
+    args = parser.parse_args()
+
+    conn = build_local_replica(files=replay_files(seed_path=args.seed))
+    source_hash = catalog_hash(conn)
+
+    if args.check:
+        recorded = read_artifact_hash(args.output)
+        conn.close()
+        if recorded != source_hash:
+            state = 'missing' if recorded is None else 'stale'
+            print(f"❌ {os.path.relpath(args.output, REPO_ROOT)} is {state} - "
+                  f"run scripts/build_reduction_factors.py")
+            sys.exit(1)
+        print(f"✅ {os.path.relpath(args.output, REPO_ROOT)} is up to date ({source_hash[:12]})")
+        return
+
+    catalog = load_catalog(conn)
+    conn.close()
+    factors = medication_factors(catalog)
+    count = write_artifact(args.output, catalog, factors, source_hash, args.seed)
+
+    print("=" * 60)
+    print("MEDLESS Reduction Factors")
+    print("=" * 60)
+    print(f"Output: {args.output}")
+    print(f"- {count} medications")
+    for column, key in FACTOR_COLUMNS.items():
+        adjusted = int((factors[key] != 1.0).sum())
+        print(f"- {column}: {adjusted} medications != 1.0")
+    print(f"Catalog hash: {source_hash[:12]}")
+    print()
+    print("Apply with:")
+    print(f"  npx wrangler d1 execute medless-production --remote --file={os.path.relpath(args.output, REPO_ROOT)}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+MEDLESS Catalog Snapshot Diff
+Loads catalog snapshots (wrangler export, seed SQL, SQLite, local replica,
+D1) concurrently and hash-joins them on their keys to report field-level
+differences per table
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from generate_master_seed import SEED_KEYS, SEED_TABLES, TABLE_QUERIES, parse_seed_file, run_wrangler_batch
+from local_replica import build_local_replica, replay_files
+
+TABLES = list(SEED_TABLES)
+
+# Autoincrement ids differ between environments, so rows are joined on the
+# seed keys (id for medications/categories, natural keys for the rest)
+KEYS = SEED_KEYS
+
+Rows = Tuple[List[str], List[tuple]]
+
+class Snapshot(NamedTuple):
+    """Rows per table of one source"""
+    label: str
+    source: str
+    tables: Dict[str, Rows]
+    seconds: float
+
+class TableDiff(NamedTuple):
+    """Differences of one table between a baseline and another snapshot"""
+    table: str
+    only_left: List[tuple]
+    only_right: List[tuple]
+    changed: Dict[tuple, List[Tuple[str, object, object]]]
+    regrouped: Dict[tuple, Tuple[List[tuple], List[tuple]]]
+    missing_columns: Tuple[List[str], List[str]]
+    compared: int
+    key: List[str]
+    null_keys: Tuple[int, int]     # rows per side with a NULL key column, left out of the join
+
+    @property
+    def count(self) -> int:
+        return len(self.only_left) + len(self.only_right) + len(self.changed) + len(self.regrouped) + \
+            sum(self.null_keys)
+
+def normalize(value):
+    """Canonical value across sources: 40.0 == 40, True == 1"""
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+def sql_literal(token: str):
+    """SQL literal token from parse_seed_file -> Python value"""
+    if token.upper() == 'NULL':
+        return None
+    if token.startswith("'"):
+        return token[1:-1].replace("''", "'")
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+def _from_dicts(table: str, records: List[dict]) -> Rows:
+    """Seed columns present in the records (exports may carry fewer)"""
+    present = set().union(*(record.keys() for record in records)) if records else set()
+    columns = [c for c in SEED_TABLES[table][1] if c in present]
+    return columns, [tuple(normalize(record.get(c)) for c in columns) for record in records]
+
+def load_sqlite(conn: sqlite3.Connection) -> Dict[str, Rows]:
+    """Seed columns of every catalog table in a SQLite database"""
+    tables = {}
+    for table in TABLES:
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if not existing:
+            continue
+        columns = [c for c in SEED_TABLES[table][1] if c in existing]
+        rows = conn.execute(f"SELECT {', '.join(columns)} FROM {table}").fetchall()
+        tables[table] = (columns, [tuple(normalize(v) for v in row) for row in rows])
+    return tables
+
+def load_seed(path: str) -> Dict[str, Rows]:
+    """INSERT rows of a seed file (UPDATE/DELETE statements are not applied)"""
+    parsed = parse_seed_file(path)
+    return {table: (SEED_TABLES[table][1], [tuple(normalize(sql_literal(v)) for v in row) for row in rows])
+            for table, rows in parsed.items() if rows}
+
+def load_export(path: str, table: Optional[str]) -> Dict[str, Rows]:
+    """wrangler --json output: one result set per TABLE_QUERIES entry, or a single table"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        return {name: _from_dicts(name, records) for name, records in data.items() if name in SEED_TABLES}
+    result_sets = [entry['results'] for entry in data]
+    if len(result_sets) == 1:
+        return {table or 'medications': _from_dicts(table or 'medications', result_sets[0])}
+    if len(result_sets) != len(TABLES):
+        raise ValueError(f"{path}: {len(result_sets)} result sets, expected 1 or {len(TABLES)} ({', '.join(TABLES)})")
+    return {name: _from_dicts(name, records) for name, records in zip(TABLES, result_sets)}
+
+def load_d1(location: str) -> Dict[str, Rows]:
+    """All seed tables from D1 in one wrangler invocation (location: remote or local)"""
+    result_sets = run_wrangler_batch([TABLE_QUERIES[table] for table in TABLES], location=location)
+    if result_sets is None:
+        raise RuntimeError(f"wrangler query against --{location} failed")
+    return {table: _from_dicts(table, records) for table, records in zip(TABLES, result_sets)}
+
+def load_source(spec: str) -> Snapshot:
+    """[label=]source with source one of:
+    replica[+patch.sql...], d1:remote, d1:local, *.sql, *.json[#table], *.sqlite/*.db
+    """
+    label, _, source = spec.rpartition('=') if '=' in spec else ('', '', spec)
+    label = label or source
+    start = time.perf_counter()
+    if source == 'replica' or source.startswith('replica+'):
+        patches = [p for p in source.split('+')[1:] if p]
+        conn = build_local_replica(files=replay_files() + [os.path.abspath(p) for p in patches])
+        tables = load_sqlite(conn)
+        conn.close()
+    elif source.startswith('d1:'):
+        tables = load_d1(source[3:])
+    else:
+        path, _, table = source.partition('#')
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"{path} does not exist")
+        if path.endswith('.sql'):
+            tables = load_seed(path)
+        elif path.endswith('.json'):
+            tables = load_export(path, table or None)
+        else:
+            conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+            tables = load_sqlite(conn)
+            conn.close()
+    return Snapshot(label, source, tables, time.perf_counter() - start)
+
+def _index(rows: List[tuple], key_positions: List[int], positions: List[int]) -> Tuple[Dict[tuple, List[tuple]], int]:
+    """Rows grouped by key, and the number of rows skipped for a NULL key column"""
+    index: Dict[tuple, List[tuple]] = {}
+    null_keys = 0
+    for row in rows:
+        row_key = tuple(row[i] for i in key_positions)
+        if None in row_key:
+            null_keys += 1
+            continue
+        index.setdefault(row_key, []).append(tuple(row[i] for i in positions))
+    return index, null_keys
+
+def diff_table(table: str, left: Rows, right: Rows, subset: bool = False,
+               key: Optional[List[str]] = None) -> TableDiff:
+    """Hash-join both sides on the table key (or a natural key such as name) and compare the shared columns
+
+    Keys that hold several rows (e.g. several interactions per medication)
+    are compared as multisets. With subset, rows only in the baseline are
+    ignored (the other side is a partial snapshot such as a patch). Rows
+    with a NULL key column (seed INSERTs without id) cannot be joined and
+    are only counted.
+    """
+    left_columns, left_rows = left
+    right_columns, right_rows = right
+    key = key or KEYS[table]
+    columns = [c for c in left_columns if c in right_columns]
+    missing = ([c for c in right_columns if c not in left_columns], [c for c in left_columns if c not in right_columns])
+    if not all(c in columns for c in key):
+        raise ValueError(f"{table}: key {key} missing on one side")
+
+    key_in_columns = [columns.index(c) for c in key]
+    right_index, right_nulls = _index(right_rows, [right_columns.index(c) for c in key],
+                                      [right_columns.index(c) for c in columns])
+    left_index, left_nulls = _index(left_rows, [left_columns.index(c) for c in key],
+                                    [left_columns.index(c) for c in columns])
+
+    only_left, changed, regrouped = [], {}, {}
+    for row_key, left_group in left_index.items():
+        right_group = right_index.pop(row_key, None)
+        if right_group is None:
+            if not subset:
+                only_left.append(row_key)
+            continue
+        if len(left_group) == 1 and len(right_group) == 1:
+            fields = [(column, a, b) for i, (column, a, b) in enumerate(zip(columns, left_group[0], right_group[0]))
+                      if a != b and i not in key_in_columns]
+            if fields:
+                changed[row_key] = fields
+        elif Counter(left_group) != Counter(right_group):
+            regrouped[row_key] = (left_group, right_group)
+    return TableDiff(table, only_left, list(right_index), changed, regrouped, missing, len(left_index), list(key),
+                     (left_nulls, right_nulls))
+
+def diff_snapshots(left: Snapshot, right: Snapshot, tables: List[str], subset: bool = False,
+                   keys: Optional[Dict[str, List[str]]] = None) -> List[TableDiff]:
+    """Per-table diffs for the tables both snapshots contain"""
+    keys = keys or {}
+    return [diff_table(table, left.tables[table], right.tables[table], subset, keys.get(table))
+            for table in tables if table in left.tables and table in right.tables]
+
+def _short(value, width: int = 40) -> str:
+    text = repr(value)
+    return text if len(text) <= width else text[:width - 3] + '...'
+
+def print_diff(left: Snapshot, right: Snapshot, diffs: List[TableDiff], limit: int):
+    """Print one baseline-vs-snapshot comparison"""
+    total = sum(d.count for d in diffs)
+    print(f"{'✅' if not total else '❌'} {left.label} vs. {right.label}: {total} differing keys")
+    skipped = [t for t in TABLES if t not in {d.table for d in diffs}]
+    if skipped:
+        print(f"   not in both snapshots: {', '.join(skipped)}")
+    for d in diffs:
+        if not d.count and not any(d.missing_columns):
+            continue
+        print(f"   {d.table}: {len(d.only_left)} only in {left.label}, {len(d.only_right)} only in {right.label}, "
+              f"{len(d.changed)} changed, {len(d.regrouped)} keys with different row sets "
+              f"({d.compared} keys compared on {', '.join(d.key)})")
+        for label, nulls in zip((left.label, right.label), d.null_keys):
+            if nulls:
+                print(f"     ⚠️  {nulls} rows in {label} have a NULL {'/'.join(d.key)} and were not compared "
+                      f"(use --key {d.table}=<natural key>, e.g. name)")
+        if any(d.missing_columns):
+            print(f"     columns only in {left.label}: {d.missing_columns[1] or '-'}; "
+                  f"only in {right.label}: {d.missing_columns[0] or '-'}")
+        per_column = Counter(column for fields in d.changed.values() for column, _, _ in fields)
+        if per_column:
+            print("     changed columns: " + ', '.join(f"{c} ({n})" for c, n in per_column.most_common()))
+        for row_key, fields in list(d.changed.items())[:limit]:
+            for column, a, b in fields:
+                print(f"     {row_key}: {column}: {_short(a)} -> {_short(b)}")
+        for label, keys in ((left.label, d.only_left), (right.label, d.only_right)):
+            if keys:
+                more = f" ... +{len(keys) - limit}" if len(keys) > limit else ''
+                print(f"     only in {label}: {sorted(keys)[:limit]}{more}")
+        for row_key, (a, b) in list(d.regrouped.items())[:limit]:
+            print(f"     {row_key}: {len(a)} rows -> {len(b)} rows")
+
+def to_json(left: Snapshot, right: Snapshot, diffs: List[TableDiff]) -> dict:
+    """Machine-readable form of one comparison"""
+    return {
+        'left': left.source, 'right': right.source,
+        'tables': {d.table: {
+            'only_left': d.only_left,
+            'only_right': d.only_right,
+            'changed': [{'key': list(k), 'fields': [{'column': c, 'left': a, 'right': b} for c, a, b in f]}
+                        for k, f in d.changed.items()],
+            'regrouped': [{'key': list(k), 'left': a, 'right': b} for k, (a, b) in d.regrouped.items()],
+            'columns_only_left': d.missing_columns[1],
+            'columns_only_right': d.missing_columns[0],
+            'key': d.key,
+            'null_key_rows': {'left': d.null_keys[0], 'right': d.null_keys[1]},
+        } for d in diffs},
+    }
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description='Diff catalog snapshots on their keys',
+        epilog='Sources: replica[+patch.sql], d1:remote, d1:local, seed .sql, wrangler .json[#table], '
+               '.sqlite/.db; prefix with label= to name them')
+    parser.add_argument('baseline', help='snapshot every other snapshot is compared against')
+    parser.add_argument('others', nargs='+', help='snapshots to compare')
+    parser.add_argument('--tables', default=','.join(TABLES), help='comma-separated tables to compare')
+    parser.add_argument('--subset', action='store_true', help='ignore rows missing from the other snapshots')
+    parser.add_argument('--key', action='append', default=[], metavar='TABLE=COLUMN[,COLUMN]',
+                        help='join TABLE on these columns instead of its seed key '
+                             '(e.g. medications=name for seed files without ids)')
+    parser.add_argument('--limit', type=int, default=10, help='examples to print per finding')
+    parser.add_argument('--json', help='write all differences to this file')
+    args = parser.parse_args()
+    tables = [t.strip() for t in args.tables.split(',') if t.strip()]
+    keys = {}
+    for spec in args.key:
+        table, _, columns = spec.partition('=')
+        if table not in SEED_TABLES or not columns:
+            parser.error(f"--key {spec}: expected TABLE=COLUMN[,COLUMN] with TABLE one of {', '.join(TABLES)}")
+        keys[table] = [c.strip() for c in columns.split(',') if c.strip()]
+
+    print("=" * 70)
+    print("MEDLESS CATALOG SNAPSHOT DIFF")
+    print("=" * 70)
+    start = time.perf_counter()
+    specs = [args.baseline] + args.others
+    with ThreadPoolExecutor(max_workers=len(specs)) as pool:
+        try:
+            snapshots = list(pool.map(load_source, specs))
+        except (OSError, ValueError, RuntimeError, sqlite3.Error) as e:
+            print(f"❌ {e}")
+            sys.exit(2)
+        for snapshot in snapshots:
+            rows = sum(len(rows) for _, rows in snapshot.tables.values())
+            print(f"- {snapshot.label}: {rows} rows in {len(snapshot.tables)} tables ({snapshot.seconds * 1000:.0f} ms)")
+        baseline = snapshots[0]
+        try:
+            results = list(pool.map(lambda other: diff_snapshots(baseline, other, tables, args.subset, keys),
+                                    snapshots[1:]))
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(2)
+    print(f"Loaded and compared in {time.perf_counter() - start:.2f}s")
+    print()
+
+    for other, diffs in zip(snapshots[1:], results):
+        print_diff(baseline, other, diffs, args.limit)
+        print()
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump([to_json(baseline, other, diffs) for other, diffs in zip(snapshots[1:], results)],
+                      f, indent=2, ensure_ascii=False, default=str)
+        print(f"Report: {args.json}")
+    sys.exit(1 if any(d.count for diffs in results for d in diffs) else 0)
+
+if __name__ == '__main__':
+    main()
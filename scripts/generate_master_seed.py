@@ -4,22 +4,122 @@ MEDLESS Master Seed Generator
 Generates 008_master_medless_full_seed_343.sql from REMOTE database
 """
 
+import argparse
+import hashlib
 import json
+import os
+import re
 import subprocess
 import sys
-from typing import Any, Dict, List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
-def run_wrangler_query(query: str) -> List[Dict[str, Any]]:
-    """Execute wrangler d1 query and return JSON results"""
+import profiling
+
+WEBAPP_DIR = '/home/user/webapp'
+DEFAULT_OUTPUT_PATH = '/home/user/webapp/migrations/008_master_medless_full_seed_343_GENERATED.sql'
+
+TABLE_QUERIES = {
+    'medication_categories': """
+    SELECT id, name, description, risk_level, can_reduce_to_zero, 
+           default_min_target_fraction, max_weekly_reduction_pct, 
+           requires_specialist, notes
+    FROM medication_categories 
+    ORDER BY id
+    """,
+    'medications': """
+    SELECT id, name, generic_name, category_id, cyp450_enzyme, description, 
+           common_dosage, half_life_hours, therapeutic_min_ng_ml, 
+           therapeutic_max_ng_ml, withdrawal_risk_score, max_weekly_reduction_pct, 
+           can_reduce_to_zero, cbd_interaction_strength
+    FROM medications 
+    ORDER BY id
+    """,
+    'cbd_interactions': """
+    SELECT medication_id, interaction_type, severity, description, 
+           mechanism, recommendation, source_url
+    FROM cbd_interactions 
+    ORDER BY medication_id
+    """,
+    'medication_cyp_profile': """
+    SELECT medication_id, cyp_enzyme, role, cbd_effect_on_reduction, note
+    FROM medication_cyp_profile 
+    ORDER BY medication_id, cyp_enzyme
+    """,
+}
+
+# Seed statement per table: (verb, columns), in file order
+SEED_TABLES = {
+    'medication_categories': ('INSERT OR REPLACE', [
+        'id', 'name', 'description', 'risk_level', 'can_reduce_to_zero',
+        'default_min_target_fraction', 'max_weekly_reduction_pct',
+        'requires_specialist', 'notes'
+    ]),
+    'medications': ('INSERT OR REPLACE', [
+        'id', 'name', 'generic_name', 'category_id', 'cyp450_enzyme', 'description',
+        'common_dosage', 'half_life_hours', 'therapeutic_min_ng_ml', 'therapeutic_max_ng_ml',
+        'withdrawal_risk_score', 'max_weekly_reduction_pct', 'can_reduce_to_zero',
+        'cbd_interaction_strength'
+    ]),
+    'cbd_interactions': ('INSERT OR IGNORE', [
+        'medication_id', 'interaction_type', 'severity', 'description',
+        'mechanism', 'recommendation', 'source_url'
+    ]),
+    'medication_cyp_profile': ('INSERT OR IGNORE', [
+        'medication_id', 'cyp_enzyme', 'role', 'cbd_effect_on_reduction', 'note'
+    ]),
+}
+
+SEED_HEADER = """-- ========================================================
+-- MEDLESS MASTER SEED FILE (GENERATED)
+-- ========================================================
+-- Project: MEDLESS - Medication Reduction Planning System
+-- Purpose: Master data seed for production state
+-- Generated: Automatically from REMOTE/Production database
+-- Target: medless-production (Cloudflare D1)
+-- ========================================================
+-- 
+-- IDEMPOTENT: This file can be executed multiple times safely
+-- - Uses INSERT OR REPLACE for medications and categories
+-- - Uses INSERT OR IGNORE for interactions and CYP profiles
+-- 
+-- PREREQUISITES:
+-- - Schema migrations 0001-0007 must be applied first
+-- - CYP profile table migration (010) must be applied first
+-- 
+-- ========================================================
+
+"""
+
+# Row identity for delta seeds. Interactions and CYP profiles have no stable
+# id in the seed, so their rows are compared as groups under this key.
+SEED_KEYS = {
+    'medication_categories': ['id'],
+    'medications': ['id'],
+    'cbd_interactions': ['medication_id'],
+    'medication_cyp_profile': ['medication_id', 'cyp_enzyme'],
+}
+
+# D1 caps a single SQL statement at 100 KB; keep a margin for the statement
+# prefix. Values are inlined literals, so the 100 bound-parameter limit of
+# prepared statements does not apply to seed files.
+D1_MAX_STATEMENT_BYTES = 90 * 1024
+DEFAULT_MAX_ROWS_PER_STATEMENT = 250
+
+def run_wrangler_query(query: str, strict: bool = False) -> List[Dict[str, Any]]:
+    """Execute wrangler d1 query and return JSON results (strict: raise instead of [])"""
     cmd = [
         'npx', 'wrangler', 'd1', 'execute', 'medless-production',
         '--remote', '--command', query, '--json'
     ]
     
-    result = subprocess.run(cmd, capture_output=True, text=True, cwd='/home/user/webapp')
+    result = subprocess.run(cmd, capture_output=True, text=True, cwd=WEBAPP_DIR)
     
     if result.returncode != 0:
         print(f"Error executing query: {result.stderr}", file=sys.stderr)
+        if strict:
+            raise RuntimeError(f"wrangler exited with code {result.returncode}")
         return []
     
     try:
@@ -27,8 +127,71 @@ def run_wrangler_query(query: str) -> List[Dict[str, Any]]:
         return data[0]['results'] if data and len(data) > 0 else []
     except (json.JSONDecodeError, KeyError, IndexError) as e:
         print(f"Error parsing JSON: {e}", file=sys.stderr)
+        if strict:
+            raise RuntimeError(f"Unreadable wrangler output: {e}") from e
         return []
 
+def run_wrangler_batch(queries: List[str], location: str = 'remote') -> Optional[List[List[Dict[str, Any]]]]:
+    """Execute several queries in one wrangler invocation, one result set per query (location: remote/local)"""
+    command = ';\n'.join(query.strip().rstrip(';') for query in queries)
+    cmd = [
+        'npx', 'wrangler', 'd1', 'execute', 'medless-production',
+        f'--{location}', '--command', command, '--json'
+    ]
+    
+    result = subprocess.run(cmd, capture_output=True, text=True, cwd=WEBAPP_DIR)
+    
+    if result.returncode != 0:
+        print(f"Error executing batch: {result.stderr}", file=sys.stderr)
+        return None
+    
+    try:
+        data = json.loads(result.stdout)
+        result_sets = [entry['results'] for entry in data]
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        print(f"Error parsing batch JSON: {e}", file=sys.stderr)
+        return None
+    
+    if len(result_sets) != len(queries):
+        print(f"Batch returned {len(result_sets)} result sets for {len(queries)} queries", file=sys.stderr)
+        return None
+    return result_sets
+
+def _timed_query(table: str, query: str):
+    """Run one table query and return (table, rows, seconds)"""
+    start = time.perf_counter()
+    rows = run_wrangler_query(query)
+    return table, rows, time.perf_counter() - start
+
+def fetch_all_tables(mode: str = 'batch', workers: int = 4) -> Dict[str, List[Dict[str, Any]]]:
+    """Fetch all seed tables from REMOTE in one batch, a worker pool or one by one"""
+    tables = list(TABLE_QUERIES)
+    start = time.perf_counter()
+    
+    if mode == 'batch':
+        print(f"Fetching {len(tables)} tables from REMOTE in one wrangler invocation...")
+        result_sets = run_wrangler_batch([TABLE_QUERIES[table] for table in tables])
+        if result_sets is not None:
+            print(f"  batch: {time.perf_counter() - start:.2f}s")
+            return dict(zip(tables, result_sets))
+        print("Batch fetch failed, falling back to parallel queries...")
+        mode = 'parallel'
+    
+    if mode == 'parallel':
+        print(f"Fetching {len(tables)} tables from REMOTE with {workers} workers...")
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda table: _timed_query(table, TABLE_QUERIES[table]), tables))
+    else:
+        results = []
+        for table in tables:
+            print(f"Fetching {table} from REMOTE...")
+            results.append(_timed_query(table, TABLE_QUERIES[table]))
+    
+    for table, rows, seconds in results:
+        print(f"  {table}: {len(rows)} rows in {seconds:.2f}s")
+    print(f"  total wall-clock: {time.perf_counter() - start:.2f}s")
+    return {table: rows for table, rows, _ in results}
+
 def escape_sql_string(value: Any) -> str:
     """Escape SQL string values"""
     if value is None:
@@ -41,213 +204,416 @@ def escape_sql_string(value: Any) -> str:
         return f"'{escaped}'"
     return str(value)
 
-def generate_medication_categories(output_file):
-    """Generate medication_categories INSERT statements"""
-    print("Fetching medication_categories from REMOTE...")
+class SeedWriter:
+    """Write seed statements one row per INSERT or as chunked multi-row INSERTs"""
     
-    query = """
-    SELECT id, name, description, risk_level, can_reduce_to_zero, 
-           default_min_target_fraction, max_weekly_reduction_pct, 
-           requires_specialist, notes
-    FROM medication_categories 
-    ORDER BY id
-    """
-    
-    categories = run_wrangler_query(query)
-    
-    output_file.write("\n-- ========================================================\n")
-    output_file.write(f"-- TABLE: medication_categories ({len(categories)} entries)\n")
-    output_file.write("-- ========================================================\n\n")
-    
-    for cat in categories:
-        values = [
-            str(cat['id']),
-            escape_sql_string(cat['name']),
-            escape_sql_string(cat.get('description')),
-            escape_sql_string(cat.get('risk_level')),
-            escape_sql_string(cat.get('can_reduce_to_zero')),
-            escape_sql_string(cat.get('default_min_target_fraction')),
-            escape_sql_string(cat.get('max_weekly_reduction_pct')),
-            escape_sql_string(cat.get('requires_specialist')),
-            escape_sql_string(cat.get('notes'))
-        ]
+    def __init__(self, output_file, multi_row: bool = False,
+                 max_statement_bytes: int = D1_MAX_STATEMENT_BYTES,
+                 max_rows: int = DEFAULT_MAX_ROWS_PER_STATEMENT,
+                 transactions: bool = False):
+        self.output_file = output_file
+        self.multi_row = multi_row
+        self.max_statement_bytes = max_statement_bytes
+        self.max_rows = max_rows
+        self.transactions = transactions
+        self.pending_prefix = None
+        self.pending_rows: List[str] = []
+        self.pending_bytes = 0
+        self.in_transaction = False
+        # Statement count and UTF-8 size of the output vs. one INSERT per row
+        self.stats = {
+            'statements': 0, 'statement_bytes': 0,
+            'single_row_statements': 0, 'single_row_bytes': 0,
+            'file_bytes': 0
+        }
+    
+    def write(self, text: str):
+        """Write raw text (comments, headers) after any pending statement"""
+        self.flush()
+        self._emit(text)
+    
+    def _emit(self, text: str, statement: bool = False):
+        size = len(text.encode('utf-8'))
+        self.output_file.write(text)
+        self.stats['file_bytes'] += size
+        if statement:
+            self.stats['statements'] += 1
+            self.stats['statement_bytes'] += size
+    
+    def write_insert(self, verb: str, table: str, columns: List[str], values: List[str]):
+        """Queue one row; flushes whenever a chunk limit would be exceeded"""
+        prefix = f"{verb} INTO {table} ({', '.join(columns)})\n"
+        row = f"({', '.join(values)})"
+        single_row_statement = f"{prefix}VALUES {row};\n\n"
+        self.stats['single_row_statements'] += 1
+        self.stats['single_row_bytes'] += len(single_row_statement.encode('utf-8'))
+        
+        if not self.multi_row:
+            self._emit(single_row_statement, statement=True)
+            return
         
-        output_file.write(
-            f"INSERT OR REPLACE INTO medication_categories "
-            f"(id, name, description, risk_level, can_reduce_to_zero, "
-            f"default_min_target_fraction, max_weekly_reduction_pct, "
-            f"requires_specialist, notes)\n"
-            f"VALUES ({', '.join(values)});\n\n"
-        )
+        if self.transactions and not self.in_transaction:
+            self._emit("BEGIN TRANSACTION;\n\n")
+            self.in_transaction = True
+        
+        row_bytes = len(row.encode('utf-8')) + 4  # "  " indent plus ",\n" / ";\n"
+        if self.pending_rows and (
+            prefix != self.pending_prefix
+            or len(self.pending_rows) >= self.max_rows
+            or self.pending_bytes + row_bytes > self.max_statement_bytes
+        ):
+            self._flush_statement()
+        if not self.pending_rows:
+            self.pending_prefix = prefix
+            self.pending_bytes = len(prefix.encode('utf-8')) + len("VALUES\n")
+        self.pending_rows.append(row)
+        self.pending_bytes += row_bytes
+    
+    def _flush_statement(self):
+        if not self.pending_rows:
+            return
+        self._emit(f"{self.pending_prefix}VALUES\n  " + ",\n  ".join(self.pending_rows) + ";\n\n",
+                   statement=True)
+        self.pending_rows = []
+        self.pending_bytes = 0
     
-    return len(categories)
+    def flush(self):
+        """Write any pending multi-row statement and close an open transaction"""
+        self._flush_statement()
+        if self.in_transaction:
+            self._emit("COMMIT;\n\n")
+            self.in_transaction = False
 
-def generate_medications(output_file):
-    """Generate medications INSERT statements"""
-    print("Fetching medications from REMOTE...")
+def _generate_table(writer: SeedWriter, table: str, rows: List[Dict[str, Any]]) -> int:
+    """Write one table section of the seed file"""
+    verb, columns = SEED_TABLES[table]
     
-    query = """
-    SELECT id, name, generic_name, category_id, cyp450_enzyme, description, 
-           common_dosage, half_life_hours, therapeutic_min_ng_ml, 
-           therapeutic_max_ng_ml, withdrawal_risk_score, max_weekly_reduction_pct, 
-           can_reduce_to_zero, cbd_interaction_strength
-    FROM medications 
-    ORDER BY id
-    """
-    
-    medications = run_wrangler_query(query)
-    
-    output_file.write("\n-- ========================================================\n")
-    output_file.write(f"-- TABLE: medications ({len(medications)} entries)\n")
-    output_file.write("-- ========================================================\n\n")
-    
-    for med in medications:
-        values = [
-            str(med['id']),
-            escape_sql_string(med['name']),
-            escape_sql_string(med.get('generic_name')),
-            escape_sql_string(med.get('category_id')),
-            escape_sql_string(med.get('cyp450_enzyme')),
-            escape_sql_string(med.get('description')),
-            escape_sql_string(med.get('common_dosage')),
-            escape_sql_string(med.get('half_life_hours')),
-            escape_sql_string(med.get('therapeutic_min_ng_ml')),
-            escape_sql_string(med.get('therapeutic_max_ng_ml')),
-            escape_sql_string(med.get('withdrawal_risk_score')),
-            escape_sql_string(med.get('max_weekly_reduction_pct')),
-            escape_sql_string(med.get('can_reduce_to_zero')),
-            escape_sql_string(med.get('cbd_interaction_strength'))
-        ]
-        
-        output_file.write(
-            f"INSERT OR REPLACE INTO medications "
-            f"(id, name, generic_name, category_id, cyp450_enzyme, description, "
-            f"common_dosage, half_life_hours, therapeutic_min_ng_ml, therapeutic_max_ng_ml, "
-            f"withdrawal_risk_score, max_weekly_reduction_pct, can_reduce_to_zero, "
-            f"cbd_interaction_strength)\n"
-            f"VALUES ({', '.join(values)});\n\n"
-        )
-    
-    return len(medications)
-
-def generate_cbd_interactions(output_file):
+    writer.write("\n-- ========================================================\n")
+    writer.write(f"-- TABLE: {table} ({len(rows)} entries)\n")
+    writer.write("-- ========================================================\n\n")
+    
+    for row in rows:
+        values = [escape_sql_string(row.get(column)) for column in columns]
+        writer.write_insert(verb, table, columns, values)
+    writer.flush()
+    
+    return len(rows)
+
+def generate_medication_categories(writer: SeedWriter, categories: Optional[List[Dict[str, Any]]] = None):
+    """Generate medication_categories INSERT statements"""
+    if categories is None:
+        print("Fetching medication_categories from REMOTE...")
+        categories = run_wrangler_query(TABLE_QUERIES['medication_categories'])
+    return _generate_table(writer, 'medication_categories', categories)
+
+def generate_medications(writer: SeedWriter, medications: Optional[List[Dict[str, Any]]] = None):
+    """Generate medications INSERT statements"""
+    if medications is None:
+        print("Fetching medications from REMOTE...")
+        medications = run_wrangler_query(TABLE_QUERIES['medications'])
+    return _generate_table(writer, 'medications', medications)
+
+def generate_cbd_interactions(writer: SeedWriter, interactions: Optional[List[Dict[str, Any]]] = None):
     """Generate cbd_interactions INSERT statements"""
-    print("Fetching cbd_interactions from REMOTE...")
+    if interactions is None:
+        print("Fetching cbd_interactions from REMOTE...")
+        interactions = run_wrangler_query(TABLE_QUERIES['cbd_interactions'])
+    return _generate_table(writer, 'cbd_interactions', interactions)
+
+def generate_cyp_profiles(writer: SeedWriter, profiles: Optional[List[Dict[str, Any]]] = None):
+    """Generate medication_cyp_profile INSERT statements"""
+    if profiles is None:
+        print("Fetching medication_cyp_profile from REMOTE...")
+        profiles = run_wrangler_query(TABLE_QUERIES['medication_cyp_profile'])
+    return _generate_table(writer, 'medication_cyp_profile', profiles)
+
+def write_seed_footer(writer: SeedWriter, cat_count: int, med_count: int, int_count: int, cyp_count: int):
+    """Write the summary footer of the master seed"""
+    writer.write("\n-- ========================================================\n")
+    writer.write("-- END OF MASTER SEED FILE\n")
+    writer.write("-- ========================================================\n")
+    writer.write(f"-- SUMMARY:\n")
+    writer.write(f"-- - {cat_count} medication_categories\n")
+    writer.write(f"-- - {med_count} medications\n")
+    writer.write(f"-- - {int_count} cbd_interactions\n")
+    writer.write(f"-- - {cyp_count} medication_cyp_profile entries\n")
+    writer.write("-- ========================================================\n")
+
+def iter_table_pages(table: str, page_size: int, after_id: Optional[int] = None):
+    """Yield (rows, last_id) pages of a table using keyset pagination on id"""
+    columns = SEED_TABLES[table][1]
+    select = columns if 'id' in columns else ['id'] + columns
+    while True:
+        where = f"WHERE id > {int(after_id)} " if after_id is not None else ""
+        query = f"SELECT {', '.join(select)} FROM {table} {where}ORDER BY id LIMIT {int(page_size)}"
+        rows = run_wrangler_query(query, strict=True)
+        if not rows:
+            return
+        after_id = rows[-1]['id']
+        yield rows, after_id
+        if len(rows) < page_size:
+            return
+
+def _save_progress(progress_path: str, progress: Dict[str, Any]):
+    """Atomically record export progress"""
+    tmp_path = progress_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(progress, f, indent=2)
+    os.replace(tmp_path, progress_path)
+
+def export_paginated(output_path: str, args) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Stream the master seed page by page, resumable via <output>.progress.json"""
+    progress_path = output_path + '.progress.json'
     
-    query = """
-    SELECT medication_id, interaction_type, severity, description, 
-           mechanism, recommendation, source_url
-    FROM cbd_interactions 
-    ORDER BY medication_id
-    """
-    
-    interactions = run_wrangler_query(query)
-    
-    output_file.write("\n-- ========================================================\n")
-    output_file.write(f"-- TABLE: cbd_interactions ({len(interactions)} entries)\n")
-    output_file.write("-- ========================================================\n\n")
-    
-    for interaction in interactions:
-        values = [
-            escape_sql_string(interaction['medication_id']),
-            escape_sql_string(interaction.get('interaction_type')),
-            escape_sql_string(interaction.get('severity')),
-            escape_sql_string(interaction.get('description')),
-            escape_sql_string(interaction.get('mechanism')),
-            escape_sql_string(interaction.get('recommendation')),
-            escape_sql_string(interaction.get('source_url'))
-        ]
+    if args.resume and os.path.exists(progress_path):
+        with open(progress_path, 'r', encoding='utf-8') as f:
+            progress = json.load(f)
+        if progress['page_size'] != args.page_size or progress['multi_row'] != args.multi_row:
+            print("Error: --page-size/--multi-row differ from the interrupted export", file=sys.stderr)
+            sys.exit(1)
+        # Drop anything written after the last recorded page
+        os.truncate(output_path, progress['stats']['file_bytes'])
+        print(f"Resuming {progress['table'] or 'footer'} after id {progress['after_id']} "
+              f"({progress['stats']['file_bytes']:,} bytes kept)")
+    else:
+        expected = run_wrangler_query(
+            "SELECT " + ", ".join(f"(SELECT COUNT(*) FROM {table}) AS {table}" for table in SEED_TABLES),
+            strict=True
+        )[0]
+        progress = {
+            'page_size': args.page_size,
+            'multi_row': args.multi_row,
+            'expected': expected,
+            'counts': {},
+            'table': None,
+            'after_id': None,
+            'stats': None,
+        }
+    
+    with open(output_path, 'a' if progress['stats'] else 'w', encoding='utf-8') as f:
+        writer = SeedWriter(f, args.multi_row, args.max_statement_bytes, args.max_rows)
+        if progress['stats']:
+            writer.stats = progress['stats']
+        else:
+            writer.write(SEED_HEADER)
+        
+        for table in SEED_TABLES:
+            if table in progress['counts'] and progress['table'] != table:
+                continue
+            if progress['table'] != table:
+                progress.update(table=table, after_id=None)
+                progress['counts'][table] = 0
+                writer.write("\n-- ========================================================\n")
+                writer.write(f"-- TABLE: {table} ({progress['expected'][table]} entries)\n")
+                writer.write("-- ========================================================\n\n")
+            
+            verb, columns = SEED_TABLES[table]
+            for rows, last_id in iter_table_pages(table, args.page_size, progress['after_id']):
+                for row in rows:
+                    writer.write_insert(verb, table, columns,
+                                        [escape_sql_string(row.get(column)) for column in columns])
+                writer.flush()
+                f.flush()
+                progress['counts'][table] += len(rows)
+                progress.update(after_id=last_id, stats=writer.stats)
+                _save_progress(progress_path, progress)
+                print(f"  {table}: {progress['counts'][table]}/{progress['expected'][table]} rows "
+                      f"(id <= {last_id})")
         
-        output_file.write(
-            f"INSERT OR IGNORE INTO cbd_interactions "
-            f"(medication_id, interaction_type, severity, description, "
-            f"mechanism, recommendation, source_url)\n"
-            f"VALUES ({', '.join(values)});\n\n"
-        )
+        counts = progress['counts']
+        write_seed_footer(writer, counts['medication_categories'], counts['medications'],
+                          counts['cbd_interactions'], counts['medication_cyp_profile'])
     
-    return len(interactions)
+    os.remove(progress_path)
+    return counts, writer.stats
 
-def generate_cyp_profiles(output_file):
-    """Generate medication_cyp_profile INSERT statements"""
-    print("Fetching medication_cyp_profile from REMOTE...")
+INSERT_PATTERN = re.compile(
+    r"INSERT\s+(?:OR\s+\w+\s+)?INTO\s+(\w+)\s*\(([^)]*)\)\s*VALUES\s*", re.IGNORECASE)
+SQL_TOKEN_PATTERN = re.compile(
+    r"(?:\s|--[^\n]*)*('(?:[^']|'')*'|[(),;]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|[A-Za-z_]\w*)")
+
+def parse_seed_file(path: str) -> Dict[str, List[Tuple[str, ...]]]:
+    """Parse INSERT statements (one- or multi-row) into SQL literal tuples per table"""
+    with open(path, 'r', encoding='utf-8') as f:
+        sql = f.read()
     
-    query = """
-    SELECT medication_id, cyp_enzyme, role, cbd_effect_on_reduction, note
-    FROM medication_cyp_profile 
-    ORDER BY medication_id, cyp_enzyme
-    """
-    
-    profiles = run_wrangler_query(query)
-    
-    output_file.write("\n-- ========================================================\n")
-    output_file.write(f"-- TABLE: medication_cyp_profile ({len(profiles)} entries)\n")
-    output_file.write("-- ========================================================\n\n")
-    
-    for profile in profiles:
-        values = [
-            escape_sql_string(profile['medication_id']),
-            escape_sql_string(profile['cyp_enzyme']),
-            escape_sql_string(profile['role']),
-            escape_sql_string(profile.get('cbd_effect_on_reduction')),
-            escape_sql_string(profile.get('note'))
-        ]
+    tables: Dict[str, List[Tuple[str, ...]]] = {table: [] for table in SEED_TABLES}
+    pos = 0
+    while True:
+        match = INSERT_PATTERN.search(sql, pos)
+        if not match:
+            break
+        table = match.group(1)
+        columns = [column.strip() for column in match.group(2).split(',')]
+        pos = match.end()
         
-        output_file.write(
-            f"INSERT OR IGNORE INTO medication_cyp_profile "
-            f"(medication_id, cyp_enzyme, role, cbd_effect_on_reduction, note)\n"
-            f"VALUES ({', '.join(values)});\n\n"
-        )
+        row: List[str] = []
+        while True:
+            token_match = SQL_TOKEN_PATTERN.match(sql, pos)
+            if not token_match:
+                raise ValueError(f"Unparseable VALUES list in {path} at offset {pos}")
+            token = token_match.group(1)
+            pos = token_match.end()
+            if token == '(':
+                row = []
+            elif token == ')':
+                if table in tables:
+                    literals = dict(zip(columns, row))
+                    tables[table].append(tuple(literals.get(column, 'NULL') for column in SEED_TABLES[table][1]))
+            elif token == ';':
+                break
+            elif token != ',':
+                row.append(token)
+    return tables
+
+def _group_rows(table: str, rows: List[Tuple[str, ...]]) -> Dict[Tuple[str, ...], List[Tuple[str, ...]]]:
+    """Group literal rows by their seed key"""
+    columns = SEED_TABLES[table][1]
+    key_indexes = [columns.index(column) for column in SEED_KEYS[table]]
+    groups: Dict[Tuple[str, ...], List[Tuple[str, ...]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(row[i] for i in key_indexes), []).append(row)
+    return groups
+
+def _group_hash(rows: List[Tuple[str, ...]]) -> str:
+    """Content hash of a key group, independent of row order"""
+    return hashlib.sha256(json.dumps(sorted(rows), ensure_ascii=False).encode('utf-8')).hexdigest()
+
+def _format_rows(table: str, rows: List[Dict[str, Any]]) -> List[Tuple[str, ...]]:
+    """Format fetched rows as SQL literal tuples"""
+    columns = SEED_TABLES[table][1]
+    return [tuple(escape_sql_string(row.get(column)) for column in columns) for row in rows]
+
+def write_delta_seed(writer: SeedWriter, previous: Dict[str, List[Tuple[str, ...]]],
+                     tables: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Dict[str, int]]:
+    """Write the DELETEs and UPSERTs that converge the previous seed to the fetched tables"""
+    summary = {}
+    changes = {}
+    for table in SEED_TABLES:
+        old_groups = _group_rows(table, previous.get(table, []))
+        new_groups = _group_rows(table, _format_rows(table, tables[table]))
+        old_hashes = {key: _group_hash(rows) for key, rows in old_groups.items()}
+        changed = [key for key, rows in new_groups.items() if old_hashes.get(key) != _group_hash(rows)]
+        deleted = [key for key in old_groups if key not in new_groups]
+        changes[table] = (new_groups, changed, deleted)
+        summary[table] = {
+            'upserts': len(changed),
+            'deletes': len(deleted),
+            'unchanged': len(new_groups) - len(changed)
+        }
+    
+    def where(table, key):
+        return ' AND '.join(f"{column} = {literal}" for column, literal in zip(SEED_KEYS[table], key))
+    
+    # Children first for DELETEs, parents first for UPSERTs (foreign keys)
+    writer.write("\n-- ========================================================\n")
+    writer.write("-- DELETES\n")
+    writer.write("-- ========================================================\n\n")
+    for table in reversed(list(SEED_TABLES)):
+        _, _, deleted = changes[table]
+        for key in deleted:
+            writer.write(f"DELETE FROM {table} WHERE {where(table, key)};\n")
     
-    return len(profiles)
+    for table, (verb, columns) in SEED_TABLES.items():
+        new_groups, changed, _ = changes[table]
+        writer.write("\n-- ========================================================\n")
+        writer.write(f"-- UPSERTS: {table} ({len(changed)} changed)\n")
+        writer.write("-- ========================================================\n\n")
+        replaces_rows = verb == 'INSERT OR REPLACE'
+        for key in changed:
+            if not replaces_rows:
+                # Grouped rows have no primary key in the seed: replace the whole group
+                writer.write(f"DELETE FROM {table} WHERE {where(table, key)};\n")
+            for row in new_groups[key]:
+                writer.write_insert(verb, table, columns, list(row))
+            if not replaces_rows:
+                writer.flush()
+        writer.flush()
+    
+    return summary
 
 def main():
     """Main function"""
-    output_path = '/home/user/webapp/migrations/008_master_medless_full_seed_343_GENERATED.sql'
+    parser = argparse.ArgumentParser(description='Generate the MEDLESS master seed from REMOTE')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH, help='seed file to write')
+    parser.add_argument('--fetch', choices=['batch', 'parallel', 'sequential'], default='batch',
+                        help='batch: one wrangler call for all tables (default); '
+                             'parallel: one call per table on a worker pool; '
+                             'sequential: one call per table, one after another')
+    parser.add_argument('--workers', type=int, default=4, help='worker pool size for --fetch parallel')
+    parser.add_argument('--multi-row', action='store_true',
+                        help='group rows into multi-VALUES INSERT statements')
+    parser.add_argument('--max-statement-bytes', type=int, default=D1_MAX_STATEMENT_BYTES,
+                        help='size cap per multi-row statement (D1 limit: 100 KB)')
+    parser.add_argument('--max-rows', type=int, default=DEFAULT_MAX_ROWS_PER_STATEMENT,
+                        help='row cap per multi-row statement')
+    parser.add_argument('--transactions', action='store_true',
+                        help='wrap each table in BEGIN/COMMIT (local SQLite only; '
+                             'D1 rejects explicit transactions in executed SQL)')
+    parser.add_argument('--delta', nargs='?', const='', metavar='PREVIOUS_SEED',
+                        help='also write only the changes against PREVIOUS_SEED '
+                             '(default: the existing --output file)')
+    parser.add_argument('--delta-output', help='delta file to write (default: <output>_DELTA.sql)')
+    parser.add_argument('--page-size', type=int,
+                        help='stream each table in keyset pages of this many rows (ORDER BY id)')
+    parser.add_argument('--resume', action='store_true',
+                        help='continue an interrupted --page-size export from <output>.progress.json')
+    profiling.add_profile_arguments(parser)
+    args = parser.parse_args()
+    profiling.start('generate_master_seed', args)
+    output_path = args.output
+    
+    if args.page_size and (args.delta is not None or args.transactions):
+        parser.error('--page-size cannot be combined with --delta or --transactions')
+    if args.resume and not args.page_size:
+        parser.error('--resume requires --page-size')
     
     print("=" * 60)
     print("MEDLESS Master Seed Generator")
     print("=" * 60)
     print()
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        # Write header
-        f.write("""-- ========================================================
--- MEDLESS MASTER SEED FILE (GENERATED)
--- ========================================================
--- Project: MEDLESS - Medication Reduction Planning System
--- Purpose: Master data seed for production state
--- Generated: Automatically from REMOTE/Production database
--- Target: medless-production (Cloudflare D1)
--- ========================================================
--- 
--- IDEMPOTENT: This file can be executed multiple times safely
--- - Uses INSERT OR REPLACE for medications and categories
--- - Uses INSERT OR IGNORE for interactions and CYP profiles
--- 
--- PREREQUISITES:
--- - Schema migrations 0001-0007 must be applied first
--- - CYP profile table migration (010) must be applied first
--- 
--- ========================================================
-
-""")
-        
-        # Generate all tables
-        cat_count = generate_medication_categories(f)
-        med_count = generate_medications(f)
-        int_count = generate_cbd_interactions(f)
-        cyp_count = generate_cyp_profiles(f)
+    previous = None
+    if args.delta is not None:
+        previous_path = args.delta or output_path
+        if not os.path.exists(previous_path):
+            print(f"Error: previous seed {previous_path} not found", file=sys.stderr)
+            sys.exit(1)
+        # Parse before the full seed at output_path is rewritten
+        with profiling.phase('parse'):
+            previous = parse_seed_file(previous_path)
+        print(f"Previous seed: {previous_path}")
+    
+    if args.page_size:
+        print(f"Streaming tables from REMOTE in pages of {args.page_size} rows...")
+        try:
+            with profiling.phase('export'):
+                counts, stats = export_paginated(output_path, args)
+        except RuntimeError as e:
+            print(f"Export interrupted: {e}", file=sys.stderr)
+            print("Re-run with --resume to continue from the last completed page.", file=sys.stderr)
+            sys.exit(1)
+        cat_count, med_count, int_count, cyp_count = (counts[table] for table in SEED_TABLES)
+    else:
+        with profiling.phase('load'):
+            tables = fetch_all_tables(args.fetch, args.workers)
+        print()
         
-        # Write footer
-        f.write("\n-- ========================================================\n")
-        f.write("-- END OF MASTER SEED FILE\n")
-        f.write("-- ========================================================\n")
-        f.write(f"-- SUMMARY:\n")
-        f.write(f"-- - {cat_count} medication_categories\n")
-        f.write(f"-- - {med_count} medications\n")
-        f.write(f"-- - {int_count} cbd_interactions\n")
-        f.write(f"-- - {cyp_count} medication_cyp_profile entries\n")
-        f.write("-- ========================================================\n")
+        with profiling.phase('render'), open(output_path, 'w', encoding='utf-8') as f:
+            writer = SeedWriter(f, args.multi_row, args.max_statement_bytes, args.max_rows, args.transactions)
+            
+            # Write header
+            writer.write(SEED_HEADER)
+            
+            # Generate all tables
+            cat_count = generate_medication_categories(writer, tables['medication_categories'])
+            med_count = generate_medications(writer, tables['medications'])
+            int_count = generate_cbd_interactions(writer, tables['cbd_interactions'])
+            cyp_count = generate_cyp_profiles(writer, tables['medication_cyp_profile'])
+            
+            write_seed_footer(writer, cat_count, med_count, int_count, cyp_count)
+        stats = writer.stats
+    profiling.count('rows', cat_count + med_count + int_count + cyp_count)
     
     print()
     print("=" * 60)
@@ -257,6 +623,33 @@ def main():
     print(f"- {med_count} medications")
     print(f"- {int_count} cbd_interactions")
     print(f"- {cyp_count} medication_cyp_profile entries")
+    print(f"INSERT statements: {stats['single_row_statements']} (one per row) -> {stats['statements']}")
+    print(f"INSERT bytes:      {stats['single_row_bytes']:,} (one per row) -> {stats['statement_bytes']:,}")
+    print(f"File size:         {stats['file_bytes']:,} bytes")
+    
+    if previous is not None:
+        delta_path = args.delta_output or re.sub(r'(\.sql)?$', '_DELTA.sql', output_path, count=1)
+        with profiling.phase('delta'), open(delta_path, 'w', encoding='utf-8') as f:
+            delta_writer = SeedWriter(f, args.multi_row, args.max_statement_bytes, args.max_rows)
+            delta_writer.write("""-- ========================================================
+-- MEDLESS MASTER SEED DELTA (GENERATED)
+-- ========================================================
+-- Converges a database seeded from the previous master seed
+-- to the current REMOTE state. Apply after that seed.
+-- ========================================================
+""")
+            summary = write_delta_seed(delta_writer, previous, tables)
+        
+        print()
+        print(f"Delta: {delta_path}")
+        for table, counts in summary.items():
+            print(f"- {table}: {counts['upserts']} upserts, {counts['deletes']} deletes, "
+                  f"{counts['unchanged']} unchanged")
+    print()
+    print("Refresh the generated catalog artifacts for this seed:")
+    print(f"  python3 scripts/build_reduction_factors.py --seed {output_path}")
+    print(f"  python3 scripts/build_medication_aliases.py --seed {output_path}")
+    print(f"  python3 scripts/build_cyp_matrix.py --seed {output_path}")
     print("=" * 60)
 
 if __name__ == '__main__':
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+MEDLESS Local Catalog Replica
+Builds a local SQLite database by replaying migrations/ and the master seed,
+with optional per-file snapshots keyed by the content hash of the replay prefix
+"""
+
+import argparse
+import glob
+import hashlib
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from typing import List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MIGRATIONS_DIR = os.path.join(REPO_ROOT, 'migrations')
+DATABASE_DIR = os.path.join(REPO_ROOT, 'database')
+MASTER_SEED = os.path.join(REPO_ROOT, '008_master_medless_full_seed_343.sql')
+SNAPSHOT_DIR = os.path.join(REPO_ROOT, '.replica_cache')
+
+# Tools pick up the snapshot cache when this points to a directory
+SNAPSHOT_ENV = 'MEDLESS_REPLICA_CACHE'
+SNAPSHOT_VERSION = b'medless-replica-v1'
+MAX_SNAPSHOTS = 256
+
+# The master seed expects the schema of migrations 0001-0008 (see its
+# PREREQUISITES header); the later data migrations run on top of the seed.
+SEED_AFTER_MIGRATION = '0008_create_cyp_table.sql'
+
+# Indexes used by the data quality aggregates (not part of the D1 schema)
+AUDIT_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_audit_medications_category ON medications(category_id)",
+    "CREATE INDEX IF NOT EXISTS idx_audit_medications_half_life ON medications(half_life_hours)",
+    "CREATE INDEX IF NOT EXISTS idx_audit_medications_withdrawal ON medications(withdrawal_risk_score)",
+]
+
+def replay_files(migrations_dir: str = MIGRATIONS_DIR, seed_path: str = MASTER_SEED,
+                 database_dir: Optional[str] = None) -> List[str]:
+    """Return migration and seed files in replay order
+
+    database/00x_*.sql are the historic patches the master seed was exported
+    after; with database_dir they are replayed right before the seed.
+    """
+    migrations = sorted(
+        os.path.join(migrations_dir, name)
+        for name in os.listdir(migrations_dir)
+        if name.endswith('.sql')
+    )
+    names = [os.path.basename(path) for path in migrations]
+    split = names.index(SEED_AFTER_MIGRATION) + 1 if SEED_AFTER_MIGRATION in names else len(names)
+    patches = sorted(glob.glob(os.path.join(database_dir, '*.sql'))) if database_dir else []
+    return migrations[:split] + patches + [seed_path] + migrations[split:]
+
+def prefix_hashes(files: List[str]) -> List[str]:
+    """sha256 of every replay prefix: hashes[i] covers files[:i + 1] (names and contents)"""
+    digest = hashlib.sha256(SNAPSHOT_VERSION)
+    hashes = []
+    for path in files:
+        digest.update(os.path.basename(path).encode('utf-8') + b'\0')
+        with open(path, 'rb') as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+        hashes.append(digest.copy().hexdigest())
+    return hashes
+
+def _snapshot_path(snapshot_dir: str, prefix_hash: str) -> str:
+    return os.path.join(snapshot_dir, f"{prefix_hash}.sqlite")
+
+def _save_snapshot(conn: sqlite3.Connection, path: str) -> None:
+    """Copy the database to path (written to a unique temp file, then renamed)
+
+    Threads and processes replaying the same files may save the same
+    snapshot concurrently; their copies are identical, so any one may win.
+    """
+    fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(path))
+    os.close(fd)
+    try:
+        target = sqlite3.connect(tmp_path)
+        conn.backup(target)
+        target.close()
+        os.replace(tmp_path, path)
+    except OSError:
+        # os.replace onto a snapshot another writer holds open (Windows)
+        if not os.path.exists(path):
+            raise
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def prune_snapshots(snapshot_dir: str, keep: List[str] = (), limit: int = MAX_SNAPSHOTS) -> int:
+    """Delete the oldest snapshots beyond limit (never those in keep), return count removed"""
+    if not os.path.isdir(snapshot_dir):
+        return 0
+    keep_paths = {_snapshot_path(snapshot_dir, h) for h in keep}
+    paths = sorted(glob.glob(os.path.join(snapshot_dir, '*.sqlite')), key=os.path.getmtime, reverse=True)
+    stale = [p for p in paths if p not in keep_paths][max(0, limit - len(keep_paths)):]
+    for path in stale:
+        os.remove(path)
+    return len(stale)
+
+def replay_into(conn: sqlite3.Connection, files: List[str], snapshot_dir: Optional[str] = None) -> int:
+    """Replay files into conn, resuming from the longest cached prefix
+
+    Returns how many files were restored from a snapshot instead of replayed.
+    Every replayed file leaves a snapshot behind, so editing a late migration
+    only replays the tail on the next run.
+    """
+    hashes = prefix_hashes(files) if snapshot_dir else []
+    restored = 0
+    if snapshot_dir:
+        os.makedirs(snapshot_dir, exist_ok=True)
+        for i in range(len(files), 0, -1):
+            path = _snapshot_path(snapshot_dir, hashes[i - 1])
+            if os.path.exists(path):
+                source = sqlite3.connect(path)
+                source.backup(conn)
+                source.close()
+                os.utime(path)
+                restored = i
+                break
+
+    for i in range(restored, len(files)):
+        with open(files[i], 'r', encoding='utf-8') as f:
+            try:
+                conn.executescript(f.read())
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Replay failed in {os.path.relpath(files[i], REPO_ROOT)}: {e}") from e
+        if snapshot_dir:
+            _save_snapshot(conn, _snapshot_path(snapshot_dir, hashes[i]))
+
+    if snapshot_dir and restored < len(files):
+        prune_snapshots(snapshot_dir, keep=hashes)
+    return restored
+
+def build_local_replica(db_path: str = ':memory:', files: List[str] = None,
+                        snapshot_dir: Optional[str] = None) -> sqlite3.Connection:
+    """Replay all files into a SQLite database and return the connection
+
+    snapshot_dir defaults to $MEDLESS_REPLICA_CACHE (no snapshots if unset).
+    """
+    if db_path != ':memory:' and os.path.exists(db_path):
+        os.remove(db_path)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        replay_into(conn, files or replay_files(), snapshot_dir or os.environ.get(SNAPSHOT_ENV))
+    except RuntimeError:
+        conn.close()
+        raise
+
+    for statement in AUDIT_INDEXES:
+        conn.execute(statement)
+    conn.commit()
+    return conn
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Replay migrations and the master seed into SQLite')
+    parser.add_argument('db_path', nargs='?', default=os.path.join(REPO_ROOT, 'medless_local.sqlite'))
+    parser.add_argument('--seed', default=MASTER_SEED, help='master seed to replay (default: repo seed)')
+    parser.add_argument('--database-batches', action='store_true',
+                        help='also replay the historic database/00x_*.sql patches before the seed')
+    parser.add_argument('--snapshots', default=SNAPSHOT_DIR, help='snapshot cache directory')
+    parser.add_argument('--no-cache', action='store_true', help='replay every file from scratch')
+    parser.add_argument('--prune', action='store_true', help='drop snapshots not on the current replay chain')
+    args = parser.parse_args()
+
+    files = replay_files(seed_path=args.seed, database_dir=DATABASE_DIR if args.database_batches else None)
+    snapshot_dir = None if args.no_cache else args.snapshots
+
+    print(f"Replaying {len(files)} files into {args.db_path}...")
+    start = time.perf_counter()
+    if os.path.exists(args.db_path):
+        os.remove(args.db_path)
+    conn = sqlite3.connect(args.db_path)
+    try:
+        restored = replay_into(conn, files, snapshot_dir)
+    except RuntimeError as e:
+        conn.close()
+        print(f"❌ {e}")
+        sys.exit(1)
+    for statement in AUDIT_INDEXES:
+        conn.execute(statement)
+    conn.commit()
+    elapsed = time.perf_counter() - start
+
+    if snapshot_dir:
+        resumed = os.path.basename(files[restored - 1]) if restored else 'nothing'
+        print(f"- restored {restored} files from snapshot (up to {resumed}), "
+              f"replayed {len(files) - restored} in {elapsed * 1000:.0f} ms")
+    else:
+        print(f"- replayed {len(files)} files in {elapsed * 1000:.0f} ms")
+    for table in ['medication_categories', 'medications', 'cbd_interactions', 'medication_cyp_profile']:
+        count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        print(f"- {count} {table}")
+    conn.close()
+
+    if snapshot_dir and args.prune:
+        removed = prune_snapshots(snapshot_dir, keep=prefix_hashes(files), limit=0)
+        print(f"- pruned {removed} snapshots")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+MEDLESS Product & Bottle Cost Simulator
+Reproduces selectOptimalProduct / generateWeeklyPlanWithBottleTracking /
+calculatePlanCosts, sweeps realistic CBD plans and compares the greedy
+product schedule against a dynamic-programming optimum
+"""
+
+import argparse
+import math
+import sys
+import time
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from reduction_engine import js_round, parse_grid
+
+# Same values as MEDLESS_PRODUCTS / BOTTLE_CAPACITY in src/index.tsx
+MEDLESS_PRODUCTS = [
+    {'nr': 5, 'cbdPerSpray': 5.8, 'name': 'MEDLESS Nr. 5', 'price': 24.90},
+    {'nr': 10, 'cbdPerSpray': 11.5, 'name': 'MEDLESS Nr. 10', 'price': 39.90},
+    {'nr': 15, 'cbdPerSpray': 17.5, 'name': 'MEDLESS Nr. 15', 'price': 59.90},
+    {'nr': 20, 'cbdPerSpray': 23.2, 'name': 'MEDLESS Nr. 20', 'price': 79.90},
+    {'nr': 25, 'cbdPerSpray': 29.0, 'name': 'MEDLESS Nr. 25', 'price': 99.90},
+]
+BOTTLE_CAPACITY = 100
+MAX_SPRAYS_PER_DAY = 12
+MAX_SPRAYS_PER_INTAKE = 6
+OVERDOSE_TOLERANCE = 1.1
+
+CBD_PER_SPRAY = np.array([p['cbdPerSpray'] for p in MEDLESS_PRODUCTS])
+PRICES = np.array([p['price'] for p in MEDLESS_PRODUCTS])
+PRODUCT_NRS = np.array([p['nr'] for p in MEDLESS_PRODUCTS])
+
+# cbdStartMg = weight * 0.5 * modifier (buildAnalyzeResponse): benzo/opioid
+# halving, age >= 65 (0.8), BMI < 18.5 (0.85) / > 30 (1.1); cbdEndMg = weight
+START_MODIFIERS = sorted({
+    benzo * senior * bmi
+    for benzo in (1.0, 0.5)
+    for senior in (1.0, 0.8)
+    for bmi in (1.0, 0.85, 1.1)
+})
+
+def _split_sprays(total: int):
+    """Morning/evening split used by the plan (40% morning, at least 1)"""
+    morning = max(1, int(js_round(total * 0.4)))
+    return morning, total - morning
+
+@lru_cache(maxsize=None)
+def select_optimal_product(target_daily_mg: float) -> int:
+    """Index into MEDLESS_PRODUCTS chosen by selectOptimalProduct (memoized per dose)"""
+    best, best_spray_count = 0, 999
+    for index, product in enumerate(MEDLESS_PRODUCTS):
+        total = math.ceil(target_daily_mg / product['cbdPerSpray'])
+        morning, evening = _split_sprays(total)
+        actual = total * product['cbdPerSpray']
+        if (actual <= target_daily_mg * OVERDOSE_TOLERANCE and morning <= MAX_SPRAYS_PER_INTAKE
+                and evening <= MAX_SPRAYS_PER_INTAKE and total < best_spray_count):
+            best, best_spray_count = index, total
+    return best
+
+def generate_weekly_plan(cbd_start_mg: float, cbd_end_mg: float, duration_weeks: int) -> List[dict]:
+    """Scalar port of generateWeeklyPlanWithBottleTracking (product index + sprays per week)"""
+    increase = (cbd_end_mg - cbd_start_mg) / duration_weeks
+    product = select_optimal_product(cbd_start_mg)
+    remaining = BOTTLE_CAPACITY
+    plan = []
+    for week in range(1, duration_weeks + 1):
+        dose = cbd_start_mg + increase * (week - 1)
+        per_day = math.ceil(dose / CBD_PER_SPRAY[product])
+        if remaining < per_day * 7 or per_day > MAX_SPRAYS_PER_DAY:
+            product = select_optimal_product(dose)
+            remaining = BOTTLE_CAPACITY
+        total = math.ceil(dose / CBD_PER_SPRAY[product])
+        remaining -= total * 7
+        plan.append({'week': week, 'dose': dose, 'product': product, 'totalSprays': total})
+    return plan
+
+def calculate_plan_costs(plan: List[dict]) -> Dict[str, float]:
+    """Scalar port of calculatePlanCosts"""
+    bottles = [0] * len(MEDLESS_PRODUCTS)
+    current, remaining = None, 0
+    for week in plan:
+        sprays = week['totalSprays'] * 7
+        if current is None or current != week['product'] or remaining < sprays:
+            remaining = BOTTLE_CAPACITY
+            current = week['product']
+            bottles[current] += 1
+        remaining -= sprays
+    total = sum(count * product['price'] for count, product in zip(bottles, MEDLESS_PRODUCTS))
+    return {'totalCost': float(js_round(total, 2)), 'totalBottles': sum(bottles)}
+
+def select_products(doses: np.ndarray) -> np.ndarray:
+    """Vectorized selectOptimalProduct through the per-dose memo"""
+    unique, inverse = np.unique(doses, return_inverse=True)
+    return np.array([select_optimal_product(float(d)) for d in unique], dtype=int)[inverse].reshape(doses.shape)
+
+def _sprays_per_day(doses: np.ndarray, products: np.ndarray) -> np.ndarray:
+    return np.ceil(doses / CBD_PER_SPRAY[products]).astype(int)
+
+def simulate_greedy(start: np.ndarray, end: np.ndarray, weeks: np.ndarray) -> Dict[str, np.ndarray]:
+    """Greedy weekly plans + costs for all plans at once (arrays over plans, loop over weeks)"""
+    plans, max_weeks = len(start), int(weeks.max())
+    week_index = np.arange(1, max_weeks + 1)
+    active = week_index[None, :] <= weeks[:, None]
+    doses = start[:, None] + ((end - start) / weeks)[:, None] * (week_index[None, :] - 1)
+
+    products = np.zeros((plans, max_weeks), dtype=int)
+    sprays = np.zeros((plans, max_weeks), dtype=int)
+    product = select_products(start)
+    remaining = np.full(plans, BOTTLE_CAPACITY)
+    for w in range(max_weeks):
+        on = active[:, w]
+        dose = doses[:, w]
+        per_day = _sprays_per_day(dose, product)
+        change = on & ((remaining < per_day * 7) | (per_day > MAX_SPRAYS_PER_DAY))
+        if change.any():
+            product = np.where(change, 0, product)
+            product[change] = select_products(dose[change])
+            remaining = np.where(change, BOTTLE_CAPACITY, remaining)
+        total = _sprays_per_day(dose, product)
+        remaining = np.where(on, remaining - total * 7, remaining)
+        products[:, w] = product
+        sprays[:, w] = np.where(on, total * 7, 0)
+
+    # calculatePlanCosts: new bottle on product change or when the bottle cannot cover the week
+    bottles = np.zeros((plans, len(MEDLESS_PRODUCTS)), dtype=int)
+    current = np.full(plans, -1)
+    bottle_left = np.zeros(plans, dtype=int)
+    overdrawn = np.zeros(plans, dtype=bool)
+    for w in range(max_weeks):
+        on = active[:, w]
+        new_bottle = on & ((current != products[:, w]) | (bottle_left < sprays[:, w]))
+        bottle_left = np.where(new_bottle, BOTTLE_CAPACITY, bottle_left)
+        current = np.where(on, products[:, w], current)
+        bottles[np.nonzero(new_bottle)[0], products[new_bottle, w]] += 1
+        bottle_left = np.where(on, bottle_left - sprays[:, w], bottle_left)
+        overdrawn |= on & (sprays[:, w] > BOTTLE_CAPACITY)
+
+    switches = ((products[:, 1:] != products[:, :-1]) & active[:, 1:]).sum(axis=1)
+    return {
+        'doses': doses, 'active': active, 'products': products, 'sprays': sprays,
+        'cost': js_round(bottles @ PRICES, 2),
+        'bottles': bottles.sum(axis=1),
+        'switches': switches,
+        'overdrawn': overdrawn,
+    }
+
+def feasible_products(doses: np.ndarray, greedy_products: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(allowed, weekly sprays) per plan-week and product: selectOptimalProduct rules, plus the greedy choice
+
+    Both have shape (plans, weeks, products). Including the greedy product keeps the
+    greedy schedule inside the DP search space, so the DP is never worse.
+    """
+    per_day = np.ceil(doses[..., None] / CBD_PER_SPRAY).astype(int)
+    morning = np.maximum(1, np.floor(per_day * 0.4 + 0.5).astype(int))
+    evening = per_day - morning
+    allowed = ((per_day * CBD_PER_SPRAY <= doses[..., None] * OVERDOSE_TOLERANCE)
+               & (morning <= MAX_SPRAYS_PER_INTAKE) & (evening <= MAX_SPRAYS_PER_INTAKE))
+    allowed |= np.arange(len(MEDLESS_PRODUCTS)) == greedy_products[..., None]
+    return allowed, per_day * 7
+
+def optimal_costs(greedy: Dict[str, np.ndarray], chunk: int = 2000) -> np.ndarray:
+    """Cheapest bottle schedule per plan by DP over (product, sprays left in the bottle)
+
+    Same bottle rules as calculatePlanCosts: a bottle is opened when the product
+    changes or the open bottle cannot cover the whole week; leftovers are lost.
+    """
+    doses, active = greedy['doses'], greedy['active']
+    allowed, week_sprays = feasible_products(doses, greedy['products'])
+    plans, max_weeks = active.shape
+    n_products = len(MEDLESS_PRODUCTS)
+    levels = np.arange(BOTTLE_CAPACITY + 1)
+    result = np.empty(plans)
+
+    for lo in range(0, plans, chunk):
+        hi = min(lo + chunk, plans)
+        size = hi - lo
+        cost = np.full((size, n_products, BOTTLE_CAPACITY + 1), np.inf)
+        for w in range(max_weeks):
+            on = active[lo:hi, w]
+            need = np.minimum(week_sprays[lo:hi, w], BOTTLE_CAPACITY + 1)     # (size, products)
+            ok = allowed[lo:hi, w]
+
+            # Keep the open bottle: left r -> r - need (same product)
+            source = levels[None, None, :] + need[:, :, None]
+            keep = np.take_along_axis(cost, np.minimum(source, BOTTLE_CAPACITY), axis=2)
+            keep = np.where(source <= BOTTLE_CAPACITY, keep, np.inf)
+
+            # Open a new bottle of product q: cheapest state so far + price
+            best = cost.reshape(size, -1).min(axis=1)
+            best = np.where(np.isinf(best), 0.0, best) if w == 0 else best
+            # (a week needing more than one bottle empties it, as calculatePlanCosts counts one)
+            opened = np.full_like(cost, np.inf)
+            rows, cols = np.indices(need.shape).reshape(2, -1)
+            left = np.maximum(0, BOTTLE_CAPACITY - need[rows, cols])
+            opened[rows, cols, left] = best[rows] + PRICES[cols]
+
+            step = np.where(ok[:, :, None], np.minimum(keep, opened), np.inf)
+            cost = np.where(on[:, None, None], step, cost)
+        result[lo:hi] = cost.reshape(size, -1).min(axis=1)
+    return js_round(result, 2)
+
+def build_grid(weights, durations) -> Dict[str, np.ndarray]:
+    """Unique (cbdStartMg, cbdEndMg, durationWeeks) plans of the sweep"""
+    combos = sorted({(w * 0.5 * m, w * 1.0, d) for w in weights for m in START_MODIFIERS for d in durations})
+    start, end, weeks = (np.array(column) for column in zip(*combos))
+    return {'start': start, 'end': end, 'weeks': weeks.astype(int)}
+
+def _distribution(label: str, values: np.ndarray, fmt: str = '.2f'):
+    p = np.percentile(values, [0, 50, 95, 100])
+    print(f"{label:18s} min {p[0]:{fmt}}  p50 {p[1]:{fmt}}  p95 {p[2]:{fmt}}  max {p[3]:{fmt}}  "
+          f"mean {values.mean():{fmt}}")
+
+def print_report(grid, greedy, optimal, top):
+    """Print cost/bottle/switch distributions and plans the DP beats"""
+    plans = len(grid['start'])
+    print("Greedy plan (selectOptimalProduct + bottle tracking):")
+    _distribution('cost EUR', greedy['cost'])
+    _distribution('bottles', greedy['bottles'].astype(float), '.1f')
+    _distribution('product switches', greedy['switches'].astype(float), '.1f')
+    counts = np.bincount(greedy['switches'])
+    print("switch histogram   " + "  ".join(f"{n}: {c}" for n, c in enumerate(counts) if c))
+    if greedy['overdrawn'].any():
+        print(f"⚠️  {int(greedy['overdrawn'].sum())} plans need > {BOTTLE_CAPACITY} sprays in one week "
+              f"(calculatePlanCosts counts one bottle)")
+
+    if optimal is None:
+        return
+    savings = greedy['cost'] - optimal
+    worse = savings > 0.005
+    print()
+    print(f"DP optimum cheaper for {int(worse.sum())}/{plans} plans "
+          f"({worse.mean() * 100:.1f}%), total savings {savings[worse].sum():.2f} EUR")
+    if worse.any():
+        _distribution('savings EUR', savings[worse])
+        print()
+        print(f"{'start mg':>9s} {'end mg':>7s} {'weeks':>5s} {'greedy':>8s} {'optimal':>8s} {'saved':>7s} "
+              f"{'bottles':>7s} {'switches':>8s}")
+        for i in np.argsort(-savings, kind='stable')[:top]:
+            if savings[i] <= 0.005:
+                break
+            print(f"{grid['start'][i]:9.2f} {grid['end'][i]:7.1f} {grid['weeks'][i]:5d} "
+                  f"{greedy['cost'][i]:8.2f} {optimal[i]:8.2f} {savings[i]:7.2f} "
+                  f"{greedy['bottles'][i]:7d} {greedy['switches'][i]:8d}")
+
+def verify_scalar(grid, greedy, sample: int) -> int:
+    """Cross-check the vectorized greedy against the scalar port, return mismatches"""
+    mismatches = 0
+    for i in np.linspace(0, len(grid['start']) - 1, min(sample, len(grid['start']))).astype(int):
+        plan = generate_weekly_plan(float(grid['start'][i]), float(grid['end'][i]), int(grid['weeks'][i]))
+        costs = calculate_plan_costs(plan)
+        products = [week['product'] for week in plan]
+        if (costs['totalCost'] != greedy['cost'][i] or costs['totalBottles'] != greedy['bottles'][i]
+                or products != list(greedy['products'][i, :len(plan)])):
+            mismatches += 1
+    return mismatches
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Sweep CBD product schedules and bottle costs')
+    parser.add_argument('--weights', default='40:150:5', help='body weights in kg, "start:stop:step" or list')
+    parser.add_argument('--durations', default='1:52', help='durationWeeks values')
+    parser.add_argument('--no-dp', action='store_true', help='skip the dynamic-programming comparison')
+    parser.add_argument('--verify', type=int, default=200, help='plans to cross-check against the scalar port')
+    parser.add_argument('--top', type=int, default=10, help='plans with the largest savings to list')
+    args = parser.parse_args()
+
+    grid = build_grid(parse_grid(args.weights), parse_grid(args.durations, int))
+
+    print("=" * 70)
+    print("MEDLESS PRODUCT & BOTTLE COST SIMULATION")
+    print("=" * 70)
+    start = time.perf_counter()
+    greedy = simulate_greedy(grid['start'], grid['end'], grid['weeks'])
+    greedy_time = time.perf_counter() - start
+    print(f"{len(grid['start']):,} plans ({len(START_MODIFIERS)} start-dose modifiers), "
+          f"greedy in {greedy_time:.2f}s, {select_optimal_product.cache_info().currsize:,} memoized doses")
+
+    optimal = None
+    if not args.no_dp:
+        start = time.perf_counter()
+        optimal = optimal_costs(greedy)
+        print(f"DP optimum in {time.perf_counter() - start:.2f}s")
+    print()
+    print_report(grid, greedy, optimal, args.top)
+
+    if args.verify:
+        mismatches = verify_scalar(grid, greedy, args.verify)
+        print()
+        print(f"{'✅' if not mismatches else '❌'} vectorized vs. scalar port: "
+              f"{mismatches} mismatches in {min(args.verify, len(grid['start']))} plans")
+        if mismatches:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
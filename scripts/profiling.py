@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+MEDLESS Tool Profiling
+Per-phase timers, optional cProfile dumps and tracemalloc peaks for the
+Python tools, appended as one JSON line per run
+
+Enable with --profile [JSONL] on tools that call add_profile_arguments(), or
+for any tool or script with MEDLESS_PROFILE=<jsonl|1>; scripts without
+instrumentation run under `profiling.py run SCRIPT ...`
+"""
+
+import argparse
+import atexit
+import cProfile
+import datetime
+import functools
+import importlib.abc
+import importlib.util
+import json
+import os
+import pstats
+import runpy
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PROFILE_PATH = os.path.join(REPO_ROOT, '.profile', 'medless_profile.jsonl')
+
+# MEDLESS_PROFILE=<jsonl path or 1>, MEDLESS_PROFILE_CPROFILE=<.prof path>, MEDLESS_PROFILE_MEMORY=1
+PROFILE_ENV = 'MEDLESS_PROFILE'
+CPROFILE_ENV = 'MEDLESS_PROFILE_CPROFILE'
+MEMORY_ENV = 'MEDLESS_PROFILE_MEMORY'
+TOP_FUNCTIONS = 15
+
+class _Frame:
+    __slots__ = ('name', 'start', 'peak')
+
+    def __init__(self, name: str, start: float):
+        self.name = name
+        self.start = start
+        self.peak = 0
+
+class Profiler:
+    """Accumulates phase timings of one tool run and writes them as one JSONL record"""
+
+    def __init__(self, tool: str, output_path: str, cprofile_path: Optional[str] = None, memory: bool = False):
+        self.tool = tool
+        self.output_path = output_path
+        self.cprofile_path = cprofile_path
+        self.memory = memory
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, float] = {}
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.peak = 0
+        self.finished = False
+        self.started_at = datetime.datetime.now(datetime.timezone.utc)
+        self.commit = _git_commit()
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        self.profile = cProfile.Profile() if cprofile_path else None
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if self.profile:
+            self.profile.enable()
+
+    def _stack(self) -> List[_Frame]:
+        if not hasattr(self.local, 'stack'):
+            self.local.stack = []
+        return self.local.stack
+
+    def _fold_peak(self, stack: List[_Frame]) -> int:
+        """Credit the tracemalloc peak since the last reset to every open phase"""
+        peak = tracemalloc.get_traced_memory()[1]
+        for frame in stack:
+            frame.peak = max(frame.peak, peak)
+        self.peak = max(self.peak, peak)
+        return peak
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a phase (inclusive of nested phases; threads add up)"""
+        stack = self._stack()
+        if self.memory:
+            self._fold_peak(stack)
+            tracemalloc.reset_peak()
+        frame = _Frame(name, time.perf_counter())
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - frame.start
+            stack.pop()
+            if self.memory:
+                frame.peak = max(frame.peak, self._fold_peak(stack))
+            with self.lock:
+                entry = self.phases.setdefault(name, {'calls': 0, 'seconds': 0.0})
+                entry['calls'] += 1
+                entry['seconds'] += elapsed
+                if self.memory:
+                    entry['peak_bytes'] = max(entry.get('peak_bytes', 0), frame.peak)
+
+    def count(self, name: str, value: float = 1):
+        """Add to a counter (rows, files, requests) recorded with the run"""
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def _top_functions(self) -> List[dict]:
+        stats = pstats.Stats(self.profile).stats
+        top = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:TOP_FUNCTIONS]
+        return [{'function': f"{os.path.relpath(file, REPO_ROOT) if file.startswith(REPO_ROOT) else file}:"
+                             f"{line}({name})",
+                 'calls': calls, 'self_seconds': round(self_time, 6), 'cumulative_seconds': round(cumulative, 6)}
+                for (file, line, name), (_, calls, self_time, cumulative, _) in top]
+
+    def record(self) -> dict:
+        """The JSONL record of the run so far"""
+        record = {
+            'tool': self.tool,
+            'argv': sys.argv[1:],
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'commit': self.commit,
+            'python': sys.version.split()[0],
+            'wall_seconds': round(time.perf_counter() - self.wall_start, 6),
+            'cpu_seconds': round(time.process_time() - self.cpu_start, 6),
+            'phases': {name: {key: round(value, 6) if key == 'seconds' else value for key, value in entry.items()}
+                       for name, entry in self.phases.items()},
+            'counters': self.counters,
+        }
+        if resource:
+            record['max_rss_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if self.memory:
+            record['peak_traced_bytes'] = max(self.peak, tracemalloc.get_traced_memory()[1])
+        if self.profile:
+            record['cprofile'] = self.cprofile_path
+            record['top_functions'] = self._top_functions()
+        return record
+
+    def finish(self) -> Optional[dict]:
+        """Stop profiling and append the record (runs once, also from atexit)"""
+        if self.finished:
+            return None
+        self.finished = True
+        if self.profile:
+            self.profile.disable()
+            os.makedirs(os.path.dirname(os.path.abspath(self.cprofile_path)), exist_ok=True)
+            self.profile.dump_stats(self.cprofile_path)
+        record = self.record()
+        if self.memory:
+            tracemalloc.stop()
+        os.makedirs(os.path.dirname(os.path.abspath(self.output_path)), exist_ok=True)
+        with open(self.output_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        print(f"⏱️  Profile: {self.tool} {record['wall_seconds']:.3f}s -> {self.output_path}", file=sys.stderr)
+        return record
+
+_active: Optional[Profiler] = None
+
+@functools.lru_cache(maxsize=1)
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                                capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+def add_profile_arguments(parser: argparse.ArgumentParser):
+    """--profile [JSONL], --profile-cprofile PROF and --profile-memory"""
+    group = parser.add_argument_group('profiling')
+    group.add_argument('--profile', nargs='?', const=DEFAULT_PROFILE_PATH, metavar='JSONL',
+                       help=f'append phase timings of this run to JSONL (or set {PROFILE_ENV})')
+    group.add_argument('--profile-cprofile', metavar='PROF', help='also dump cProfile stats to PROF')
+    group.add_argument('--profile-memory', action='store_true', help='also record tracemalloc peaks per phase')
+
+def start(tool: str, args: Optional[argparse.Namespace] = None) -> Optional[Profiler]:
+    """Start profiling if requested by args or the environment, return the active profiler"""
+    global _active
+    if _active:
+        return _active
+    output_path = getattr(args, 'profile', None) or os.environ.get(PROFILE_ENV)
+    cprofile_path = getattr(args, 'profile_cprofile', None) or os.environ.get(CPROFILE_ENV)
+    memory = getattr(args, 'profile_memory', False) or os.environ.get(MEMORY_ENV, '') not in ('', '0')
+    if not (output_path or cprofile_path or memory):
+        return None
+    if not output_path or output_path == '1':
+        output_path = DEFAULT_PROFILE_PATH
+    _active = Profiler(tool, output_path, cprofile_path, memory)
+    instrument_waits()
+    atexit.register(finish)
+    return _active
+
+def finish() -> Optional[dict]:
+    """Write the active profiler's record"""
+    return _active.finish() if _active else None
+
+@contextmanager
+def phase(name: str):
+    """Time a phase of the active profiler (no-op when profiling is off)"""
+    if _active is None:
+        yield
+        return
+    with _active.phase(name):
+        yield
+
+def timed(name: str):
+    """Decorator form of phase()"""
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with phase(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+def count(name: str, value: float = 1):
+    """Add to a counter of the active profiler (no-op when profiling is off)"""
+    if _active is not None:
+        _active.count(name, value)
+
+def instrument_waits():
+    """Record subprocess.run and requests calls as the 'subprocess' and 'http' phases
+
+    requests is patched when the tool imports it, never imported here: its
+    import alone would be recorded as run time of tools that do not use it.
+    """
+    if not getattr(subprocess.run, '_medless_profiled', False):
+        subprocess.run = _wrap(subprocess.run, 'subprocess')
+    if 'requests' in sys.modules:
+        _instrument_requests(sys.modules['requests'])
+    elif not any(isinstance(finder, _RequestsImportHook) for finder in sys.meta_path):
+        sys.meta_path.insert(0, _RequestsImportHook())
+
+def _instrument_requests(requests):
+    if not getattr(requests.Session.request, '_medless_profiled', False):
+        requests.Session.request = _wrap(requests.Session.request, 'http')
+
+class _RequestsImportHook(importlib.abc.MetaPathFinder):
+    """Instruments requests right after the tool's own first import of it"""
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname != 'requests':
+            return None
+        sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(fullname)
+        if spec is None or spec.loader is None:
+            return spec
+        exec_module = spec.loader.exec_module
+
+        def exec_and_instrument(module):
+            exec_module(module)
+            _instrument_requests(module)
+        spec.loader.exec_module = exec_and_instrument
+        return spec
+
+def _wrap(function, name: str):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        with phase(name):
+            return function(*args, **kwargs)
+    wrapper._medless_profiled = True
+    return wrapper
+
+def run_script(path: str, argv: List[str]):
+    """Run a script as __main__ under the profiler (for tools without --profile)"""
+    sys.argv = [path] + argv
+    sys.path.insert(0, os.path.dirname(os.path.abspath(path)))
+    # The runner is __main__: let the script's `import profiling` share this
+    # module (and its active profiler) instead of starting a second one
+    sys.modules.setdefault('profiling', sys.modules[__name__])
+    start(os.path.splitext(os.path.basename(path))[0], argparse.Namespace(profile=os.environ.get(PROFILE_ENV) or '1'))
+    with phase('run'):
+        runpy.run_path(path, run_name='__main__')
+
+def print_summary(path: str, tool: Optional[str], last: int):
+    """Latest runs per tool with their slowest phases"""
+    runs: Dict[str, List[dict]] = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                if not tool or record['tool'] == tool:
+                    runs.setdefault(record['tool'], []).append(record)
+
+    print("=" * 70)
+    print("MEDLESS TOOL PROFILES")
+    print("=" * 70)
+    for name, records in sorted(runs.items()):
+        print(f"{name}: {len(records)} runs")
+        for record in records[-last:]:
+            memory = f", peak {record['peak_traced_bytes'] / 1e6:.1f} MB" if 'peak_traced_bytes' in record else ''
+            print(f"  {record['started_at']} {record.get('commit') or '-':>9} "
+                  f"{record['wall_seconds']:8.3f}s wall, {record['cpu_seconds']:8.3f}s cpu{memory}")
+            phases = sorted(record['phases'].items(), key=lambda item: item[1]['seconds'], reverse=True)
+            print("    " + ', '.join(f"{phase_name} {entry['seconds']:.3f}s" + (f" x{entry['calls']}" if entry['calls'] > 1 else '')
+                                     for phase_name, entry in phases[:6]))
+        print()
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Profile MEDLESS tools and summarize profile records')
+    commands = parser.add_subparsers(dest='command', required=True)
+    run = commands.add_parser('run', help='run a script under the profiler')
+    run.add_argument('script')
+    run.add_argument('script_args', nargs=argparse.REMAINDER)
+    report = commands.add_parser('report', help='summarize a profile JSONL file')
+    report.add_argument('path', nargs='?', default=DEFAULT_PROFILE_PATH)
+    report.add_argument('--tool', help='only this tool')
+    report.add_argument('--last', type=int, default=5, help='runs per tool')
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        run_script(args.script, args.script_args)
+    else:
+        print_summary(args.path, args.tool, args.last)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+MEDLESS Reduction Engine
+Offline NumPy mirror of the /api/analyze reduction pipeline, swept over
+reductionGoal x durationWeeks for the whole catalog
+"""
+
+import argparse
+import csv
+import sqlite3
+import sys
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from local_replica import build_local_replica
+
+# Same JOIN as buildAnalyzeResponse. D1 row objects keep the LAST duplicate
+# column, so the category's can_reduce_to_zero / max_weekly_reduction_pct
+# shadow the medication columns of m.* - the engine reads them from mc.
+CATALOG_QUERY = """
+    SELECT m.id, m.name, mc.name AS category_name, mc.risk_level,
+           mc.can_reduce_to_zero, mc.default_min_target_fraction, mc.max_weekly_reduction_pct,
+           m.half_life_hours, m.therapeutic_min_ng_ml, m.therapeutic_max_ng_ml,
+           m.withdrawal_risk_score,
+           COALESCE(SUM(p.cbd_effect_on_reduction = 'slower'), 0) AS slower_profiles,
+           COALESCE(SUM(p.cbd_effect_on_reduction = 'faster'), 0) AS faster_profiles
+    FROM medications m
+    LEFT JOIN medication_categories mc ON m.category_id = mc.id
+    LEFT JOIN medication_cyp_profile p ON p.medication_id = m.id
+    GROUP BY m.id
+    ORDER BY m.id
+"""
+
+NUMERIC_COLUMNS = [
+    'can_reduce_to_zero', 'default_min_target_fraction', 'max_weekly_reduction_pct',
+    'half_life_hours', 'therapeutic_min_ng_ml', 'therapeutic_max_ng_ml',
+    'withdrawal_risk_score', 'slower_profiles', 'faster_profiles',
+]
+
+# Constants of applyCategorySafetyRules / buildAnalyzeResponse
+NO_ZERO_TARGET_FRACTION = 0.5
+NARROW_WINDOW_NG_ML = 50
+HIGH_WITHDRAWAL_SCORE = 7
+MIN_WEEKLY_PCT = 0.02
+
+# MDI levels: (min inhibitor medications, factor), induction only without inhibitors
+MDI_INHIBITION_LEVELS = [(6, 0.7), (4, 0.8), (2, 0.9)]
+MDI_INDUCTION_LEVELS = [(4, 1.1), (2, 1.05)]
+
+FLAGS = {
+    'overshoot': 'unsafe',
+    'limit_exceeded': 'unsafe',
+    'final_cliff': 'unsafe',
+    'no_reduction': 'degenerate',
+    'early_plateau': 'degenerate',
+    'floor_applied': 'info',
+}
+
+def mdi_factor(inhibitors: int, inducers: int) -> float:
+    """Global multi-drug interaction factor for a plan"""
+    for minimum, factor in MDI_INHIBITION_LEVELS:
+        if inhibitors >= minimum:
+            return factor
+    if inhibitors == 0:
+        for minimum, factor in MDI_INDUCTION_LEVELS:
+            if inducers >= minimum:
+                return factor
+    return 1.0
+
+def mdi_level(inhibitors: int, inducers: int) -> str:
+    """multi_drug_interaction.level for the same counts (induction reports 'mild')"""
+    for (minimum, _), level in zip(MDI_INHIBITION_LEVELS, ('severe', 'moderate', 'mild')):
+        if inhibitors >= minimum:
+            return level
+    if inhibitors == 0 and inducers >= MDI_INDUCTION_LEVELS[-1][0]:
+        return 'mild'
+    return 'none'
+
+def js_round(values, digits=0):
+    """Math.round semantics (half up) with optional decimals"""
+    scale = 10 ** digits
+    return np.floor(np.asarray(values) * scale + 0.5) / scale
+
+def load_catalog(conn: sqlite3.Connection) -> Dict[str, np.ndarray]:
+    """Load the reduction inputs of every medication as column arrays (NULL -> NaN)"""
+    cursor = conn.execute(CATALOG_QUERY)
+    columns = [d[0] for d in cursor.description]
+    rows = cursor.fetchall()
+    catalog = {}
+    for i, column in enumerate(columns):
+        values = [row[i] for row in rows]
+        if column in NUMERIC_COLUMNS:
+            catalog[column] = np.array([np.nan if v is None else v for v in values], dtype=float)
+        else:
+            catalog[column] = np.array(values, dtype=object)
+    return catalog
+
+def medication_factors(catalog: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Per-medication phases that do not depend on the plan (phases 2-6)"""
+    can_reduce = catalog['can_reduce_to_zero']
+    min_fraction = catalog['default_min_target_fraction']
+    limit_pct = catalog['max_weekly_reduction_pct']
+    half_life = catalog['half_life_hours']
+    tr_min = catalog['therapeutic_min_ng_ml']
+    tr_max = catalog['therapeutic_max_ng_ml']
+    withdrawal = catalog['withdrawal_risk_score']
+    slower = catalog['slower_profiles'] > 0
+    faster = catalog['faster_profiles'] > 0
+
+    has_rules = ~(np.isnan(can_reduce) & np.isnan(min_fraction) & np.isnan(limit_pct))
+    risk = catalog['risk_level']
+    restricted = (np.nan_to_num(can_reduce, nan=1) == 0) | (risk == 'lifelong') | (risk == 'very_high')
+
+    steady_state_days = np.nan_to_num(half_life) * 5 / 24
+    half_life_factor = np.where(steady_state_days > 7, 0.5, np.where(steady_state_days > 3, 0.75, 1.0))
+
+    cyp_factor = np.where(slower, 0.7, np.where(faster, 1.15, 1.0))
+
+    with np.errstate(invalid='ignore'):
+        narrow = (tr_max - tr_min) <= NARROW_WINDOW_NG_ML
+    therapeutic_factor = np.where(narrow & (np.nan_to_num(withdrawal) >= HIGH_WITHDRAWAL_SCORE), 0.8, 1.0)
+
+    score = np.nan_to_num(withdrawal)
+    withdrawal_factor = np.where(score > 0, 1 - score / 10 * 0.25, 1.0)
+
+    return {
+        'has_rules': has_rules,
+        'restricted': restricted,
+        'min_fraction': np.nan_to_num(min_fraction),
+        'limit_pct': np.nan_to_num(limit_pct),
+        'half_life_factor': half_life_factor,
+        'cyp_factor': cyp_factor,
+        'therapeutic_factor': therapeutic_factor,
+        'withdrawal_factor': withdrawal_factor,
+        'speed_factor': half_life_factor * cyp_factor * therapeutic_factor * withdrawal_factor,
+    }
+
+def sweep(factors: Dict[str, np.ndarray], goals, durations, mdi_factors) -> Dict[str, np.ndarray]:
+    """Evaluate every medication x goal x duration x MDI factor as fractions of the start dose
+
+    Every mg quantity of the pipeline (including the 2% floor) scales with the
+    start dose, so startMg = 1 covers all doses > 0. Arrays are shaped
+    (medications, goals, durations, mdi factors).
+    """
+    goal = np.asarray(goals, dtype=float)[None, :, None, None]
+    weeks = np.asarray(durations, dtype=float)[None, None, :, None]
+    mdi = np.asarray(mdi_factors, dtype=float)[None, None, None, :]
+    f = {k: v[:, None, None, None] for k, v in factors.items()}
+
+    # Phase 1-2: requested target fraction, clamped by the category rules
+    requested = 1 - goal / 100
+    clamped = np.maximum(requested, f['min_fraction'])
+    category_target = np.where(
+        f['restricted'],
+        np.where(f['min_fraction'] > 0, clamped, NO_ZERO_TARGET_FRACTION),
+        np.where(f['min_fraction'] > 0, clamped, requested),
+    )
+    desired = np.where(f['has_rules'], np.maximum(0, category_target), requested)
+
+    # Phase 2: weekly speed limit, phases 3-6: medication factors
+    weekly = (1 - desired) / weeks
+    limited = np.where(f['limit_pct'] > 0, np.minimum(weekly, f['limit_pct'] / 100), weekly)
+    weekly = np.where(f['has_rules'], limited * f['speed_factor'], weekly)
+    target = np.where(f['has_rules'], np.maximum(0, 1 - weekly * weeks), desired)
+
+    # Phase 7: global MDI factor, then the 2% floor
+    reduction = weekly * mdi
+    floor_applied = reduction < MIN_WEEKLY_PCT
+    reduction = np.maximum(reduction, MIN_WEEKLY_PCT)
+
+    # Taper: dose(w) = max(1 - r * (w - 1), target), last week forced to target
+    with np.errstate(divide='ignore', invalid='ignore'):
+        reach_week = np.ceil(np.round((1 - target) / reduction, 9)) + 1
+    before_last = np.maximum(1 - reduction * (weeks - 2), target)
+    final_step = np.where(weeks >= 2, before_last - target, 1 - target)
+
+    limit = f['limit_pct'] / 100
+    has_limit = f['has_rules'] & (f['limit_pct'] > 0)
+    eps = 1e-9
+    shape = reduction.shape
+
+    return {
+        'target': np.broadcast_to(target, shape),
+        'reduction': reduction,
+        'max_weekly_reduction_pct': js_round(reduction * 100, 1),
+        'final_step': final_step,
+        'reach_week': reach_week,
+        'overshoot': np.broadcast_to((1 - target) * 100 > goal + eps, shape),
+        'limit_exceeded': has_limit & (reduction > limit + eps),
+        'final_cliff': has_limit & (final_step > limit + eps),
+        'no_reduction': np.broadcast_to(target >= 1 - eps, shape),
+        'early_plateau': (target < 1 - eps) & (reach_week < weeks),
+        'floor_applied': floor_applied,
+    }
+
+def weekly_taper(result: Dict[str, np.ndarray], index, duration: int, start_mg: float = 1.0) -> np.ndarray:
+    """Weekly doses (week 1..duration) of one swept plan"""
+    target = result['target'][index]
+    reduction = result['reduction'][index]
+    week = np.arange(1, duration + 1)
+    doses = np.maximum(1 - reduction * (week - 1), target)
+    doses[-1] = target
+    return doses * start_mg
+
+def parse_grid(spec: str, cast=float) -> List:
+    """Parse 'start:stop[:step]' (inclusive) or a comma-separated list"""
+    if ':' in spec:
+        parts = [cast(p) for p in spec.split(':')]
+        start, stop = parts[0], parts[1]
+        step = parts[2] if len(parts) > 2 else 1
+        values = np.arange(start, stop + step / 2, step)
+        return [cast(v) for v in values]
+    return [cast(v) for v in spec.split(',')]
+
+def print_report(catalog, result, goals, durations, mdi_factors, elapsed, top):
+    """Print flag counts and the worst unsafe plans"""
+    plans = result['target'].size
+    print(f"Swept {len(catalog['id'])} medications x {len(goals)} goals x {len(durations)} durations "
+          f"x {len(mdi_factors)} MDI factors = {plans:,} plans in {elapsed:.2f}s")
+    print()
+    print(f"{'flag':16s} {'kind':11s} {'plans':>10s} {'medications':>12s}")
+    print("-" * 52)
+    for flag, kind in FLAGS.items():
+        mask = result[flag]
+        meds = int(mask.any(axis=(1, 2, 3)).sum())
+        print(f"{flag:16s} {kind:11s} {int(mask.sum()):10,d} {meds:12d}")
+
+    unsafe = np.zeros(result['target'].shape, dtype=bool)
+    for flag, kind in FLAGS.items():
+        if kind == 'unsafe':
+            unsafe |= result[flag]
+    if not unsafe.any():
+        return
+
+    print()
+    print(f"Worst unsafe plans (by final-week drop, top {top}):")
+    print(f"{'medication':28s} {'goal':>5s} {'weeks':>5s} {'mdi':>5s} {'target%':>8s} "
+          f"{'wk%':>6s} {'last%':>6s} {'limit%':>7s}  flags")
+    indices = np.argwhere(unsafe)
+    order = np.argsort(-result['final_step'][unsafe], kind='stable')[:top]
+    limits = catalog['max_weekly_reduction_pct']
+    for m, g, d, k in indices[order]:
+        index = (m, g, d, k)
+        flags = [flag for flag in FLAGS if result[flag][index]]
+        limit = '' if np.isnan(limits[m]) else f"{limits[m]:g}"
+        print(f"{str(catalog['name'][m])[:28]:28s} {goals[g]:5g} {durations[d]:5d} {mdi_factors[k]:5g} "
+              f"{result['target'][index] * 100:8.1f} {result['max_weekly_reduction_pct'][index]:6.1f} "
+              f"{result['final_step'][index] * 100:6.1f} {limit:>7s}  {','.join(flags)}")
+
+def write_csv(path, catalog, result, goals, durations, mdi_factors):
+    """Write one row per flagged plan"""
+    flagged = np.zeros(result['target'].shape, dtype=bool)
+    for flag, kind in FLAGS.items():
+        if kind != 'info':
+            flagged |= result[flag]
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['medication_id', 'medication', 'reduction_goal', 'duration_weeks', 'mdi_factor',
+                         'target_pct', 'max_weekly_reduction_pct', 'final_step_pct', 'flags'])
+        for m, g, d, k in np.argwhere(flagged):
+            index = (m, g, d, k)
+            writer.writerow([
+                int(catalog['id'][m]), catalog['name'][m], goals[g], durations[d], mdi_factors[k],
+                round(float(result['target'][index]) * 100, 2),
+                float(result['max_weekly_reduction_pct'][index]),
+                round(float(result['final_step'][index]) * 100, 2),
+                ';'.join(flag for flag in FLAGS if result[flag][index]),
+            ])
+
+def print_taper(catalog, factors, name, goal, duration, mdi, start_mg):
+    """Print the weekly taper of one medication"""
+    matches = [i for i, med in enumerate(catalog['name']) if name.lower() in str(med).lower()]
+    if not matches:
+        print(f"❌ No medication matches '{name}'")
+        sys.exit(1)
+    m = matches[0]
+    single = {k: v[m:m + 1] for k, v in factors.items()}
+    result = sweep(single, [goal], [duration], [mdi])
+    doses = weekly_taper(result, (0, 0, 0, 0), duration, start_mg)
+    print(f"{catalog['name'][m]} ({catalog['category_name'][m] or 'no category'}): "
+          f"{start_mg:g} mg, goal {goal:g}%, {duration} weeks, MDI {mdi:g}")
+    print(f"max_weekly_reduction_pct: {result['max_weekly_reduction_pct'][0, 0, 0, 0]:g}  "
+          f"target: {result['target'][0, 0, 0, 0] * start_mg:.1f} mg")
+    for week, dose in enumerate(doses, 1):
+        print(f"  Week {week:3d}: {js_round(dose, 1):8.1f} mg")
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Sweep the reduction pipeline over the whole catalog')
+    parser.add_argument('--db', help='existing SQLite replica (default: replay migrations in memory)')
+    parser.add_argument('--goals', default='10:100:10', help='reductionGoal values, "start:stop:step" or list')
+    parser.add_argument('--durations', default='1:52', help='durationWeeks values, "start:stop:step" or list')
+    parser.add_argument('--mdi', default='1.0', help='MDI factors to sweep, e.g. "0.7,0.8,0.9,1,1.05,1.1"')
+    parser.add_argument('--top', type=int, default=15, help='number of unsafe plans to list')
+    parser.add_argument('--csv', help='write all unsafe/degenerate plans to this CSV file')
+    parser.add_argument('--taper', metavar='NAME', help='print the weekly taper of one medication')
+    parser.add_argument('--goal', type=float, default=50, help='reductionGoal for --taper')
+    parser.add_argument('--weeks', type=int, default=12, help='durationWeeks for --taper')
+    parser.add_argument('--start-mg', type=float, default=100, help='start dose for --taper')
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db) if args.db else build_local_replica()
+    catalog = load_catalog(conn)
+    conn.close()
+    factors = medication_factors(catalog)
+
+    if args.taper:
+        mdi = parse_grid(args.mdi)[0]
+        print_taper(catalog, factors, args.taper, args.goal, args.weeks, mdi, args.start_mg)
+        return
+
+    goals = parse_grid(args.goals)
+    durations = parse_grid(args.durations, int)
+    mdi_factors = parse_grid(args.mdi)
+
+    print("=" * 70)
+    print("MEDLESS REDUCTION PIPELINE SWEEP")
+    print("=" * 70)
+    start = time.perf_counter()
+    result = sweep(factors, goals, durations, mdi_factors)
+    elapsed = time.perf_counter() - start
+    print_report(catalog, result, goals, durations, mdi_factors, elapsed, args.top)
+
+    if args.csv:
+        write_csv(args.csv, catalog, result, goals, durations, mdi_factors)
+        print(f"\n✅ Flagged plans written to {args.csv}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,601 @@
+#!/usr/bin/env python3
+"""
+MEDLESS SQL Statement Index
+Splits every .sql file into normalized, content-addressed statements, indexes
+statement -> files -> target rows and derives a deduplicated replay set
+"""
+
+import argparse
+import glob
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+import time
+from collections import Counter
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple
+
+from generate_master_seed import SeedWriter
+from local_replica import DATABASE_DIR, MIGRATIONS_DIR, REPO_ROOT, replay_files, replay_into
+
+SQL_DIRS = [REPO_ROOT, DATABASE_DIR, MIGRATIONS_DIR]
+DEFAULT_OUTPUT_PATH = os.path.join(REPO_ROOT, 'medless_replay_set.sql')
+
+TOKEN_PATTERN = re.compile(r"""
+    (?P<space>\s+)
+  | (?P<comment>--[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:[^']|'')*')
+  | (?P<quoted>"(?:[^"]|"")*"|`[^`]*`|\[[^\]]*\])
+  | (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+  | (?P<word>[A-Za-z_][A-Za-z0-9_$]*)
+  | (?P<op>\|\||<=|>=|<>|!=|==|<<|>>|\S)
+""", re.DOTALL | re.VERBOSE)
+
+TRANSACTION_WORDS = {'BEGIN', 'COMMIT', 'END', 'ROLLBACK', 'SAVEPOINT', 'RELEASE'}
+LITERAL_WORDS = {'NULL', 'TRUE', 'FALSE'}
+ALL_COLUMNS = None  # pending marker: the whole row is overwritten later
+
+Token = Tuple[str, str]
+
+class Statement(NamedTuple):
+    """One normalized statement (multi-row INSERTs are split into one per row)"""
+    path: str
+    line: int
+    text: str
+    digest: str
+    kind: str                      # ddl, insert, update, delete, transaction, select, other
+    table: Optional[str]
+    name: Optional[str]            # DDL object name
+    verb: str                      # INSERT verb or DDL action
+    columns: Tuple[str, ...]       # inserted or assigned columns
+    values: Tuple[str, ...]        # inserted values (single-row INSERT)
+    rows: Optional[FrozenSet[str]] # target key values, None = unknown/all rows
+    literal: bool                  # every inserted/assigned value is a literal
+    pure_key: bool                 # WHERE is exactly a key predicate
+    reads: FrozenSet[str]          # tables read through subqueries
+
+class Schema(NamedTuple):
+    """Primary key and unique column sets per table"""
+    keys: Dict[str, str]
+    unique: Dict[str, List[FrozenSet[str]]]
+
+    def key(self, table: str) -> str:
+        return self.keys.get(table, 'id')
+
+def sql_files(dirs: List[str] = SQL_DIRS) -> List[str]:
+    """Every .sql file directly inside dirs"""
+    return [path for directory in dirs for path in sorted(glob.glob(os.path.join(directory, '*.sql')))]
+
+def render(tokens: List[Token]) -> str:
+    """Tokens joined with canonical spacing (comments and layout dropped)"""
+    parts = []
+    previous = None
+    for _, text in tokens:
+        if parts and text not in (',', ')', '.') and previous not in ('(', '.'):
+            parts.append(' ')
+        parts.append(text)
+        previous = text
+    return ''.join(parts)
+
+def statement_digest(tokens: List[Token]) -> str:
+    """Content address: keywords and identifiers are case-insensitive, literals are not"""
+    normalized = render([(kind, text.lower() if kind == 'word' else text) for kind, text in tokens])
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()[:16]
+
+def split_statements(sql: str):
+    """(line, tokens) per statement; ';' inside strings and comments never splits"""
+    tokens: List[Token] = []
+    line = start_line = 1
+    for match in TOKEN_PATTERN.finditer(sql):
+        kind, text = match.lastgroup, match.group()
+        if kind in ('space', 'comment'):
+            line += text.count('\n')
+            continue
+        if not tokens:
+            start_line = line
+        line += text.count('\n')
+        if text != ';':
+            tokens.append((kind, text))
+            continue
+        # Trigger bodies contain ';' - let SQLite decide whether the statement is complete
+        if tokens and any(t.upper() == 'TRIGGER' for _, t in tokens[:4]) and \
+                not sqlite3.complete_statement(render(tokens) + ';'):
+            tokens.append((kind, text))
+            continue
+        if tokens:
+            yield start_line, tokens
+        tokens = []
+    if tokens:
+        yield start_line, tokens
+
+def _name(token: Token) -> str:
+    kind, text = token
+    return text[1:-1].lower() if kind == 'quoted' else text.lower()
+
+def _closing(tokens: List[Token], start: int) -> int:
+    """Index of the ')' matching the '(' at start"""
+    depth = 0
+    for i in range(start, len(tokens)):
+        if tokens[i][1] == '(':
+            depth += 1
+        elif tokens[i][1] == ')':
+            depth -= 1
+            if depth == 0:
+                return i
+    raise ValueError('unbalanced parentheses')
+
+def _split_top(tokens: List[Token], separator: str) -> List[List[Token]]:
+    """Split on separator (',' or a keyword) outside parentheses"""
+    parts, current, depth = [], [], 0
+    for token in tokens:
+        if token[1] == '(':
+            depth += 1
+        elif token[1] == ')':
+            depth -= 1
+        if depth == 0 and token[1].upper() == separator:
+            parts.append(current)
+            current = []
+        else:
+            current.append(token)
+    parts.append(current)
+    return parts
+
+def _find_top(tokens: List[Token], words: Set[str], start: int = 0) -> int:
+    depth = 0
+    for i in range(start, len(tokens)):
+        text = tokens[i][1]
+        if text == '(':
+            depth += 1
+        elif text == ')':
+            depth -= 1
+        elif depth == 0 and tokens[i][0] == 'word' and text.upper() in words:
+            return i
+    return len(tokens)
+
+def is_literal(tokens: List[Token]) -> bool:
+    """String, number or NULL, optionally signed"""
+    if not tokens:
+        return False
+    if tokens[0][1] in ('-', '+'):
+        tokens = tokens[1:]
+    return len(tokens) == 1 and (tokens[0][0] in ('string', 'number') or tokens[0][1].upper() in LITERAL_WORDS)
+
+def _key_rows(where: List[Token], key: str) -> Tuple[Optional[FrozenSet[str]], bool]:
+    """Key values of a `key = v` / `key IN (...)` conjunct and whether it is the whole WHERE"""
+    conjuncts = _split_top(where, 'AND')
+    for conjunct in conjuncts:
+        if len(conjunct) < 3 or conjunct[0][0] not in ('word', 'quoted') or _name(conjunct[0]) != key:
+            continue
+        operator = conjunct[1][1].upper()
+        if operator in ('=', '==') and is_literal(conjunct[2:]):
+            rows = frozenset([render(conjunct[2:])])
+        elif operator == 'IN' and conjunct[2][1] == '(' and conjunct[-1][1] == ')' and \
+                _closing(conjunct, 2) == len(conjunct) - 1:
+            values = _split_top(conjunct[3:-1], ',')
+            if not all(is_literal(v) for v in values):
+                continue
+            rows = frozenset(render(v) for v in values)
+        else:
+            continue
+        return rows, len(conjuncts) == 1
+    return None, False
+
+def _reads(tokens: List[Token], table: Optional[str], tables: Set[str]) -> FrozenSet[str]:
+    """Tables named anywhere in the statement besides its own target (subqueries)"""
+    names = [_name(t) for t in tokens if t[0] in ('word', 'quoted')]
+    counts = Counter(name for name in names if name in tables)
+    if table in counts:
+        counts[table] -= 1
+    return frozenset(name for name, count in counts.items() if count > 0)
+
+def analyze(path: str, line: int, tokens: List[Token], schema: Schema, tables: Set[str]) -> List[Statement]:
+    """Classify one statement; multi-row INSERT ... VALUES yields one Statement per row"""
+    text, digest = render(tokens), statement_digest(tokens)
+    words = [t.upper() if kind == 'word' else t for kind, t in tokens]
+    first = words[0]
+
+    def make(kind, table=None, name=None, verb='', columns=(), values=(), rows=None,
+             literal=False, pure_key=False, statement_tokens=tokens):
+        return Statement(path, line, render(statement_tokens), statement_digest(statement_tokens), kind,
+                         table, name, verb, tuple(columns), tuple(values), rows, literal, pure_key,
+                         _reads(statement_tokens, table, tables))
+
+    try:
+        if first in TRANSACTION_WORDS:
+            return [Statement(path, line, text, digest, 'transaction', None, None, first,
+                              (), (), None, True, False, frozenset())]
+        if first in ('SELECT', 'EXPLAIN'):
+            return [make('select')]
+
+        if first in ('INSERT', 'REPLACE'):
+            i, verb = 1, 'INSERT OR REPLACE' if first == 'REPLACE' else 'INSERT'
+            if words[i] == 'OR':
+                verb, i = f"INSERT OR {words[i + 1]}", i + 2
+            if words[i] != 'INTO':
+                return [make('other')]
+            table = _name(tokens[i + 1])
+            i += 2
+            columns = []
+            if tokens[i][1] == '(':
+                end = _closing(tokens, i)
+                columns = [_name(part[0]) for part in _split_top(tokens[i + 1:end], ',')]
+                i = end + 1
+            if i >= len(words) or words[i] != 'VALUES' or not columns:
+                return [make('insert', table, verb=verb, columns=columns)]
+            groups, i = [], i + 1
+            while i < len(tokens) and tokens[i][1] == '(':
+                end = _closing(tokens, i)
+                groups.append(_split_top(tokens[i + 1:end], ','))
+                i = end + 1
+                if i < len(tokens) and tokens[i][1] == ',':
+                    i += 1
+            if i != len(tokens) or any(len(values) != len(columns) for values in groups):
+                # ON CONFLICT / RETURNING clauses: keep the statement whole
+                return [make('insert', table, verb=verb, columns=columns)]
+            key = schema.key(table)
+            prefix = tokens[:tokens.index(next(t for t in tokens if t[1].upper() == 'VALUES')) + 1]
+            statements = []
+            for values in groups:
+                row_tokens = list(prefix) + [('op', '(')]
+                for n, value in enumerate(values):
+                    row_tokens += ([('op', ',')] if n else []) + value
+                row_tokens.append(('op', ')'))
+                rows = frozenset([render(values[columns.index(key)])]) if key in columns else None
+                statements.append(make('insert', table, verb=verb, columns=columns,
+                                       values=[render(v) for v in values], rows=rows,
+                                       literal=all(is_literal(v) for v in values), statement_tokens=row_tokens))
+            return statements
+
+        if first in ('UPDATE', 'DELETE'):
+            i = 1
+            if first == 'UPDATE' and words[i] == 'OR':
+                i += 2
+            if first == 'DELETE':
+                if words[i] != 'FROM':
+                    return [make('other')]
+                i += 1
+            table = _name(tokens[i])
+            where_at = _find_top(tokens, {'WHERE'}, i + 1)
+            tail_at = _find_top(tokens, {'FROM', 'RETURNING', 'ORDER', 'LIMIT'}, i + 2)
+            if tail_at < len(tokens):
+                return [make('other', table)]
+            rows, pure = (None, False) if where_at == len(tokens) else \
+                _key_rows(tokens[where_at + 1:], schema.key(table))
+            if first == 'DELETE':
+                return [make('delete', table, rows=rows, literal=True, pure_key=pure)]
+            if words[i + 1] != 'SET':
+                return [make('other', table)]
+            assignments = _split_top(tokens[i + 2:where_at], ',')
+            columns = [_name(a[0]) for a in assignments]
+            literal = all(len(a) > 2 and a[1][1] == '=' and is_literal(a[2:]) for a in assignments)
+            return [make('update', table, columns=columns, rows=rows, literal=literal, pure_key=pure)]
+
+        if first in ('CREATE', 'DROP', 'ALTER'):
+            i = 1
+            while words[i] in ('TEMP', 'TEMPORARY', 'UNIQUE', 'VIRTUAL'):
+                i += 1
+            object_type = words[i]
+            i += 1
+            if_not_exists = words[i:i + 3] == ['IF', 'NOT', 'EXISTS']
+            i += 3 if if_not_exists else 2 if words[i:i + 2] == ['IF', 'EXISTS'] else 0
+            name = _name(tokens[i])
+            table = name
+            if object_type in ('INDEX', 'TRIGGER'):
+                on = _find_top(tokens, {'ON'}, i + 1)
+                table = _name(tokens[on + 1]) if on + 1 < len(tokens) else None
+            verb = f"{first} {object_type}{' IF NOT EXISTS' if if_not_exists else ''}"
+            return [make('ddl', table, name, verb)]
+    except (IndexError, ValueError):
+        pass
+    return [make('other')]
+
+def load_schema(statements_by_file: Dict[str, List[Tuple[int, List[Token]]]], files: List[str]) -> Schema:
+    """Primary and unique keys from every CREATE TABLE/INDEX in files, applied to an empty database"""
+    conn = sqlite3.connect(':memory:')
+    for path in files:
+        for _, tokens in statements_by_file.get(path, []):
+            if tokens[0][1].upper() in ('CREATE', 'ALTER') and any(
+                    t[1].upper() in ('TABLE', 'INDEX') for t in tokens[1:4]):
+                try:
+                    conn.execute(render(tokens))
+                except sqlite3.Error:
+                    pass
+    keys, unique = {}, {}
+    for (table,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'"):
+        info = conn.execute(f"PRAGMA table_info({table})").fetchall()
+        primary = [row[1] for row in info if row[5]]
+        if len(primary) == 1:
+            keys[table.lower()] = primary[0].lower()
+        unique[table.lower()] = [
+            frozenset(row[2].lower() for row in conn.execute(f"PRAGMA index_info('{index[1]}')"))
+            for index in conn.execute(f"PRAGMA index_list({table})") if index[2]
+        ] + ([frozenset(c.lower() for c in primary)] if primary else [])
+    conn.close()
+    return Schema(keys, unique)
+
+def build_index(paths: List[str], schema_files: Optional[List[str]] = None):
+    """(statements per file, digest -> [Statement], schema) for every file in paths"""
+    raw = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            raw[path] = list(split_statements(f.read()))
+    schema = load_schema(raw, schema_files or paths)
+    tables = set(schema.unique)
+    per_file: Dict[str, List[Statement]] = {}
+    index: Dict[str, List[Statement]] = {}
+    for path, statements in raw.items():
+        per_file[path] = [s for line, tokens in statements for s in analyze(path, line, tokens, schema, tables)]
+        for statement in per_file[path]:
+            index.setdefault(statement.digest, []).append(statement)
+    return per_file, index, schema
+
+def _idempotent(s: Statement, schema: Schema) -> bool:
+    """Running s twice in a row leaves the same state as running it once"""
+    if s.kind == 'ddl':
+        return s.verb.endswith('IF NOT EXISTS')
+    if s.table in s.reads:
+        return False
+    if s.kind == 'insert':
+        if not s.literal:
+            return False
+        if s.rows is not None:
+            return s.verb in ('INSERT OR IGNORE', 'INSERT OR REPLACE')
+        return s.verb == 'INSERT OR IGNORE' and any(u <= set(s.columns) for u in schema.unique.get(s.table, []))
+    return s.kind == 'delete' or (s.kind == 'update' and s.literal)
+
+def deduplicate(chain: List[Statement], schema: Schema):
+    """Drop repeats of idempotent statements nothing touched since their last run (one forward pass)
+
+    Returns (kept, duplicates, control) where control are transaction and
+    SELECT statements, which change nothing in a replay.
+    """
+    kept, duplicates, control = [], [], []
+    last_run: Dict[str, int] = {}
+    table_any: Dict[str, int] = {}   # last write to the table
+    table_all: Dict[str, int] = {}   # last write to unknown rows / DDL
+    row_last: Dict[Tuple[str, str], int] = {}
+    ddl_last: Dict[str, int] = {}
+    last_other = -1
+
+    for s in chain:
+        if s.kind in ('transaction', 'select'):
+            control.append(s)
+            continue
+        position = len(kept)
+        previous = last_run.get(s.digest)
+        if previous is not None and _idempotent(s, schema) and last_other < previous:
+            if s.kind == 'ddl':
+                # DROP TABLE also drops its indexes, a rename replaces the table under the name
+                touched = max(ddl_last.get(s.name, -1), ddl_last.get(s.table, -1)) > previous
+            else:
+                touched = table_all.get(s.table, -1) > previous or (
+                    table_any.get(s.table, -1) > previous if s.rows is None
+                    else any(row_last.get((s.table, key), -1) > previous for key in s.rows))
+            touched = touched or any(table_any.get(t, -1) > previous for t in s.reads)
+            if not touched:
+                duplicates.append(s)
+                continue
+
+        kept.append(s)
+        last_run[s.digest] = position
+        if s.kind == 'other':
+            last_other = position
+        elif s.kind == 'ddl':
+            for name in (s.name, s.table, s.text.split()[-1].strip('"`[]').lower()):
+                ddl_last[name] = position
+            table_all[s.table] = table_any[s.table] = position
+        else:
+            table_any[s.table] = position
+            if s.rows is None:
+                table_all[s.table] = position
+            else:
+                for key in s.rows:
+                    row_last[(s.table, key)] = position
+    return kept, duplicates, control
+
+def drop_superseded(kept: List[Statement], schema: Schema):
+    """Drop key UPDATEs whose columns a later statement overwrites before anything reads them
+
+    One backward pass: pending[table][key] holds the columns overwritten
+    later (ALL_COLUMNS after an INSERT OR REPLACE or DELETE of the row).
+    """
+    pending: Dict[str, Dict[str, Optional[Set[str]]]] = {}
+    survivors, superseded = [], []
+    for s in reversed(kept):
+        rows = pending.setdefault(s.table, {}) if s.table else {}
+        simple = s.rows is not None and not s.reads
+        if s.kind == 'update' and simple and s.pure_key and s.literal:
+            unique_columns = set().union(*schema.unique.get(s.table, [frozenset()]))
+            if not set(s.columns) & unique_columns and all(
+                    key in rows and (rows[key] is ALL_COLUMNS or rows[key] >= set(s.columns)) for key in s.rows):
+                superseded.append(s)
+                continue
+            for key in s.rows:
+                if key not in rows:
+                    rows[key] = set(s.columns)
+                elif rows[key] is not ALL_COLUMNS:
+                    rows[key] |= set(s.columns)
+        elif (s.kind == 'insert' and simple and s.literal and s.verb == 'INSERT OR REPLACE') or \
+                (s.kind == 'delete' and simple and s.pure_key):
+            for key in s.rows:
+                rows[key] = ALL_COLUMNS
+        elif s.kind == 'other':
+            pending.clear()
+        else:
+            for table in s.reads:
+                pending.pop(table, None)
+            if s.kind in ('update', 'delete', 'ddl'):
+                pending.pop(s.table, None)
+        survivors.append(s)
+    survivors.reverse()
+    superseded.reverse()
+    return survivors, superseded
+
+def write_replay_set(statements: List[Statement], output_path: str, source_files: List[str]) -> Dict[str, int]:
+    """Write the replay set; consecutive INSERTs of one table are merged into multi-row statements"""
+    with open(output_path, 'w', encoding='utf-8') as f:
+        writer = SeedWriter(f, multi_row=True)
+        writer.write("-- ========================================================\n")
+        writer.write("-- MEDLESS deduplicated replay set (scripts/sql_statement_index.py)\n")
+        writer.write(f"-- Sources: {len(source_files)} files, {len(statements)} statements\n")
+        writer.write("-- ========================================================\n\n")
+        for s in statements:
+            if s.kind == 'insert' and s.values:
+                writer.write_insert(s.verb, s.table, list(s.columns), list(s.values))
+            else:
+                writer.write(f"{s.text};\n\n")
+        writer.flush()
+    return writer.stats
+
+def database_state(conn: sqlite3.Connection) -> Dict[str, tuple]:
+    """Normalized schema SQL and sorted rows of every table
+
+    Columns defaulting to CURRENT_TIMESTAMP/DATE/TIME hold the replay time
+    and are left out of the row comparison.
+    """
+    state = {}
+    for kind, name, sql in conn.execute("SELECT type, name, sql FROM sqlite_master ORDER BY name"):
+        schema_sql = render([t for _, tokens in split_statements(sql) for t in tokens]) if sql else None
+        rows = []
+        if kind == 'table':
+            columns = [f'"{row[1]}"' for row in conn.execute(f'PRAGMA table_info("{name}")')
+                       if 'CURRENT_' not in str(row[4]).upper()]
+            rows = sorted(map(repr, conn.execute(f'SELECT {", ".join(columns)} FROM "{name}"')))
+        state[name] = (schema_sql, rows)
+    return state
+
+def verify_replay_set(files: List[str], output_path: str):
+    """Replay the full chain and the replay set into fresh databases, return (differing objects, seconds, seconds)"""
+    full = sqlite3.connect(':memory:')
+    start = time.perf_counter()
+    replay_into(full, files)
+    full_seconds = time.perf_counter() - start
+
+    reduced = sqlite3.connect(':memory:')
+    start = time.perf_counter()
+    replay_into(reduced, [output_path])
+    reduced_seconds = time.perf_counter() - start
+
+    expected, actual = database_state(full), database_state(reduced)
+    full.close()
+    reduced.close()
+    differing = sorted(name for name in set(expected) | set(actual) if expected.get(name) != actual.get(name))
+    return differing, full_seconds, reduced_seconds
+
+def _where(s: Statement) -> str:
+    return f"{os.path.relpath(s.path, REPO_ROOT)}:{s.line}"
+
+def print_index(per_file: Dict[str, List[Statement]], index: Dict[str, List[Statement]], limit: int):
+    """Identical files, near-copies, duplicate statements and rows touched per file"""
+    total = sum(len(statements) for statements in per_file.values())
+    print(f"Files: {len(per_file)}, statements: {total}, distinct: {len(index)}, "
+          f"repeated: {total - len(index)}")
+    print()
+
+    sequences: Dict[Tuple[str, ...], List[str]] = {}
+    digests = {path: {s.digest for s in statements} for path, statements in per_file.items()}
+    for path, statements in per_file.items():
+        if statements:
+            sequences.setdefault(tuple(s.digest for s in statements), []).append(path)
+    identical = [paths for paths in sequences.values() if len(paths) > 1]
+    print(f"{'❌' if identical else '✅'} Files with identical statements: {len(identical)} groups")
+    for paths in identical:
+        print(f"   {' = '.join(os.path.relpath(p, REPO_ROOT) for p in paths)}")
+
+    # Co-occurrence counts from the inverted index, so only files sharing statements are paired
+    shared: Counter = Counter()
+    for statements in index.values():
+        files = sorted({s.path for s in statements})
+        for a in range(len(files)):
+            for b in range(a + 1, len(files)):
+                shared[(files[a], files[b])] += 1
+    identical_pairs = {(a, b) for paths in identical for a in paths for b in paths}
+    near = sorted(((count / len(digests[a] | digests[b]), a, b, count) for (a, b), count in shared.items()
+                   if (a, b) not in identical_pairs and count / len(digests[a] | digests[b]) >= 0.5), reverse=True)
+    print(f"{'⚠️ ' if near else '✅'} Near-copies (>= 50% shared statements): {len(near)} pairs")
+    for ratio, a, b, count in near[:limit]:
+        print(f"   {ratio:5.0%} {os.path.relpath(a, REPO_ROOT)} ~ {os.path.relpath(b, REPO_ROOT)} "
+              f"({count} shared, {len(digests[a] - digests[b])} / {len(digests[b] - digests[a])} only in one)")
+
+    repeated = sorted((statements for statements in index.values() if len(statements) > 1), key=len, reverse=True)
+    print(f"ℹ️  Statements in several places: {len(repeated)}")
+    for statements in repeated[:limit]:
+        places = ', '.join(_where(s) for s in statements[:3]) + (' ...' if len(statements) > 3 else '')
+        print(f"   {len(statements)}x {statements[0].digest} {statements[0].text[:60]}... ({places})")
+    print()
+
+    print("Rows written per file:")
+    for path, statements in per_file.items():
+        touched: Dict[str, Optional[Set[str]]] = {}
+        for s in statements:
+            if s.kind in ('insert', 'update', 'delete') and s.table:
+                if s.rows is None:
+                    touched[s.table] = None
+                elif touched.setdefault(s.table, set()) is not None:
+                    touched[s.table] |= s.rows
+        summary = ', '.join(f"{table} ({'all/unkeyed' if keys is None else len(keys)})"
+                            for table, keys in sorted(touched.items()))
+        print(f"   {os.path.relpath(path, REPO_ROOT)}: {summary or '-'}")
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Index SQL statements and build a deduplicated replay set')
+    parser.add_argument('files', nargs='*', help='files to index (default: every .sql in the repo, database/, migrations/)')
+    parser.add_argument('--statement', help='show every occurrence of this statement digest')
+    parser.add_argument('--replay', action='store_true', help='build the deduplicated replay set of the replica chain')
+    parser.add_argument('--database-batches', action='store_true',
+                        help='include the historic database/00x_*.sql patches in the replay chain')
+    parser.add_argument('--apply', nargs='+', default=[], metavar='SQL', help='append these files to the replay chain')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH, help='replay set to write')
+    parser.add_argument('--verify', action='store_true', help='replay chain and replay set and compare all tables')
+    parser.add_argument('--limit', type=int, default=10, help='entries to print per finding')
+    args = parser.parse_args()
+
+    chain = replay_files(database_dir=DATABASE_DIR if args.database_batches else None) + \
+        [os.path.abspath(p) for p in args.apply]
+    paths = [os.path.abspath(p) for p in args.files] or sql_files()
+    paths += [p for p in chain if p not in paths] if args.replay else []
+
+    print("=" * 70)
+    print("MEDLESS SQL STATEMENT INDEX")
+    print("=" * 70)
+    start = time.perf_counter()
+    per_file, index, schema = build_index(paths, schema_files=chain)
+    print(f"Indexed in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    if args.statement:
+        for s in index.get(args.statement, []):
+            print(f"   {_where(s)}: {s.text}")
+        sys.exit(0 if args.statement in index else 1)
+
+    print_index(per_file, index, args.limit)
+    if not args.replay:
+        return
+
+    print()
+    statements = [s for path in chain for s in per_file[path]]
+    kept, duplicates, control = deduplicate(statements, schema)
+    survivors, superseded = drop_superseded(kept, schema)
+    stats = write_replay_set(survivors, args.output, chain)
+    print(f"Replay chain: {len(chain)} files, {len(statements)} statements")
+    print(f"- {len(duplicates)} repeated no-ops dropped")
+    for s in duplicates[:args.limit]:
+        print(f"   {_where(s)}: {s.text[:70]}")
+    print(f"- {len(superseded)} UPDATEs overwritten later dropped")
+    for s in superseded[:args.limit]:
+        print(f"   {_where(s)}: {s.text[:70]}")
+    print(f"- {len(control)} transaction/SELECT statements dropped")
+    print(f"- {len(survivors)} statements kept, written as {stats['statements']} INSERTs "
+          f"+ {len(survivors) - stats['single_row_statements']} other statements to {args.output}")
+
+    if args.verify:
+        differing, full_seconds, reduced_seconds = verify_replay_set(chain, args.output)
+        print(f"Full chain: {full_seconds * 1000:.0f} ms, replay set: {reduced_seconds * 1000:.0f} ms "
+              f"({full_seconds / max(reduced_seconds, 1e-9):.1f}x)")
+        print(f"{'✅' if not differing else '❌'} {len(differing)} tables/indexes differ from the full replay"
+              + (f": {', '.join(differing)}" if differing else ''))
+        sys.exit(1 if differing else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+MEDLESS Synthetic Catalog Generator
+Learns per-category value distributions from medications_export.json and the
+master seed (category mix, half-lives, cyp450_enzyme patterns, withdrawal
+scores, interactions, CYP profiles) and streams seeded, statistically similar
+catalogs of any size as seed SQL, wrangler JSON or a SQLite database
+"""
+
+import argparse
+import bisect
+import json
+import math
+import os
+import random
+import re
+import sys
+import time
+from collections import Counter
+from itertools import accumulate, islice
+from typing import Dict, Iterator, List, Optional
+
+from diff_snapshots import sql_literal
+from generate_master_seed import SEED_TABLES, SeedWriter, escape_sql_string, parse_seed_file
+from local_replica import MASTER_SEED, REPO_ROOT, build_local_replica
+
+sys.path.insert(0, REPO_ROOT)
+
+from analyze_medication_data_quality import AUDIT_COLUMNS, analyze_cyp_enzyme_field
+import profiling
+
+DEFAULT_EXPORT_PATH = os.path.join(REPO_ROOT, 'medications_export.json')
+FORMATS = {'.sql': 'sql', '.json': 'json', '.sqlite': 'sqlite', '.db': 'sqlite'}
+
+# Log-normal spread applied to sampled half-lives and therapeutic ranges
+HALF_LIFE_SIGMA = 0.25
+RANGE_SIGMA = 0.15
+
+# Categories with fewer distinct CYP segments recombine from the global pool
+MIN_CATEGORY_SEGMENTS = 5
+SUMMARY_SAMPLE = 20_000
+INSERT_CHUNK_ROWS = 5_000
+
+SYNTHETIC_HEADER = """-- ========================================================
+-- MEDLESS SYNTHETIC SEED FILE (GENERATED)
+-- ========================================================
+-- {size} synthetic medications, seed {seed}
+-- Generated by scripts/synthetic_catalog.py for load tests and
+-- benchmarks. NOT medication data - never apply to production.
+--
+-- Replays in place of the master seed (after migration 0008)
+-- ========================================================
+
+"""
+
+# "CYP2D6 (major)", "P-gp", "UGT1A4 (glucuronidation)": texts made only of
+# such segments are recombined, free text ("Kein CYP, renal eliminiert") is
+# sampled verbatim
+CYP_SEGMENT_PATTERN = re.compile(r'(?:CYP\d{1,2}[A-Z]{1,2}\d{0,3}|P-gp|BCRP|UGT\w*)(?: \([^()]*\))?')
+NAME_WORD_PATTERN = re.compile(r'[A-Za-zÄÖÜäöüß]{6,}')
+
+# Independent random streams per medication, so every table can be streamed
+# in its own pass and any row regenerated from (seed, stream, id) alone
+MEDICATION_STREAM, INTERACTION_STREAM, PROFILE_STREAM = range(3)
+
+def _rng(seed: int, stream: int, index: int) -> random.Random:
+    return random.Random((seed << 42) | (stream << 40) | index)
+
+def _jitter(value, factor: float):
+    """Scale a sampled number, keeping integers integral"""
+    if value is None:
+        return None
+    if isinstance(value, int):
+        return max(1, round(value * factor))
+    return round(value * factor, 2)
+
+def _cyp_segments(text: Optional[str]) -> Optional[List[str]]:
+    """Segments of a structured cyp450_enzyme text, None for free text"""
+    if not text:
+        return None
+    segments = text.split(', ')
+    if all(CYP_SEGMENT_PATTERN.fullmatch(segment) for segment in segments):
+        return segments
+    return None
+
+def _stems(names: List[str]):
+    """Leading and trailing syllables of real names for synthetic ones"""
+    words = [word for name in names if name for word in NAME_WORD_PATTERN.findall(name)]
+    return [word[:4] for word in words], [word[-4:].lower() for word in words]
+
+class CatalogProfile:
+    """Empirical distributions of a real catalog, per category where it matters"""
+
+    def __init__(self, categories: List[dict], medications: List[dict], interactions: List[dict],
+                 profiles: List[dict]):
+        self.categories = categories
+        self.medications = medications
+        self.interactions = interactions
+        self.profiles = profiles
+        self.export_columns = [c for c in AUDIT_COLUMNS if any(c in m for m in medications)]
+        by_category: Dict[int, List[dict]] = {}
+        for med in medications:
+            by_category.setdefault(med['category_id'], []).append(med)
+        self.category_ids = sorted(by_category, key=lambda c: (c is None, c))
+        self.category_weights = list(accumulate(len(by_category[c]) for c in self.category_ids))
+        self.pools: Dict[int, Dict[str, list]] = {}
+        plain_columns = [c for c in SEED_TABLES['medications'][1]
+                         if c not in ('id', 'name', 'generic_name', 'category_id', 'cyp450_enzyme', 'half_life_hours',
+                                      'therapeutic_min_ng_ml', 'therapeutic_max_ng_ml')]
+        self.plain_columns = plain_columns
+
+        interactions_by_med: Dict[int, List[dict]] = {}
+        for row in interactions:
+            interactions_by_med.setdefault(row['medication_id'], []).append(row)
+        meds_by_id = {m['id']: m for m in medications}
+
+        all_segments: List[str] = []
+        self.segment_counts: List[int] = []
+        for category, meds in by_category.items():
+            pool = {column: [m.get(column) for m in meds] for column in plain_columns}
+            pool['half_life_hours'] = [m.get('half_life_hours') for m in meds]
+            pool['range'] = [(m.get('therapeutic_min_ng_ml'), m.get('therapeutic_max_ng_ml')) for m in meds]
+            segments, free_texts = [], []
+            for m in meds:
+                parts = _cyp_segments(m.get('cyp450_enzyme'))
+                if parts is None:
+                    free_texts.append(m.get('cyp450_enzyme'))
+                else:
+                    segments.extend(parts)
+                    self.segment_counts.append(len(parts))
+            all_segments.extend(segments)
+            pool['cyp_segments'] = segments
+            pool['cyp_free'] = free_texts
+            pool['cyp_structured_share'] = 1 - len(free_texts) / len(meds)
+            pool['interaction_counts'] = [len(interactions_by_med.get(m['id'], [])) for m in meds]
+            pool['interactions'] = [(row, meds_by_id[row['medication_id']])
+                                    for m in meds for row in interactions_by_med.get(m['id'], [])]
+            self.pools[category] = pool
+        for pool in self.pools.values():
+            if len(set(pool['cyp_segments'])) < MIN_CATEGORY_SEGMENTS:
+                pool['cyp_segments'] = all_segments
+
+        self.brand_prefixes, self.brand_suffixes = _stems([m.get('name') for m in medications])
+        self.generic_prefixes, self.generic_suffixes = _stems([m.get('generic_name') for m in medications])
+
+        # P(profile rows | CYP enzymes in cyp450_enzyme), rows per profiled
+        # medication, then effect and note per role
+        profiled = Counter(row['medication_id'] for row in profiles)
+        self.profile_row_counts = list(profiled.values())
+        self.profile_roles = [(row['cyp_enzyme'], row['role']) for row in profiles]
+        with_cyp = [m['id'] for m in medications if analyze_cyp_enzyme_field(m.get('cyp450_enzyme'))['has_cyp']]
+        self.profile_share = sum(1 for i in with_cyp if i in profiled) / len(with_cyp) if with_cyp else 0.0
+        self.profile_effects: Dict[str, list] = {}
+        self.profile_notes: Dict[str, list] = {}
+        for row in profiles:
+            self.profile_effects.setdefault(row['role'], []).append(row['cbd_effect_on_reduction'])
+            self.profile_notes.setdefault(row['role'], []).append((row['cyp_enzyme'], row['note']))
+
+def _decode(table: str, rows) -> List[dict]:
+    columns = SEED_TABLES[table][1]
+    return [dict(zip(columns, (sql_literal(v) for v in row))) for row in rows]
+
+def learn(export_path: str = DEFAULT_EXPORT_PATH, seed_path: str = MASTER_SEED) -> CatalogProfile:
+    """Profile the exported medications, seed interactions/CYP profiles and replica categories
+
+    Categories come from the replica because later migrations add the ids the
+    export already references.
+    """
+    seed = parse_seed_file(seed_path)
+    seed_meds = {m['id']: m for m in _decode('medications', seed['medications'])}
+    with open(export_path, 'r', encoding='utf-8') as f:
+        exported = json.load(f)[0]['results']
+    # The export carries the audit columns; the seed fills in the rest
+    medications = [dict(seed_meds.get(m['id'], {}), **m) for m in exported]
+
+    conn = build_local_replica()
+    columns = SEED_TABLES['medication_categories'][1]
+    categories = [dict(zip(columns, row))
+                  for row in conn.execute(f"SELECT {', '.join(columns)} FROM medication_categories ORDER BY id")]
+    conn.close()
+    return CatalogProfile(categories, medications, _decode('cbd_interactions', seed['cbd_interactions']),
+                          _decode('medication_cyp_profile', seed['medication_cyp_profile']))
+
+class SyntheticCatalog:
+    """size medications drawn from a profile; every row is a pure function of (seed, id)"""
+
+    def __init__(self, profile: CatalogProfile, size: int, seed: int = 0):
+        self.profile = profile
+        self.size = size
+        self.seed = seed
+
+    def _cyp_text(self, rng: random.Random, pool: dict) -> Optional[str]:
+        if rng.random() >= pool['cyp_structured_share']:
+            return rng.choice(pool['cyp_free'])
+        segments, seen = [], set()
+        for _ in range(rng.choice(self.profile.segment_counts)):
+            segment = rng.choice(pool['cyp_segments'])
+            enzyme = segment.split(' ', 1)[0]
+            if enzyme not in seen:
+                seen.add(enzyme)
+                segments.append(segment)
+        return ', '.join(segments)
+
+    def medication(self, index: int) -> dict:
+        """Medication row with id index"""
+        profile = self.profile
+        rng = _rng(self.seed, MEDICATION_STREAM, index)
+        category = profile.category_ids[bisect.bisect_right(profile.category_weights,
+                                                            rng.random() * profile.category_weights[-1])]
+        pool = profile.pools[category]
+        brand = rng.choice(profile.brand_prefixes) + rng.choice(profile.brand_suffixes)
+        generic = rng.choice(profile.generic_prefixes) + rng.choice(profile.generic_suffixes)
+        low, high = rng.choice(pool['range'])
+        range_factor = math.exp(rng.gauss(0, RANGE_SIGMA))
+        row = {
+            'id': index,
+            'name': f"{brand} {index}",
+            'generic_name': generic,
+            'category_id': category,
+            'cyp450_enzyme': self._cyp_text(rng, pool),
+            'half_life_hours': _jitter(rng.choice(pool['half_life_hours']), math.exp(rng.gauss(0, HALF_LIFE_SIGMA))),
+            'therapeutic_min_ng_ml': _jitter(low, range_factor),
+            'therapeutic_max_ng_ml': _jitter(high, range_factor),
+        }
+        for column in profile.plain_columns:
+            row[column] = rng.choice(pool[column])
+        return row
+
+    def interactions(self, med: dict) -> List[dict]:
+        """cbd_interactions rows of a medication (texts renamed to its names)"""
+        pool = self.profile.pools[med['category_id']]
+        rng = _rng(self.seed, INTERACTION_STREAM, med['id'])
+        rows = []
+        for _ in range(rng.choice(pool['interaction_counts'])):
+            template, source = rng.choice(pool['interactions'])
+            row = dict(template, medication_id=med['id'])
+            for column in ('description', 'mechanism', 'recommendation'):
+                if row[column]:
+                    for old, new in ((source.get('generic_name'), med['generic_name']),
+                                     (source.get('name'), med['name'])):
+                        if old:
+                            row[column] = row[column].replace(old, new)
+            rows.append(row)
+        return rows
+
+    def cyp_profile(self, med: dict) -> List[dict]:
+        """medication_cyp_profile rows for the CYP enzymes of cyp450_enzyme and sampled minor ones"""
+        profile = self.profile
+        rng = _rng(self.seed, PROFILE_STREAM, med['id'])
+        roles = [(enzyme, role) for enzyme, role in analyze_cyp_enzyme_field(med['cyp450_enzyme'])['cyp_roles']
+                 if enzyme.startswith('CYP')]
+        if not roles or rng.random() >= profile.profile_share:
+            return []
+        # As many rows as a seed profile has: the enzymes named in
+        # cyp450_enzyme first, topped up with sampled minor pathways
+        wanted = rng.choice(profile.profile_row_counts)
+        roles.extend(rng.choice(profile.profile_roles) for _ in range(2 * wanted))
+        rows, seen = [], set()
+        for enzyme, role in roles:
+            if len(rows) == wanted:
+                break
+            if enzyme in seen:
+                continue
+            seen.add(enzyme)
+            effects = profile.profile_effects.get(role) or profile.profile_effects['substrate']
+            source_enzyme, note = rng.choice(profile.profile_notes.get(role) or profile.profile_notes['substrate'])
+            rows.append({'medication_id': med['id'], 'cyp_enzyme': enzyme, 'role': role,
+                         'cbd_effect_on_reduction': rng.choice(effects),
+                         'note': note.replace(source_enzyme, enzyme) if note else note})
+        return rows
+
+    def medications(self, limit: Optional[int] = None) -> Iterator[dict]:
+        """Medications with ids 1..size"""
+        return (self.medication(i) for i in range(1, min(self.size, limit or self.size) + 1))
+
+    def rows(self, table: str, limit: Optional[int] = None) -> Iterator[dict]:
+        """Stream one seed table (each call regenerates the medications it needs)"""
+        if table == 'medication_categories':
+            return iter(self.profile.categories)
+        if table == 'medications':
+            return self.medications(limit)
+        expand = self.interactions if table == 'cbd_interactions' else self.cyp_profile
+        return (row for med in self.medications(limit) for row in expand(med))
+
+def write_sql(catalog: SyntheticCatalog, path: str) -> Dict[str, int]:
+    """Multi-row seed SQL, replayable in place of the master seed"""
+    counts = {}
+    with open(path, 'w', encoding='utf-8') as f:
+        writer = SeedWriter(f, multi_row=True)
+        writer.write(SYNTHETIC_HEADER.format(size=catalog.size, seed=catalog.seed))
+        for table, (verb, columns) in SEED_TABLES.items():
+            writer.write("\n-- ========================================================\n")
+            writer.write(f"-- TABLE: {table}\n")
+            writer.write("-- ========================================================\n\n")
+            counts[table] = 0
+            for row in catalog.rows(table):
+                writer.write_insert(verb, table, columns, [escape_sql_string(row.get(c)) for c in columns])
+                counts[table] += 1
+            writer.flush()
+    return counts
+
+def write_json(catalog: SyntheticCatalog, path: str, all_tables: bool = False) -> Dict[str, int]:
+    """wrangler --json layout: medications export columns, or one result set per seed table"""
+    tables = list(SEED_TABLES) if all_tables else ['medications']
+    counts = {}
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('[')
+        for n, table in enumerate(tables):
+            columns = catalog.profile.export_columns if not all_tables else SEED_TABLES[table][1]
+            f.write(('\n  ' if n == 0 else ',\n  ') + '{"results": [')
+            counts[table] = 0
+            for row in catalog.rows(table):
+                f.write((',' if counts[table] else '') + '\n    ' +
+                        json.dumps({c: row.get(c) for c in columns}, ensure_ascii=False))
+                counts[table] += 1
+            f.write('\n  ], "success": true, "meta": {}}')
+        f.write('\n]\n')
+    return counts
+
+def write_sqlite(catalog: SyntheticCatalog, path: str) -> Dict[str, int]:
+    """Replica schema after all migrations with the synthetic rows in place of the seed
+
+    Medication rows keep the defaults of columns outside the seed (the
+    cyp*_substrate flags backfilled by id in later migrations).
+    """
+    conn = build_local_replica(path)
+    counts = {}
+    for table in reversed(list(SEED_TABLES)[1:]):
+        conn.execute(f"DELETE FROM {table}")
+    counts['medication_categories'] = len(catalog.profile.categories)
+    for table in list(SEED_TABLES)[1:]:
+        columns = SEED_TABLES[table][1]
+        statement = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+        rows = (tuple(row.get(c) for c in columns) for row in catalog.rows(table))
+        counts[table] = 0
+        while True:
+            chunk = list(islice(rows, INSERT_CHUNK_ROWS))
+            if not chunk:
+                break
+            conn.executemany(statement, chunk)
+            counts[table] += len(chunk)
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+    return counts
+
+def catalog_stats(medications, interactions, profiles) -> dict:
+    """Distribution summary of a catalog (single pass over each iterable)"""
+    total = 0
+    categories: Counter = Counter()
+    half_lives, withdrawal = [], []
+    no_cyp = structured = 0
+    for med in medications:
+        total += 1
+        categories[med['category_id']] += 1
+        if med['half_life_hours'] is not None:
+            half_lives.append(med['half_life_hours'])
+        if med.get('withdrawal_risk_score') is not None:
+            withdrawal.append(med['withdrawal_risk_score'])
+        if not med['cyp450_enzyme']:
+            no_cyp += 1
+        elif _cyp_segments(med['cyp450_enzyme']):
+            structured += 1
+    severities = Counter(row['severity'] for row in interactions)
+    roles = Counter(row['role'] for row in profiles)
+    half_lives.sort()
+
+    def quantile(q):
+        return half_lives[min(len(half_lives) - 1, int(q * len(half_lives)))] if half_lives else None
+
+    return {
+        'medications': total,
+        'top_categories': {c: round(n / total, 3) for c, n in categories.most_common(5)},
+        'half_life_p50': quantile(0.5),
+        'half_life_p90': quantile(0.9),
+        'half_life_missing': round(1 - len(half_lives) / total, 3),
+        'withdrawal_mean': round(sum(withdrawal) / len(withdrawal), 2) if withdrawal else None,
+        'cyp_missing': round(no_cyp / total, 3),
+        'cyp_structured': round(structured / total, 3),
+        'interactions_per_medication': round(sum(severities.values()) / total, 3),
+        'severities': {s: round(n / max(1, sum(severities.values())), 3) for s, n in severities.most_common()},
+        'cyp_profiles_per_medication': round(sum(roles.values()) / total, 3),
+    }
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Generate a seeded synthetic MEDLESS catalog at scale')
+    parser.add_argument('--medications', type=int, default=10_000, help='number of medications (default: 10000)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed; equal seeds give identical catalogs')
+    parser.add_argument('--output', help='file to write (default: synthetic_catalog_<N>.<format>)')
+    parser.add_argument('--format', choices=sorted(set(FORMATS.values())),
+                        help='sql (multi-row seed), json (wrangler export) or sqlite (default: from --output, else sql)')
+    parser.add_argument('--all-tables', action='store_true',
+                        help='json: one result set per seed table instead of the medications export only')
+    parser.add_argument('--export', default=DEFAULT_EXPORT_PATH, help='medications export to learn from')
+    parser.add_argument('--source-seed', default=MASTER_SEED, help='master seed to learn from')
+    profiling.add_profile_arguments(parser)
+    args = parser.parse_args()
+    profiling.start('synthetic_catalog', args)
+    if args.medications < 1 or args.medications >= 1 << 40:
+        parser.error('--medications must be between 1 and 2^40')
+    output_format = args.format or (FORMATS.get(os.path.splitext(args.output)[1].lower()) if args.output else None) \
+        or 'sql'
+    output_path = args.output or os.path.join(REPO_ROOT, f"synthetic_catalog_{args.medications}.{output_format}")
+
+    print("=" * 70)
+    print("MEDLESS SYNTHETIC CATALOG")
+    print("=" * 70)
+    for path in (args.export, args.source_seed):
+        if not os.path.exists(path):
+            print(f"❌ {path} not found")
+            sys.exit(1)
+    with profiling.phase('learn'):
+        profile = learn(args.export, args.source_seed)
+    print(f"Learned from {os.path.relpath(args.export, REPO_ROOT)} and {os.path.relpath(args.source_seed, REPO_ROOT)}: "
+          f"{profile.category_weights[-1]} medications in {len(profile.category_ids)} categories")
+    catalog = SyntheticCatalog(profile, args.medications, args.seed)
+
+    start = time.perf_counter()
+    with profiling.phase('write'):
+        if output_format == 'sql':
+            counts = write_sql(catalog, output_path)
+        elif output_format == 'json':
+            counts = write_json(catalog, output_path, args.all_tables)
+        else:
+            counts = write_sqlite(catalog, output_path)
+    elapsed = time.perf_counter() - start
+    profiling.count('rows', sum(counts.values()))
+    print(f"✅ {output_path} ({output_format}, {os.path.getsize(output_path):,} bytes, {elapsed:.1f}s)")
+    for table, count in counts.items():
+        print(f"   {table}: {count:,} rows")
+    print()
+
+    with profiling.phase('summary'):
+        learned = catalog_stats(profile.medications, profile.interactions, profile.profiles)
+        sample = min(args.medications, SUMMARY_SAMPLE)
+        generated = catalog_stats(catalog.medications(sample), catalog.rows('cbd_interactions', sample),
+                                  catalog.rows('medication_cyp_profile', sample))
+    print(f"Distributions (source vs. first {sample:,} synthetic medications):")
+    for key in learned:
+        if isinstance(learned[key], dict):
+            print(f"  {key}:")
+            print(f"    source    {learned[key]}")
+            print(f"    synthetic {generated[key]}")
+        elif key != 'medications':
+            print(f"  {key:<30}{learned[key]!s:>12}{generated[key]!s:>12}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+MEDLESS /api/analyze Query Tracer
+Replays analyze payloads against the local replica with the statement
+sequence of buildAnalyzeResponse and reports queries and time per phase
+"""
+
+import argparse
+import glob
+import json
+import os
+import random
+import re
+import sqlite3
+import statistics
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+from build_medication_aliases import normalize_alias
+from local_replica import REPO_ROOT, build_local_replica
+
+SOURCE_PATH = os.path.join(REPO_ROOT, 'src', 'index.tsx')
+SCENARIOS_DIR = os.path.join(REPO_ROOT, 'tests', 'analyze_scenarios')
+
+# Generated data the deployed queries join against (applied if present)
+ARTIFACTS = [
+    os.path.join(REPO_ROOT, 'medication_reduction_factors.sql'),
+    os.path.join(REPO_ROOT, 'medication_aliases.sql'),
+]
+
+PHASES = ['email', 'medication_lookup', 'interactions', 'cyp_profiles']
+
+def load_lookup_sql(path: str = SOURCE_PATH) -> Dict[str, str]:
+    """Read the lookup SQL fragments from src/index.tsx so the trace runs the deployed SQL
+
+    Returns MEDICATION_LOOKUP_COLUMNS / _JOINS with the precomputed
+    reduction factor columns and join appended, as lookupMedication() runs them.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    fragments = {}
+    for name in ('MEDICATION_LOOKUP_COLUMNS', 'MEDICATION_LOOKUP_JOINS',
+                 'REDUCTION_FACTOR_COLUMNS', 'REDUCTION_FACTOR_JOINS'):
+        match = re.search(rf"const {name} = `([^`]*)`;", source)
+        if not match:
+            raise RuntimeError(f"{name} not found in {os.path.relpath(path, REPO_ROOT)}")
+        fragments[name] = match.group(1)
+    return {
+        'MEDICATION_LOOKUP_COLUMNS': f"{fragments['MEDICATION_LOOKUP_COLUMNS']}, {fragments['REDUCTION_FACTOR_COLUMNS']}",
+        'MEDICATION_LOOKUP_JOINS': f"{fragments['MEDICATION_LOOKUP_JOINS']} {fragments['REDUCTION_FACTOR_JOINS']}",
+    }
+
+class TracingConnection:
+    """sqlite3 connection wrapper that records every statement with phase and timing"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.phase = None
+        self.statements: List[dict] = []
+
+    def execute(self, sql: str, params=()):
+        start = time.perf_counter()
+        rows = self.conn.execute(sql, params).fetchall()
+        elapsed = time.perf_counter() - start
+        self.statements.append({
+            'phase': self.phase,
+            'sql': ' '.join(sql.split()),
+            'params': list(params),
+            'ms': elapsed * 1000,
+            'rows': len(rows),
+        })
+        return rows
+
+    def reset(self):
+        statements, self.statements = self.statements, []
+        return statements
+
+def _medication_names(payload: dict) -> List[str]:
+    """Normalized names as buildAnalyzeResponse sees them"""
+    return [med.get('name') or med.get('generic_name') or 'Unbekanntes Medikament'
+            for med in payload.get('medications') or []]
+
+def replay_sequential(db: TracingConnection, payload: dict, sql: Dict[str, str]):
+    """Statement sequence of buildAnalyzeResponse: 3 queries per medication, one after another"""
+    email = payload.get('email') or (payload.get('patient') or {}).get('email')
+    if email:
+        db.phase = 'email'
+        try:
+            db.execute("INSERT INTO customer_emails (email, first_name, created_at) "
+                       "VALUES (?, ?, CURRENT_TIMESTAMP)", (email, payload.get('firstName')))
+        except sqlite3.IntegrityError:
+            pass  # 'Email already exists' is swallowed by the route as well
+
+    columns, joins = sql['MEDICATION_LOOKUP_COLUMNS'], sql['MEDICATION_LOOKUP_JOINS']
+    for name in _medication_names(payload):
+        db.phase = 'medication_lookup'
+        rows = db.execute(f"SELECT {columns} FROM medication_aliases a "
+                          f"JOIN medications m ON m.id = a.medication_id {joins} "
+                          f"WHERE a.alias = ? LIMIT 1", (normalize_alias(name),))
+        if not rows:
+            rows = db.execute(f"SELECT {columns} FROM medications m {joins} "
+                              f"WHERE m.name LIKE ? OR m.generic_name LIKE ? LIMIT 1",
+                              (f"%{name}%", f"%{name}%"))
+        if not rows:
+            continue
+        medication_id = rows[0][0]
+        db.phase = 'interactions'
+        db.execute("SELECT * FROM cbd_interactions WHERE medication_id = ?", (medication_id,))
+        db.phase = 'cyp_profiles'
+        db.execute("SELECT id, medication_id, cyp_enzyme, role, cbd_effect_on_reduction, note "
+                   "FROM medication_cyp_profile WHERE medication_id = ? ORDER BY cyp_enzyme",
+                   (medication_id,))
+
+def replay_batched(db: TracingConnection, payload: dict, sql: Dict[str, str]):
+    """Candidate batching: one statement per phase for all medications (IN lists)"""
+    email = payload.get('email') or (payload.get('patient') or {}).get('email')
+    if email:
+        db.phase = 'email'
+        db.execute("INSERT OR IGNORE INTO customer_emails (email, first_name, created_at) "
+                   "VALUES (?, ?, CURRENT_TIMESTAMP)", (email, payload.get('firstName')))
+
+    names = _medication_names(payload)
+    if not names:
+        return
+    columns, joins = sql['MEDICATION_LOOKUP_COLUMNS'], sql['MEDICATION_LOOKUP_JOINS']
+    db.phase = 'medication_lookup'
+    aliases = [normalize_alias(name) for name in names]
+    found = db.execute(f"SELECT a.alias, {columns} FROM medication_aliases a "
+                       f"JOIN medications m ON m.id = a.medication_id {joins} "
+                       f"WHERE a.alias IN ({', '.join('?' * len(aliases))})", aliases)
+    ids = {row[0]: row[1] for row in found}
+    for name, alias in zip(names, aliases):
+        if alias not in ids:
+            rows = db.execute(f"SELECT {columns} FROM medications m {joins} "
+                              f"WHERE m.name LIKE ? OR m.generic_name LIKE ? LIMIT 1",
+                              (f"%{name}%", f"%{name}%"))
+            if rows:
+                ids[alias] = rows[0][0]
+    medication_ids = sorted(set(ids.values()))
+    if not medication_ids:
+        return
+    placeholders = ', '.join('?' * len(medication_ids))
+    db.phase = 'interactions'
+    db.execute(f"SELECT * FROM cbd_interactions WHERE medication_id IN ({placeholders})", medication_ids)
+    db.phase = 'cyp_profiles'
+    db.execute(f"SELECT id, medication_id, cyp_enzyme, role, cbd_effect_on_reduction, note "
+               f"FROM medication_cyp_profile WHERE medication_id IN ({placeholders}) "
+               f"ORDER BY medication_id, cyp_enzyme", medication_ids)
+
+STRATEGIES = {'sequential': replay_sequential, 'batched': replay_batched}
+
+def load_payloads(paths: List[str]) -> List[dict]:
+    """Payloads from scenario files ({"scenarios": [{"payload": ...}]}) or JSONL request logs"""
+    payloads = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            if path.endswith('.jsonl'):
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        payloads.append({'name': record.get('name', os.path.basename(path)),
+                                         'payload': record.get('payload', record)})
+            else:
+                for scenario in json.load(f).get('scenarios', []):
+                    payloads.append({'name': scenario['name'], 'payload': scenario['payload']})
+    return payloads
+
+def synthetic_payloads(conn: sqlite3.Connection, sizes: List[int], per_size: int, seed: int) -> List[dict]:
+    """Payloads with N random catalog medications for the scaling curve"""
+    names = [row[0] for row in conn.execute("SELECT name FROM medications ORDER BY id")]
+    rng = random.Random(seed)
+    payloads = []
+    for size in sizes:
+        for i in range(per_size):
+            meds = [{'name': name, 'mgPerDay': 10} for name in rng.sample(names, min(size, len(names)))]
+            payloads.append({'name': f"synthetic_{size}_{i}", 'size': size, 'payload': {
+                'medications': meds, 'reductionGoal': 50, 'durationWeeks': 12,
+            }})
+    return payloads
+
+def trace(db: TracingConnection, strategy, payloads: List[dict], sql: Dict[str, str], repeat: int):
+    """Replay every payload `repeat` times, return one record per request"""
+    requests = []
+    for entry in payloads:
+        for _ in range(repeat):
+            db.reset()
+            start = time.perf_counter()
+            strategy(db, entry['payload'], sql)
+            total_ms = (time.perf_counter() - start) * 1000
+            requests.append({
+                'name': entry['name'],
+                'medications': len(entry['payload'].get('medications') or []),
+                'total_ms': total_ms,
+                'statements': db.reset(),
+            })
+    return requests
+
+def n_plus_one(requests: List[dict]) -> Dict[str, int]:
+    """Statement shapes executed once per medication within one request"""
+    shapes = defaultdict(int)
+    for request in requests:
+        if request['medications'] < 2:
+            continue
+        counts = defaultdict(int)
+        for statement in request['statements']:
+            counts[re.sub(r'\(\?(, \?)*\)', '(?...)', statement['sql'])[:90]] += 1
+        for shape, count in counts.items():
+            if count >= request['medications']:
+                shapes[shape] += 1
+    return shapes
+
+def print_report(strategy_name: str, requests: List[dict], round_trip_ms: float = 0.0):
+    """Print per-request, per-phase and scaling summaries"""
+    print(f"--- Strategy: {strategy_name} ({len(requests)} requests) ---")
+    queries = [len(r['statements']) for r in requests]
+    totals = [r['total_ms'] for r in requests]
+    print(f"Queries per request: avg {statistics.mean(queries):.1f}, max {max(queries)}")
+    print(f"DB time per request: avg {statistics.mean(totals):.3f} ms, max {max(totals):.3f} ms")
+    if round_trip_ms:
+        # Awaited one after another, every statement pays the D1 round trip
+        estimated = [r['total_ms'] + len(r['statements']) * round_trip_ms for r in requests]
+        print(f"Estimated with {round_trip_ms:g} ms/statement round trip: "
+              f"avg {statistics.mean(estimated):.1f} ms, max {max(estimated):.1f} ms")
+
+    print(f"{'phase':20s} {'queries':>8s} {'per req':>8s} {'total ms':>10s} {'avg ms':>8s}")
+    for phase in PHASES:
+        timings = [s['ms'] for r in requests for s in r['statements'] if s['phase'] == phase]
+        if timings:
+            print(f"{phase:20s} {len(timings):8d} {len(timings) / len(requests):8.2f} "
+                  f"{sum(timings):10.3f} {statistics.mean(timings):8.4f}")
+
+    by_size = defaultdict(list)
+    for request in requests:
+        by_size[request['medications']].append(request)
+    print(f"{'meds':>5s} {'requests':>9s} {'queries':>8s} {'avg ms':>8s} {'p95 ms':>8s} {'est ms':>8s}")
+    for size in sorted(by_size):
+        group = by_size[size]
+        times = sorted(r['total_ms'] for r in group)
+        p95 = times[max(0, int(round(0.95 * len(times))) - 1)]
+        queries = statistics.mean(len(r['statements']) for r in group)
+        print(f"{size:5d} {len(group):9d} {queries:8.1f} {statistics.mean(times):8.3f} {p95:8.3f} "
+              f"{statistics.mean(times) + queries * round_trip_ms:8.3f}")
+
+    shapes = n_plus_one(requests)
+    if shapes:
+        print("N+1 statements (executed >= once per medication):")
+        for shape, count in sorted(shapes.items(), key=lambda item: -item[1]):
+            print(f"  {count:4d} requests: {shape}")
+    print()
+
+def write_log(path: str, strategy_name: str, requests: List[dict]):
+    """Append one JSON line per statement"""
+    with open(path, 'a', encoding='utf-8') as f:
+        for number, request in enumerate(requests):
+            for statement in request['statements']:
+                f.write(json.dumps({'strategy': strategy_name, 'request': number, 'payload': request['name'],
+                                    'medications': request['medications'], **statement},
+                                   ensure_ascii=False) + '\n')
+
+def parse_sizes(spec: str) -> List[int]:
+    """Parse '1,2,4,8' into medication counts"""
+    return [int(size) for size in spec.split(',') if size]
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Trace the /api/analyze statement sequence against the local replica')
+    parser.add_argument('payloads', nargs='*',
+                        help='scenario JSON files or JSONL request logs (default: tests/analyze_scenarios/*.json)')
+    parser.add_argument('--db', help='existing SQLite replica (default: replay migrations in memory)')
+    parser.add_argument('--strategy', choices=['sequential', 'batched', 'both'], default='both',
+                        help='sequential: current buildAnalyzeResponse; batched: one query per phase')
+    parser.add_argument('--sizes', default='1,2,4,8,16', help='medication counts of synthetic payloads')
+    parser.add_argument('--per-size', type=int, default=20, help='synthetic payloads per size (0: none)')
+    parser.add_argument('--repeat', type=int, default=3, help='replays per payload')
+    parser.add_argument('--seed', type=int, default=1, help='random seed for synthetic payloads')
+    parser.add_argument('--round-trip-ms', type=float, default=0.0,
+                        help='per-statement D1 round trip added to the estimate column')
+    parser.add_argument('--log', help='append every statement as JSONL to this file')
+    args = parser.parse_args()
+
+    if args.db:
+        conn = sqlite3.connect(args.db)
+    else:
+        conn = build_local_replica()
+        for path in ARTIFACTS:
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    conn.executescript(f.read())
+    sql = load_lookup_sql()
+
+    paths = args.payloads or sorted(glob.glob(os.path.join(SCENARIOS_DIR, '*.json')))
+    payloads = load_payloads(paths)
+    if args.per_size:
+        payloads += synthetic_payloads(conn, parse_sizes(args.sizes), args.per_size, args.seed)
+
+    print("=" * 70)
+    print("MEDLESS /api/analyze QUERY TRACE")
+    print("=" * 70)
+    print(f"{len(payloads)} payloads x {args.repeat} replays")
+    print()
+
+    strategies = list(STRATEGIES) if args.strategy == 'both' else [args.strategy]
+    db = TracingConnection(conn)
+    for name in strategies:
+        requests = trace(db, STRATEGIES[name], payloads, sql, args.repeat)
+        conn.rollback()
+        print_report(name, requests, args.round_trip_ms)
+        if args.log:
+            write_log(args.log, name, requests)
+    conn.close()
+
+if __name__ == '__main__':
+    main()
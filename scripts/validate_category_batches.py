@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+MEDLESS Category Batch Validator
+Parses every migrations/0xx_fix_medication_categories_batch_*.sql file in one
+pass and reports duplicates, cross-batch overlaps and uncategorized rows
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+from typing import Dict, List, NamedTuple
+
+from binary_catalog import DEFAULT_OUTPUT_PATH as DEFAULT_CATALOG_PATH, BinaryCatalog
+from local_replica import MIGRATIONS_DIR, REPO_ROOT, build_local_replica, replay_files
+import profiling
+
+BATCH_GLOB = '0*_fix_medication_categories_batch_*.sql'
+BATCH_NUMBER_PATTERN = re.compile(r'batch_(\d+)\.sql$')
+UPDATE_PATTERN = re.compile(
+    r'UPDATE\s+medications\s+SET\s+category_id\s*=\s*(\d+)\s+WHERE\s+id\s+IN\s*\(([^)]*)\)',
+    re.IGNORECASE,
+)
+ANY_UPDATE_PATTERN = re.compile(r'\bUPDATE\s+medications\b', re.IGNORECASE)
+ID_PATTERN = re.compile(r'\d+')
+ID_COMMENT_PATTERN = re.compile(r'^\s*(\d+)\s*,?\s*--\s*(.+?)\s*$')
+
+class Assignment(NamedTuple):
+    """One id of one UPDATE ... SET category_id statement"""
+    batch: int
+    category_id: int
+    path: str
+    label: str
+
+def batch_files(migrations_dir: str = MIGRATIONS_DIR) -> List[str]:
+    """Batch migrations ordered by batch number"""
+    paths = glob.glob(os.path.join(migrations_dir, BATCH_GLOB))
+    return sorted(paths, key=lambda p: int(BATCH_NUMBER_PATTERN.search(p).group(1)))
+
+def parse_batch_file(path: str):
+    """(category_id, [ids], {id: comment}) per UPDATE statement and the count of unparsed UPDATEs
+
+    Full-line comments (rollback/verification snippets) are ignored; trailing
+    comments after an id are kept as its label.
+    """
+    code_lines, labels = [], {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.lstrip().startswith('--'):
+                continue
+            match = ID_COMMENT_PATTERN.match(line)
+            if match:
+                labels[int(match.group(1))] = match.group(2)
+            code_lines.append(line.split('--', 1)[0])
+    code = ''.join(code_lines)
+
+    statements = [(int(category), [int(i) for i in ID_PATTERN.findall(ids)])
+                  for category, ids in UPDATE_PATTERN.findall(code)]
+    unparsed = len(ANY_UPDATE_PATTERN.findall(code)) - len(statements)
+    return statements, labels, unparsed
+
+def build_index(paths: List[str]):
+    """Single pass over all batch files: id -> [Assignment], plus unparsed statements per file"""
+    index: Dict[int, List[Assignment]] = {}
+    unparsed: Dict[str, int] = {}
+    for path in paths:
+        batch = int(BATCH_NUMBER_PATTERN.search(path).group(1))
+        statements, labels, skipped = parse_batch_file(path)
+        if skipped:
+            unparsed[path] = skipped
+        for category_id, ids in statements:
+            for med_id in ids:
+                index.setdefault(med_id, []).append(
+                    Assignment(batch, category_id, path, labels.get(med_id, '')))
+    return index, unparsed
+
+def classify(index: Dict[int, List[Assignment]]):
+    """Duplicates inside a batch and overlaps between batches, in one pass over the index"""
+    duplicates, overlaps = {}, {}
+    for med_id, assignments in index.items():
+        batches = [a.batch for a in assignments]
+        if len(set(batches)) < len(batches):
+            duplicates[med_id] = assignments
+        if len(set(batches)) > 1:
+            overlaps[med_id] = assignments
+    return duplicates, overlaps
+
+def _describe(assignments: List[Assignment]) -> str:
+    return ', '.join(f"batch {a.batch} -> {a.category_id}" for a in assignments)
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Validate all category batch migrations together')
+    parser.add_argument('--migrations', default=MIGRATIONS_DIR, help='migrations directory')
+    parser.add_argument('--batch', type=int, help='also print the category distribution of this batch')
+    parser.add_argument('--limit', type=int, default=10, help='ids to list per finding')
+    parser.add_argument('--catalog', nargs='?', const=DEFAULT_CATALOG_PATH, metavar='BIN',
+                        help='read the replayed state from scripts/binary_catalog.py output instead of replaying')
+    profiling.add_profile_arguments(parser)
+    args = parser.parse_args()
+    profiling.start('validate_category_batches', args)
+
+    with profiling.phase('parse'):
+        paths = batch_files(args.migrations)
+        index, unparsed = build_index(paths)
+    with profiling.phase('analyze'):
+        duplicates, overlaps = classify(index)
+    profiling.count('batch_files', len(paths))
+
+    with profiling.phase('load'):
+        if args.catalog:
+            with BinaryCatalog(args.catalog) as catalog:
+                categories = dict(zip(catalog.medication_categories.column('id'),
+                                      catalog.medication_categories.column('name')))
+                medications = {m['id']: (m['name'], m['category_id']) for m in catalog.medications}
+        else:
+            conn = build_local_replica(files=replay_files(args.migrations))
+            categories = dict(conn.execute("SELECT id, name FROM medication_categories").fetchall())
+            medications = {row[0]: (row[1], row[2])
+                           for row in conn.execute("SELECT id, name, category_id FROM medications")}
+            conn.close()
+    profiling.count('medications', len(medications))
+
+    print("=" * 70)
+    print("MEDLESS CATEGORY BATCH VALIDATION")
+    print("=" * 70)
+    per_batch: Dict[int, Dict[int, int]] = {}
+    for assignments in index.values():
+        for a in assignments:
+            per_batch.setdefault(a.batch, {})
+            per_batch[a.batch][a.category_id] = per_batch[a.batch].get(a.category_id, 0) + 1
+    for path in paths:
+        batch = int(BATCH_NUMBER_PATTERN.search(path).group(1))
+        counts = per_batch.get(batch, {})
+        print(f"Batch {batch}: {sum(counts.values()):3d} ids in {len(counts):2d} categories  "
+              f"({os.path.relpath(path, REPO_ROOT)})")
+    print(f"Total: {sum(len(a) for a in index.values())} assignments, {len(index)} distinct ids")
+    print()
+
+    unknown_ids = sorted(i for i in index if i not in medications)
+    unknown_categories = sorted({a.category_id for assignments in index.values() for a in assignments
+                                 if a.category_id not in categories})
+    not_applied = sorted(i for i, assignments in index.items()
+                         if i in medications and medications[i][1] != assignments[0].category_id)
+    uncategorized = sorted(i for i, (_, category_id) in medications.items() if not category_id)
+
+    findings = [
+        ('Duplicate ids within a batch', [f"{i}: {_describe(duplicates[i])}" for i in sorted(duplicates)]),
+        ('Ids assigned by several batches', [f"{i}: {_describe(overlaps[i])}" for i in sorted(overlaps)]),
+        ('Ids not in the medications table', [f"{i} ({index[i][0].label or '?'})" for i in unknown_ids]),
+        ('Unknown category ids', [str(c) for c in unknown_categories]),
+        ('Unparsed UPDATE medications statements',
+         [f"{os.path.relpath(p, REPO_ROOT)}: {n}" for p, n in unparsed.items()]),
+        ('Uncategorized medications after replay',
+         [f"{i} ({medications[i][0]})" for i in uncategorized]),
+    ]
+    failed = False
+    for title, items in findings:
+        failed |= bool(items)
+        print(f"{'❌' if items else '✅'} {title}: {len(items)}")
+        for item in items[:args.limit]:
+            print(f"   {item}")
+        if len(items) > args.limit:
+            print(f"   ... {len(items) - args.limit} more")
+
+    # Batches only touch NULL/0 rows, so ids categorized earlier keep their category
+    print(f"ℹ️  Ids whose final category differs from their first batch (guarded UPDATE): {len(not_applied)}")
+
+    if args.batch is not None:
+        print()
+        print(f"Batch {args.batch} category distribution:")
+        for category_id, count in sorted(per_batch.get(args.batch, {}).items()):
+            print(f"  Kategorie {category_id:2d} ({categories.get(category_id, 'Unknown')}): {count} medications")
+
+    print("=" * 70)
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
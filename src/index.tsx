@@ -60,6 +60,14 @@ interface MedicationWithCategory {
   // Note: max_weekly_reduction_pct also exists as medication-specific field
   // Note: can_reduce_to_zero also exists as medication-specific field
   cbd_interaction_strength?: 'low' | 'medium' | 'high' | 'critical' | null;
+
+  // ===== Precomputed reduction factors (medication_reduction_factors, LEFT JOIN) =====
+  // Built by scripts/build_reduction_factors.py; null if the table was not loaded
+  half_life_factor?: number | null;
+  cyp_factor?: number | null;
+  therapeutic_window_factor?: number | null;
+  withdrawal_factor?: number | null;
+  catalog_key?: string | null;  // catalog inputs the factors were built from
 }
 
 // ============================================================
@@ -173,6 +181,65 @@ function evaluateTherapeuticRange(
   return warnings;
 }
 
+// ============================================================
+// REDUCTION FACTORS: Catalog-only phases of applyCategorySafetyRules
+// ============================================================
+// These depend only on catalog data. scripts/build_reduction_factors.py
+// precomputes them into medication_reduction_factors with the same rules;
+// the functions below are the fallback when no current precomputed row exists.
+
+// Catalog inputs of the factors: half-life|tr_min|tr_max|withdrawal score|
+// any 'slower' + any 'faster' CYP profile (Marcumar: "40|||10|10"). Must match
+// catalog_key() in scripts/build_reduction_factors.py.
+function getReductionFactorKey(medication: MedicationWithCategory, cypProfiles: MedicationCypProfile[]): string {
+  const fields = [
+    medication.half_life_hours,
+    medication.therapeutic_min_ng_ml,
+    medication.therapeutic_max_ng_ml,
+    medication.withdrawal_risk_score
+  ].map(value => value == null ? '' : String(value));
+  const slower = cypProfiles.some(p => p.cbd_effect_on_reduction === 'slower') ? '1' : '0';
+  const faster = cypProfiles.some(p => p.cbd_effect_on_reduction === 'faster') ? '1' : '0';
+  return [...fields, slower + faster].join('|');
+}
+
+// Precomputed row built from the same catalog inputs as the live row, or null
+// (no row, or stale after a catalog change: factors are then derived live)
+function getPrecomputedFactors(medication: MedicationWithCategory, cypProfiles: MedicationCypProfile[]): MedicationWithCategory | null {
+  if (medication.catalog_key == null) return null;
+  return medication.catalog_key === getReductionFactorKey(medication, cypProfiles) ? medication : null;
+}
+
+// Phase 3: 5 half-lives = steady state; > 7 days → 0.5, > 3 days → 0.75
+function getHalfLifeFactor(halfLifeHours?: number | null): number {
+  if (!halfLifeHours || halfLifeHours <= 0) return 1.0;
+  const steadyStateDays = (halfLifeHours * 5) / 24;
+  if (steadyStateDays > 7) return 0.5;
+  if (steadyStateDays > 3) return 0.75;
+  return 1.0;
+}
+
+// Phase 4: any 'slower' profile → 0.7, otherwise any 'faster' profile → 1.15
+function getCypFactor(cypProfiles: MedicationCypProfile[]): number {
+  if (cypProfiles.some(p => p.cbd_effect_on_reduction === 'slower')) return 0.7;
+  if (cypProfiles.some(p => p.cbd_effect_on_reduction === 'faster')) return 1.15;
+  return 1.0;
+}
+
+// Phase 5: narrow window (≤50 ng/ml) + high withdrawal risk (≥7) → 0.8
+function getTherapeuticWindowFactor(medication: MedicationWithCategory): number {
+  if (medication.therapeutic_min_ng_ml == null || medication.therapeutic_max_ng_ml == null) return 1.0;
+  const windowWidth = medication.therapeutic_max_ng_ml - medication.therapeutic_min_ng_ml;
+  const hasHighWithdrawalRisk = (medication.withdrawal_risk_score || 0) >= 7;
+  return windowWidth <= 50 && hasHighWithdrawalRisk ? 0.8 : 1.0;
+}
+
+// Phase 6: 1 - (withdrawal_risk_score / 10 * 0.25)
+function getWithdrawalFactor(withdrawalRiskScore?: number | null): number {
+  if (!withdrawalRiskScore || withdrawalRiskScore <= 0) return 1.0;
+  return 1 - (withdrawalRiskScore / 10 * 0.25);
+}
+
 // ============================================================
 // SAFETY FUNCTION: Apply Category-Based Reduction Limits
 // ============================================================
@@ -289,24 +356,20 @@ function applyCategorySafetyRules(params: {
   }
   
   // ===== NEW: Apply half-life-based reduction factor (Migration 0005) =====
-  if (category.half_life_hours && category.half_life_hours > 0) {
-    const steadyStateDays = (category.half_life_hours * 5) / 24; // 5 half-lives = steady state
-    
-    if (steadyStateDays > 7) {
-      // Long half-life (> 7 days steady state) - reduce speed by 50%
-      effectiveWeeklyReduction *= 0.5;
-      limitedByCategory = true;
-      safetyNotes.push(
-        `🕐 ${medicationName}: Lange Halbwertszeit (${Math.round(category.half_life_hours)}h) - Reduktion auf 50% verlangsamt`
-      );
-    } else if (steadyStateDays > 3) {
-      // Medium half-life (3-7 days) - reduce speed by 25%
-      effectiveWeeklyReduction *= 0.75;
-      limitedByCategory = true;
-      safetyNotes.push(
-        `🕐 ${medicationName}: Mittlere Halbwertszeit (${Math.round(category.half_life_hours)}h) - Reduktion auf 75% angepasst`
-      );
-    }
+  // Precomputed factors (medication_reduction_factors) are used when their
+  // catalog_key matches this row; otherwise derived from the raw catalog fields.
+  const precomputed = getPrecomputedFactors(category, cypProfiles);
+  const halfLifeFactor = precomputed?.half_life_factor ?? getHalfLifeFactor(category.half_life_hours);
+  
+  if (halfLifeFactor < 1.0) {
+    // Long half-life (> 7 days steady state, 0.5) or medium (3-7 days, 0.75):
+    // slow down by the factor; tiers split at 0.625 so rounding cannot skip them
+    const isLongHalfLife = halfLifeFactor < 0.625;
+    effectiveWeeklyReduction *= halfLifeFactor;
+    limitedByCategory = true;
+    safetyNotes.push(
+      `🕐 ${medicationName}: ${isLongHalfLife ? 'Lange' : 'Mittlere'} Halbwertszeit (${Math.round(category.half_life_hours || 0)}h) - Reduktion auf ${Math.round(halfLifeFactor * 100)}% ${isLongHalfLife ? 'verlangsamt' : 'angepasst'}`
+    );
   }
   
   // ===== NEW P0: CYP450-BASED DOSAGE ADJUSTMENT (CRITICAL FEATURE) =====
@@ -321,72 +384,55 @@ function applyCategorySafetyRules(params: {
   // Priority: If ANY profile shows 'slower', apply cautious approach (30% reduction)
   // Only if ALL profiles are 'faster' (and none 'slower'), allow slightly faster reduction
   
-  let cypAdjustmentApplied = false;
-  let cypAdjustmentFactor = 1.0;
+  const cypAdjustmentFactor = precomputed?.cyp_factor ?? getCypFactor(cypProfiles);
+  const cypAdjustmentApplied = cypAdjustmentFactor !== 1.0;
   
-  if (cypProfiles && cypProfiles.length > 0) {
-    const hasSlowerEffect = cypProfiles.some(p => p.cbd_effect_on_reduction === 'slower');
-    const hasFasterEffect = cypProfiles.some(p => p.cbd_effect_on_reduction === 'faster');
-    const allNeutral = cypProfiles.every(p => p.cbd_effect_on_reduction === 'neutral' || p.cbd_effect_on_reduction === null);
+  if (cypAdjustmentFactor < 1.0) {
+    // CRITICAL: CBD inhibits CYP enzyme → medication accumulates → SLOWER tapering required
+    // Example: Warfarin (CYP2C9 substrate) + CBD (CYP2C9 inhibitor) → higher warfarin levels
+    effectiveWeeklyReduction *= cypAdjustmentFactor; // 30% slower reduction
+    limitedByCategory = true;
     
-    if (hasSlowerEffect) {
-      // CRITICAL: CBD inhibits CYP enzyme → medication accumulates → SLOWER tapering required
-      // Example: Warfarin (CYP2C9 substrate) + CBD (CYP2C9 inhibitor) → higher warfarin levels
-      cypAdjustmentFactor = 0.7; // 30% slower reduction
-      effectiveWeeklyReduction *= cypAdjustmentFactor;
-      cypAdjustmentApplied = true;
-      limitedByCategory = true;
-      
-      const affectedEnzymes = cypProfiles
-        .filter(p => p.cbd_effect_on_reduction === 'slower')
-        .map(p => p.cyp_enzyme)
-        .join(', ');
-      
-      safetyNotes.push(
-        `🧬 ${medicationName}: CYP-Hemmung unter CBD erkannt (${affectedEnzymes}) - Reduktion wird automatisch um 30% verlangsamt für mehr Sicherheit`
-      );
-      
-    } else if (hasFasterEffect && !hasSlowerEffect && !allNeutral) {
-      // RARE CASE: CBD does NOT inhibit clearance (e.g., UGT-metabolized drugs like Lorazepam)
-      // Slightly faster reduction MAY be safe, but still conservative (15% faster only)
-      cypAdjustmentFactor = 1.15; // 15% faster reduction (conservative)
-      effectiveWeeklyReduction *= cypAdjustmentFactor;
-      cypAdjustmentApplied = true;
-      
-      const affectedEnzymes = cypProfiles
-        .filter(p => p.cbd_effect_on_reduction === 'faster')
-        .map(p => p.cyp_enzyme)
-        .join(', ');
-      
-      safetyNotes.push(
-        `🧬 ${medicationName}: CYP-Konstellation unter CBD erlaubt leicht schnellere Reduktion (${affectedEnzymes}) - Anpassung: +15%, weiterhin mit ärztlicher Kontrolle`
-      );
-    }
-    // If allNeutral: no adjustment needed, effectiveWeeklyReduction stays unchanged
+    const affectedEnzymes = cypProfiles
+      .filter(p => p.cbd_effect_on_reduction === 'slower')
+      .map(p => p.cyp_enzyme)
+      .join(', ');
+    
+    safetyNotes.push(
+      `🧬 ${medicationName}: CYP-Hemmung unter CBD erkannt (${affectedEnzymes}) - Reduktion wird automatisch um 30% verlangsamt für mehr Sicherheit`
+    );
+    
+  } else if (cypAdjustmentFactor > 1.0) {
+    // RARE CASE: CBD does NOT inhibit clearance (e.g., UGT-metabolized drugs like Lorazepam)
+    // Slightly faster reduction MAY be safe, but still conservative (15% faster only)
+    effectiveWeeklyReduction *= cypAdjustmentFactor; // 15% faster reduction (conservative)
+    
+    const affectedEnzymes = cypProfiles
+      .filter(p => p.cbd_effect_on_reduction === 'faster')
+      .map(p => p.cyp_enzyme)
+      .join(', ');
+    
+    safetyNotes.push(
+      `🧬 ${medicationName}: CYP-Konstellation unter CBD erlaubt leicht schnellere Reduktion (${affectedEnzymes}) - Anpassung: +15%, weiterhin mit ärztlicher Kontrolle`
+    );
   }
+  // If allNeutral: no adjustment needed, effectiveWeeklyReduction stays unchanged
   
   // ===== NEW P0 TASK #2: THERAPEUTIC RANGE ADJUSTMENT =====
   // If medication has a narrow therapeutic window AND high withdrawal risk,
   // apply additional safety brake (20% slower reduction)
   // This runs AFTER CYP adjustment but BEFORE final max_weekly_reduction_pct enforcement
   
-  let therapeuticRangeAdjustmentApplied = false;
+  const therapeuticWindowFactor = precomputed?.therapeutic_window_factor ?? getTherapeuticWindowFactor(category);
   
-  if (category.therapeutic_min_ng_ml != null && category.therapeutic_max_ng_ml != null) {
-    const windowWidth = category.therapeutic_max_ng_ml - category.therapeutic_min_ng_ml;
-    const hasNarrowWindow = windowWidth <= 50; // HEURISTIC: ≤50 ng/ml range is considered narrow
-    const hasHighWithdrawalRisk = (category.withdrawal_risk_score || 0) >= 7;
+  if (therapeuticWindowFactor < 1.0) {
+    // Apply additional 20% reduction to weekly speed for extra safety
+    effectiveWeeklyReduction *= therapeuticWindowFactor; // 20% slower
+    limitedByCategory = true;
     
-    if (hasNarrowWindow && hasHighWithdrawalRisk) {
-      // Apply additional 20% reduction to weekly speed for extra safety
-      effectiveWeeklyReduction *= 0.8; // 20% slower
-      therapeuticRangeAdjustmentApplied = true;
-      limitedByCategory = true;
-      
-      safetyNotes.push(
-        `🧪 ${medicationName}: Enges therapeutisches Fenster (${category.therapeutic_min_ng_ml}-${category.therapeutic_max_ng_ml} ng/ml) + hohes Absetzrisiko (${category.withdrawal_risk_score}/10) - Reduktion wird vorsichtshalber zusätzlich um 20% verlangsamt.`
-      );
-    }
+    safetyNotes.push(
+      `🧪 ${medicationName}: Enges therapeutisches Fenster (${category.therapeutic_min_ng_ml}-${category.therapeutic_max_ng_ml} ng/ml) + hohes Absetzrisiko (${category.withdrawal_risk_score}/10) - Reduktion wird vorsichtshalber zusätzlich um 20% verlangsamt.`
+    );
   }
   
   // ===== NEW P1 TASK #4: WITHDRAWAL RISK QUANTIFICATION =====
@@ -399,16 +445,12 @@ function applyCategorySafetyRules(params: {
   //
   // This runs AFTER Therapeutic Range adjustment but BEFORE final max_weekly_reduction_pct
   
-  let withdrawalRiskAdjustmentApplied = false;
-  let withdrawalRiskFactor = 1.0;
+  const withdrawalRiskFactor = precomputed?.withdrawal_factor ?? getWithdrawalFactor(category.withdrawal_risk_score);
+  const withdrawalRiskAdjustmentApplied = withdrawalRiskFactor < 1.0;
   
-  if (category.withdrawal_risk_score && category.withdrawal_risk_score > 0) {
-    // Calculate withdrawal factor based on risk score (score is 0-10)
-    withdrawalRiskFactor = 1 - (category.withdrawal_risk_score / 10 * 0.25);
-    
+  if (withdrawalRiskAdjustmentApplied) {
     // Apply withdrawal risk factor to reduction speed
     effectiveWeeklyReduction *= withdrawalRiskFactor;
-    withdrawalRiskAdjustmentApplied = true;
     limitedByCategory = true;
     
     const slowdownPct = Math.round((1 - withdrawalRiskFactor) * 100);
@@ -440,24 +482,8 @@ function applyCategorySafetyRules(params: {
   const baseReductionPct = 10; // Phase 1: Base (always 10%)
   const categoryLimit = maxWeeklyReductionPct; // Phase 2: Category Safety Limit
   
-  // Phase 3: Half-Life Factor (determined by steady state calculation)
-  let halfLifeFactor = 1.0;
-  if (category.half_life_hours && category.half_life_hours > 0) {
-    const steadyStateDays = (category.half_life_hours * 5) / 24;
-    if (steadyStateDays > 7) {
-      halfLifeFactor = 0.5;
-    } else if (steadyStateDays > 3) {
-      halfLifeFactor = 0.75;
-    }
-  }
-  
-  // Phase 4: CYP Factor (already calculated)
+  // Phases 3-6: Half-Life, CYP, Therapeutic Window and Withdrawal factors (already calculated)
   const cypFactor = cypAdjustmentFactor;
-  
-  // Phase 5: Therapeutic Window Factor
-  const therapeuticWindowFactor = therapeuticRangeAdjustmentApplied ? 0.8 : 1.0;
-  
-  // Phase 6: Withdrawal Factor (already calculated)
   const withdrawalFactor = withdrawalRiskFactor;
   
   // Phase 7: Multi-Drug Interaction Factor (will be calculated later in /api/analyze)
@@ -672,6 +698,118 @@ function calculatePlanCosts(weeklyPlan: any[]) {
   };
 }
 
+// ============================================================
+// MEDICATION LOOKUP: Alias resolution + shared SELECT
+// ============================================================
+
+// Medication row incl. category safety fields
+const MEDICATION_LOOKUP_COLUMNS = `m.*,
+  mc.name as category_name,
+  mc.risk_level,
+  mc.can_reduce_to_zero,
+  mc.default_min_target_fraction,
+  mc.max_weekly_reduction_pct,
+  mc.requires_specialist,
+  mc.notes as category_notes,
+  m.half_life_hours,
+  m.therapeutic_min_ng_ml,
+  m.therapeutic_max_ng_ml,
+  m.withdrawal_risk_score,
+  m.cbd_interaction_strength,
+  m.cyp3a4_substrate,
+  m.cyp3a4_inhibitor,
+  m.cyp3a4_inducer,
+  m.cyp2d6_substrate,
+  m.cyp2d6_inhibitor,
+  m.cyp2d6_inducer,
+  m.cyp2c9_substrate,
+  m.cyp2c9_inhibitor,
+  m.cyp2c9_inducer,
+  m.cyp2c19_substrate,
+  m.cyp2c19_inhibitor,
+  m.cyp2c19_inducer,
+  m.cyp1a2_substrate,
+  m.cyp1a2_inhibitor,
+  m.cyp1a2_inducer`;
+
+const MEDICATION_LOOKUP_JOINS = `
+  LEFT JOIN medication_categories mc ON m.category_id = mc.id`;
+
+// Precomputed reduction factors (migration 019 + medication_reduction_factors.sql)
+const REDUCTION_FACTOR_COLUMNS = `
+  rf.half_life_factor,
+  rf.cyp_factor,
+  rf.therapeutic_window_factor,
+  rf.withdrawal_factor,
+  rf.catalog_key`;
+
+const REDUCTION_FACTOR_JOINS = `
+  LEFT JOIN medication_reduction_factors rf ON rf.medication_id = m.id`;
+
+// Set when medication_aliases / medication_reduction_factors (or catalog_key)
+// do not exist yet (worker deployed before migrations 019/020): lookups then
+// use LIKE only and the factors are derived at runtime until the isolate is
+// recycled.
+let precomputedLookupTablesMissing = false;
+
+// Alias key of a user-entered name: lowercase, single-spaced, umlauts folded
+// (ä → ae, ß → ss), other diacritics stripped. Must match normalize_alias()
+// in scripts/build_medication_aliases.py, which generates medication_aliases.
+function normalizeMedicationAlias(name: string): string {
+  return name
+    .normalize('NFKC')
+    .toLowerCase()
+    .trim()
+    .replace(/\s+/g, ' ')
+    .replace(/ä/g, 'ae')
+    .replace(/ö/g, 'oe')
+    .replace(/ü/g, 'ue')
+    .replace(/ß/g, 'ss')
+    .normalize('NFKD')
+    .replace(/[\u0300-\u036f]/g, '');
+}
+
+// Resolve a user-entered name to a catalog row (null if unknown)
+async function lookupMedication(env: any, name: string): Promise<MedicationWithCategory | null> {
+  if (!precomputedLookupTablesMissing) {
+    try {
+      // Indexed equality lookup on medication_aliases (unique index on alias);
+      // the LIKE scan only runs for inputs without an alias (e.g. "Marcumar 5mg")
+      const byAlias = await env.DB.prepare(`
+        SELECT ${MEDICATION_LOOKUP_COLUMNS}, ${REDUCTION_FACTOR_COLUMNS}
+        FROM medication_aliases a
+        JOIN medications m ON m.id = a.medication_id
+        ${MEDICATION_LOOKUP_JOINS}
+        ${REDUCTION_FACTOR_JOINS}
+        WHERE a.alias = ?
+        LIMIT 1
+      `).bind(normalizeMedicationAlias(name)).first() as MedicationWithCategory | null;
+      if (byAlias) return byAlias;
+      
+      return await env.DB.prepare(`
+        SELECT ${MEDICATION_LOOKUP_COLUMNS}, ${REDUCTION_FACTOR_COLUMNS}
+        FROM medications m
+        ${MEDICATION_LOOKUP_JOINS}
+        ${REDUCTION_FACTOR_JOINS}
+        WHERE m.name LIKE ? OR m.generic_name LIKE ?
+        LIMIT 1
+      `).bind(`%${name}%`, `%${name}%`).first() as MedicationWithCategory | null;
+    } catch (error: any) {
+      if (!/no such (table|column)/i.test(String(error?.message))) throw error;
+      console.warn('Precomputed lookup tables missing or outdated (apply migrations 019/020):', error.message);
+      precomputedLookupTablesMissing = true;
+    }
+  }
+  
+  return await env.DB.prepare(`
+    SELECT ${MEDICATION_LOOKUP_COLUMNS}
+    FROM medications m
+    ${MEDICATION_LOOKUP_JOINS}
+    WHERE m.name LIKE ? OR m.generic_name LIKE ?
+    LIMIT 1
+  `).bind(`%${name}%`, `%${name}%`).first() as MedicationWithCategory | null;
+}
+
 // ============================================================
 // SHARED ANALYSIS FUNCTION: Single Source of Truth
 // ============================================================
@@ -782,40 +920,7 @@ async function buildAnalyzeResponse(body: any, env: any) {
   let maxSeverity = 'low';
   
   for (const med of medications) {
-    const medResult = await env.DB.prepare(`
-      SELECT m.*, 
-             mc.name as category_name,
-             mc.risk_level,
-             mc.can_reduce_to_zero,
-             mc.default_min_target_fraction,
-             mc.max_weekly_reduction_pct,
-             mc.requires_specialist,
-             mc.notes as category_notes,
-             m.half_life_hours,
-             m.therapeutic_min_ng_ml,
-             m.therapeutic_max_ng_ml,
-             m.withdrawal_risk_score,
-             m.cbd_interaction_strength,
-             m.cyp3a4_substrate,
-             m.cyp3a4_inhibitor,
-             m.cyp3a4_inducer,
-             m.cyp2d6_substrate,
-             m.cyp2d6_inhibitor,
-             m.cyp2d6_inducer,
-             m.cyp2c9_substrate,
-             m.cyp2c9_inhibitor,
-             m.cyp2c9_inducer,
-             m.cyp2c19_substrate,
-             m.cyp2c19_inhibitor,
-             m.cyp2c19_inducer,
-             m.cyp1a2_substrate,
-             m.cyp1a2_inhibitor,
-             m.cyp1a2_inducer
-      FROM medications m
-      LEFT JOIN medication_categories mc ON m.category_id = mc.id
-      WHERE m.name LIKE ? OR m.generic_name LIKE ?
-      LIMIT 1
-    `).bind(`%${med.name}%`, `%${med.name}%`).first() as MedicationWithCategory | null;
+    const medResult = await lookupMedication(env, med.name);
     
     if (medResult) {
       const interactions = await env.DB.prepare(`
@@ -1009,24 +1114,28 @@ async function buildAnalyzeResponse(body: any, env: any) {
   // Generate weekly plan with bottle tracking
   const cbdPlan = generateWeeklyPlanWithBottleTracking(cbdStartMg, cbdEndMg, durationWeeks);
   
+  // Safety rules depend only on the medication and the plan parameters, so
+  // they run once per medication and are shared by the weekly plan, the
+  // reduction speeds and the enriched analysis (previously once per week).
+  const safetyResults: SafetyResult[] = medications.map((med: any, index: number) => {
+    const medAnalysis = analysisResults[index];
+    return applyCategorySafetyRules({
+      startMg: med.mgPerDay,
+      reductionGoal,
+      durationWeeks,
+      medicationName: med.name,
+      category: medAnalysis?.medication as MedicationWithCategory | null,
+      cypProfiles: medAnalysis?.cypProfiles || [] // NEW: CYP profiles from DB
+    });
+  });
+  
   // Merge CBD tracking with medication reduction data
   const weeklyPlan = cbdPlan.map((cbdWeek: any) => {
     const week = cbdWeek.week;
     
     const weekMedications = medications.map((med: any, index: number) => {
       const startMg = med.mgPerDay;
-      const medAnalysis = analysisResults[index];
-      const medCategory = medAnalysis?.medication as MedicationWithCategory | null;
-      const cypProfiles = medAnalysis?.cypProfiles || []; // NEW: CYP profiles from DB
-      
-      const safetyResult = applyCategorySafetyRules({
-        startMg,
-        reductionGoal,
-        durationWeeks,
-        medicationName: med.name,
-        category: medCategory,
-        cypProfiles // NEW: Pass CYP profiles to safety function
-      });
+      const safetyResult = safetyResults[index];
       
       // ===== NEW P1 TASK #3: Apply MDI adjustment AFTER applyCategorySafetyRules =====
       // MDI adjustment is GLOBAL (affects all medications based on cumulative CYP burden)
@@ -1179,19 +1288,7 @@ async function buildAnalyzeResponse(body: any, env: any) {
     : 0;
   
   const reductionSpeeds = medications.map((med: any, index: number) => {
-    const medAnalysis = analysisResults[index];
-    const medCategory = medAnalysis?.medication as MedicationWithCategory | null;
-    const cypProfiles = medAnalysis?.cypProfiles || []; // NEW: CYP profiles from DB
-    
-    const safetyResult = applyCategorySafetyRules({
-      startMg: med.mgPerDay,
-      reductionGoal,
-      durationWeeks,
-      medicationName: med.name,
-      category: medCategory,
-      cypProfiles // NEW: Pass CYP profiles to safety function
-    });
-    
+    const safetyResult = safetyResults[index];
     const weeklyReduction = safetyResult.effectiveWeeklyReduction;
     return med.mgPerDay > 0 ? (weeklyReduction / med.mgPerDay) * 100 : 0;
   });
@@ -1258,18 +1355,9 @@ async function buildAnalyzeResponse(body: any, env: any) {
   // Calculate final weekly reduction percentage for each medication (AFTER all safety adjustments)
   const enrichedAnalysis = medications.map((med: any, index: number) => {
     const medAnalysis = analysisResults[index];
-    const medCategory = medAnalysis?.medication as MedicationWithCategory | null;
-    const cypProfiles = medAnalysis?.cypProfiles || [];
     
-    // Calculate safety-adjusted reduction (same logic as weekly plan)
-    const safetyResult = applyCategorySafetyRules({
-      startMg: med.mgPerDay,
-      reductionGoal,
-      durationWeeks,
-      medicationName: med.name,
-      category: medCategory,
-      cypProfiles
-    });
+    // Safety-adjusted reduction (same result as the weekly plan)
+    const safetyResult = safetyResults[index];
     
     // Apply MDI adjustment (global factor affecting all medications)
     let finalWeeklyReduction = safetyResult.effectiveWeeklyReduction * mdiAdjustmentFactor;